@@ -0,0 +1,118 @@
+"""Сравнение get_all(read_mode="orm") и get_all(read_mode="core") на aiosqlite
+
+Запуск:
+
+    python benchmarks/read_mode.py --rows 10000 100000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import String, Text, insert
+from sqlalchemy.orm import Mapped, mapped_column
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orm_core import Base, ClientDB, create_orm_manager  # noqa: E402
+
+
+class BenchItem(Base):
+    __tablename__ = "bench_items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+    email: Mapped[str] = mapped_column(String(100))
+    age: Mapped[int]
+    score: Mapped[float]
+    note: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+
+class BenchItemAdd(BaseModel):
+    name: str
+
+
+class BenchItemOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    email: str
+    age: int
+    score: float
+
+
+class BenchClientDB(ClientDB):
+    def __init__(self, async_url: str):
+        super().__init__(async_url)
+
+        self.item = create_orm_manager(
+            BenchItem, BenchItemAdd, BenchItemAdd, BenchItemOut)
+
+
+async def seed(db: BenchClientDB, rows: int) -> None:
+    await db.init_db()
+
+    async with db.session_factory() as session:
+        data = [
+            {
+                "id": i,
+                "name": f"name{i}",
+                "email": f"user{i}@example.com",
+                "age": i % 90,
+                "score": i / 7,
+                "note": "x" * 200,
+            }
+            for i in range(1, rows + 1)
+        ]
+        for start in range(0, rows, 10000):
+            await session.execute(insert(BenchItem), data[start:start + 10000])
+        await session.commit()
+
+
+async def measure(db: BenchClientDB, read_mode: str, repeat: int) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        async with db.session_factory() as session:
+            started = time.perf_counter()
+            items = await db.item.get_all(
+                session=session,
+                is_model=False,
+                is_pagination=False,
+                read_mode=read_mode,  # type: ignore
+            )
+            best = min(best, time.perf_counter() - started)
+            assert items
+
+    return best
+
+
+async def main(rows_list: list[int], repeat: int) -> None:
+    print(f"{'rows':>8} {'orm, s':>10} {'core, s':>10} {'speedup':>8}")
+
+    for rows in rows_list:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = BenchClientDB(f"sqlite+aiosqlite:///{tmp}/bench.db")
+            await seed(db, rows)
+
+            orm = await measure(db, "orm", repeat)
+            core = await measure(db, "core", repeat)
+
+            await db.engine.dispose()
+
+        print(f"{rows:>8} {orm:>10.3f} {core:>10.3f} {orm / core:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.repeat))
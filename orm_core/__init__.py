@@ -1,12 +1,32 @@
 from .core_db import ClientDB
-from .base_schemes import ListDTO, ResponseStatus
+from .base_schemes import BulkItemDTO, BulkLoadResult, BulkResultDTO, CountDTO, CursorListDTO, EditManyDTO, ListDTO, ResponseStatus
 from .base import Base
+from .cache import TTLCache
+from .basic_operations.model.coalescer import AddCoalescer
+from .basic_operations.model.loader import DataLoader
 from .orm_factory import create_orm_manager
+from .single_flight import SingleFlight
+from .search import IlikeSearch, PgFullTextSearch, PgTrigramSearch, SearchBackend, SqliteFtsSearch
 
 __all__ = [
     "ClientDB",
     "ListDTO",
+    "CursorListDTO",
+    "CountDTO",
+    "EditManyDTO",
+    "BulkItemDTO",
+    "BulkResultDTO",
+    "BulkLoadResult",
     "ResponseStatus",
     "Base",
-    "create_orm_manager"
+    "TTLCache",
+    "DataLoader",
+    "AddCoalescer",
+    "SingleFlight",
+    "create_orm_manager",
+    "SearchBackend",
+    "IlikeSearch",
+    "PgTrigramSearch",
+    "PgFullTextSearch",
+    "SqliteFtsSearch"
 ]
@@ -11,6 +11,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 
 from ..basic_operations.model import ManagerModel
+from ..cache import TTLCache
+from ..search import SearchBackend
+from ..single_flight import SingleFlight
 
 from .api_schemes import ManagerApiModelWithSchemes
 
@@ -38,13 +41,42 @@ class ManagerApiModel(
 
         search_fields: Optional[list[str]] = None,
 
-        return_get_all: Literal["pagination", "list"] = "pagination",
+        return_get_all: Literal["pagination", "list", "cursor"] = "pagination",
+
+        count_strategy: Literal["query", "window"] = "query",
+
+        count_mode: Literal["exact", "estimate", "capped"] = "exact",
+
+        count_cap: int = 1000,
+
+        read_mode: Literal["orm", "core"] = "orm",
+
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
+        bulk_routes: bool = False,
 
         prefix: Optional[str] = None,
 
         tags: Optional[list[Union[str, Enum]]] = None,
 
         dependencies: Optional[Sequence[params.Depends]] = None,
+
+        count_cache: Optional[TTLCache] = None,
+
+        search_backend: Optional[SearchBackend] = None,
+
+        statement_cache: Optional[TTLCache] = None,
+
+        batch_get_by: bool = False,
+
+        negative_cache: Optional[TTLCache] = None,
+
+        object_cache: Optional[TTLCache] = None,
+
+        single_flight: Optional[SingleFlight] = None,
+
+        single_flight_routes: Optional[list[Literal["get_all", "get_by"]]] = None,
+
     ) -> None:
         """Менеджер для работы со схемами, моделями и автогенерацией API, только используя модель
 
@@ -52,14 +84,33 @@ class ManagerApiModel(
             model (type[M]): Модель
             session_factory (async_sessionmaker[AsyncSession]): Фабрика сессий
             search_fields (Optional[list[str]], optional): Поля по которым можно осуществлять поиск. Defaults to None.
-            return_get_all (Literal["pagination", "list"], optional): Возвращать ли список или пагинацию. Defaults to "pagination".
+            return_get_all (Literal["pagination", "list", "cursor"], optional): Возвращать ли список, пагинацию или пагинацию по курсору. Defaults to "pagination".
+            count_strategy (Literal["query", "window"], optional): Подсчет total_record отдельным запросом или через count(*) OVER (). По умолчанию "query".
+            count_mode (Literal["exact", "estimate", "capped"], optional): Режим подсчета total_record: точный, оценка по статистике или не более count_cap строк. По умолчанию "exact".
+            count_cap (int, optional): Максимум считаемых строк для count_mode="capped". По умолчанию 1000.
+            read_mode (Literal["orm", "core"], optional): Чтение в GET-маршрутах через ORM или напрямую из строк (Core) без создания моделей. По умолчанию "orm".
+            write_mode (Literal["orm", "returning", "direct"], optional): Запись в POST и PATCH через ORM (flush и повторный SELECT), одним запросом INSERT/UPDATE ... RETURNING или ("direct", только PATCH) одним UPDATE с переданными полями и повторным чтением. По умолчанию "orm".
+            bulk_routes (bool, optional): Регистрировать маршруты POST, PATCH и DELETE /bulk для списков объектов (одна транзакция, пачки по BULK_CHUNK_SIZE строк). По умолчанию False.
             prefix (Optional[str], optional): Префикс для API. Defaults to None.
             tags (Optional[list[Union[str, Enum]]], optional): Теги для API. Defaults to None.
             dependencies (Optional[Sequence[params.Depends]], optional): Зависимости для API. Defaults to None.
+            count_cache (Optional[TTLCache], optional): Кэш total_record для get_all, сбрасывается при записи в таблицу. По умолчанию None.
+            search_backend (Optional[SearchBackend], optional): Стратегия поиска для get_all. По умолчанию None (ILIKE по подстроке).
+            statement_cache (Optional[TTLCache], optional): Кэш построенных запросов чтения get_all, get_by и exists по форме запроса (значения передаются параметрами); add, edit и delete строят запросы заново. По умолчанию None.
+            batch_get_by (bool, optional): Объединять get_by по первичному ключу, вызванные в одной сессии в одном проходе цикла событий, в один запрос get_many. По умолчанию False.
+            negative_cache (Optional[TTLCache], optional): Кэш ненайденных по первичному ключу объектов для get_by (ответ 404 без запроса к БД), запись удаляется при добавлении объекта с этим ключом. По умолчанию None.
+            object_cache (Optional[TTLCache], optional): Кэш ответов GET /{pk} (схемы вывода), сбрасывается при записи в таблицу модели и загружаемых связей. По умолчанию None.
+            single_flight (Optional[SingleFlight], optional): Объединение одинаковых одновременных чтений в GET-маршрутах в один запрос к БД. По умолчанию None.
+            single_flight_routes (Optional[list[Literal["get_all", "get_by"]]], optional): GET-маршруты, в которых чтения объединяются через single_flight. По умолчанию None (все).
         """
 
         super().__init__(
-            model=model
+            model=model,
+            count_cache=count_cache,
+            search_backend=search_backend,
+            statement_cache=statement_cache,
+            batch_get_by=batch_get_by,
+            negative_cache=negative_cache
         )
 
         self.add_scheme = create_model(
@@ -89,9 +140,23 @@ class ManagerApiModel(
             session_factory=session_factory,
             search_fields=search_fields,
             return_get_all=return_get_all,
+            count_strategy=count_strategy,
+            count_mode=count_mode,
+            count_cap=count_cap,
+            read_mode=read_mode,
+            write_mode=write_mode,
+            bulk_routes=bulk_routes,
             prefix=prefix,
             tags=tags,
-            dependencies=dependencies
+            dependencies=dependencies,
+            count_cache=count_cache,
+            search_backend=search_backend,
+            statement_cache=statement_cache,
+            batch_get_by=batch_get_by,
+            negative_cache=negative_cache,
+            object_cache=object_cache,
+            single_flight=single_flight,
+            single_flight_routes=single_flight_routes
         )
 
     async def get_db_session(self) -> AsyncGenerator[AsyncSession, None]:
@@ -118,9 +183,37 @@ class ManagerApiModel(
         return self.manager_api.search_fields
 
     @property
-    def return_get_all(self) -> Literal["pagination", "list"]:
+    def return_get_all(self) -> Literal["pagination", "list", "cursor"]:
         return self.manager_api.return_get_all
 
+    @property
+    def count_strategy(self) -> Literal["query", "window"]:
+        return self.manager_api.count_strategy
+
+    @property
+    def count_mode(self) -> Literal["exact", "estimate", "capped"]:
+        return self.manager_api.count_mode
+
+    @property
+    def count_cap(self) -> int:
+        return self.manager_api.count_cap
+
+    @property
+    def read_mode(self) -> Literal["orm", "core"]:
+        return self.manager_api.read_mode
+
+    @property
+    def write_mode(self) -> Literal["orm", "returning", "direct"]:
+        return self.manager_api.write_mode
+
+    @property
+    def bulk_routes(self) -> bool:
+        return self.manager_api.bulk_routes
+
+    @property
+    def single_flight_routes(self) -> Optional[list[Literal["get_all", "get_by"]]]:
+        return self.manager_api.single_flight_routes
+
     def get_fileds_for_add(self, columns: ReadOnlyColumnCollection[str, Column[Any]]) -> dict[str, Any]:
         fields: dict[str, Any] = {}
 
@@ -1,26 +1,77 @@
+from contextlib import AsyncExitStack
 from enum import Enum
 import inspect
+import anyio
 import logging
-from typing import Annotated, Any, Generic, Literal, Optional, Sequence, TypeVar, Union
-from fastapi import APIRouter, Depends, params
-from pydantic import BaseModel
+from typing import Annotated, Any, AsyncIterator, Awaitable, Callable, Generic, Literal, Optional, Sequence, TypeVar, Union
+from fastapi import APIRouter, Depends, HTTPException, params
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
+from pydantic import BaseModel, create_model
+from pydantic_core import to_json
+from sqlalchemy import delete, exc, select, tuple_
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .basic_api import BasicApi
-from ..base_schemes import ListDTO, ResponseStatus
+from ..cache import TTLCache
+from ..single_flight import SingleFlight
+from ..search import SearchBackend
+from ..base_schemes import BulkItemDTO, BulkResultDTO, CountDTO, CursorListDTO, ListDTO, ResponseStatus
 
 from ..basic_operations.model_with_schemes import ManagerModelSchemes
 
 
 _log = logging.getLogger(__name__)
 
+
+STREAM_BUFFER_SIZE = 64 * 1024
+
+BULK_CHUNK_SIZE = 1000
+
 M = TypeVar('M')
 A = TypeVar('A', bound=BaseModel, default=Any)
 E = TypeVar('E', bound=BaseModel, default=Any)
 O = TypeVar('O', bound=BaseModel, default=Any)
 
 
+def _parse_fields(fields: Optional[str]) -> Optional[list[str]]:
+    """Список полей из параметра запроса ?fields=a,b,c"""
+
+    if fields is None:
+        return None
+
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+
+def _json_response(content: Any) -> Response:
+    """JSON-ответ в обход response_model: схемы уже провалидированы менеджером,
+    а с ?fields= схема уже, чем out_scheme"""
+
+    return Response(
+        content=to_json(content, by_alias=True),
+        media_type="application/json"
+    )
+
+
+class _ClosingStreamingResponse(StreamingResponse):
+    """StreamingResponse, выполняющий background и при отключении клиента или ошибке отправки
+
+    StreamingResponse вызывает background только после успешной отправки тела,
+    а генератор тела, который не начали читать, не выполняет свой finally.
+    """
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        except BaseException:
+            if self.background is not None:
+                # Защита от отмены: при отключении клиента задача ответа уже отменяется
+                with anyio.CancelScope(shield=True):
+                    await self.background()
+            raise
+
+
 class ManagerApiModelWithSchemes(
     ManagerModelSchemes[M, A, E, O],
     BasicApi,
@@ -48,7 +99,19 @@ class ManagerApiModelWithSchemes(
 
         search_fields: Optional[list[str]] = None,
 
-        return_get_all: Literal["pagination", "list"] = "pagination",
+        return_get_all: Literal["pagination", "list", "cursor"] = "pagination",
+
+        count_strategy: Literal["query", "window"] = "query",
+
+        count_mode: Literal["exact", "estimate", "capped"] = "exact",
+
+        count_cap: int = 1000,
+
+        read_mode: Literal["orm", "core"] = "orm",
+
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
+        bulk_routes: bool = False,
 
         prefix: Optional[str] = None,
 
@@ -56,6 +119,22 @@ class ManagerApiModelWithSchemes(
 
         dependencies: Optional[Sequence[params.Depends]] = None,
 
+        count_cache: Optional[TTLCache] = None,
+
+        search_backend: Optional[SearchBackend] = None,
+
+        statement_cache: Optional[TTLCache] = None,
+
+        batch_get_by: bool = False,
+
+        negative_cache: Optional[TTLCache] = None,
+
+        object_cache: Optional[TTLCache] = None,
+
+        single_flight: Optional[SingleFlight] = None,
+
+        single_flight_routes: Optional[list[Literal["get_all", "get_by"]]] = None,
+
     ) -> None:
         """Менеджер для работы со схемами, моделями и автогенерацией API
 
@@ -66,10 +145,24 @@ class ManagerApiModelWithSchemes(
             out_scheme (type[O]): Схема вывода
             session_factory (async_sessionmaker[AsyncSession]): Фабрика сессии
             search_fields (Optional[list[str]], optional): Поля поиска. По умолчанию None.
-            return_get_all (Literal["pagination", "list"], optional): Возвращать пагинацию или список. По умолчанию "pagination".
+            return_get_all (Literal["pagination", "list", "cursor"], optional): Возвращать пагинацию, список или пагинацию по курсору. По умолчанию "pagination".
+            count_strategy (Literal["query", "window"], optional): Подсчет total_record отдельным запросом или через count(*) OVER (). По умолчанию "query".
+            count_mode (Literal["exact", "estimate", "capped"], optional): Режим подсчета total_record: точный, оценка по статистике или не более count_cap строк. По умолчанию "exact".
+            count_cap (int, optional): Максимум считаемых строк для count_mode="capped". По умолчанию 1000.
+            read_mode (Literal["orm", "core"], optional): Чтение в GET-маршрутах через ORM или напрямую из строк (Core) без создания моделей. По умолчанию "orm".
+            write_mode (Literal["orm", "returning", "direct"], optional): Запись в POST и PATCH через ORM (flush и повторный SELECT), одним запросом INSERT/UPDATE ... RETURNING или ("direct", только PATCH) одним UPDATE с переданными полями и повторным чтением. По умолчанию "orm".
+            bulk_routes (bool, optional): Регистрировать маршруты POST, PATCH и DELETE /bulk для списков объектов (одна транзакция, пачки по BULK_CHUNK_SIZE строк). По умолчанию False.
             prefix (Optional[str], optional): Свой префикс. По умолчанию None.
             tags (Optional[list[Union[str, Enum]]], optional): Свой список тегов. По умолчанию None.
             dependencies (Optional[Sequence[params.Depends]], optional): Зависимости. По умолчанию None.
+            count_cache (Optional[TTLCache], optional): Кэш total_record для get_all, сбрасывается при записи в таблицу. По умолчанию None.
+            search_backend (Optional[SearchBackend], optional): Стратегия поиска для get_all. По умолчанию None (ILIKE по подстроке).
+            statement_cache (Optional[TTLCache], optional): Кэш построенных запросов чтения get_all, get_by и exists по форме запроса (значения передаются параметрами); add, edit и delete строят запросы заново. По умолчанию None.
+            batch_get_by (bool, optional): Объединять get_by по первичному ключу, вызванные в одной сессии в одном проходе цикла событий, в один запрос get_many. По умолчанию False.
+            negative_cache (Optional[TTLCache], optional): Кэш ненайденных по первичному ключу объектов для get_by (ответ 404 без запроса к БД), запись удаляется при добавлении объекта с этим ключом. По умолчанию None.
+            object_cache (Optional[TTLCache], optional): Кэш результатов get_by по первичному ключу (схемы вывода), сбрасывается при записи в таблицу модели и загружаемых связей. По умолчанию None.
+            single_flight (Optional[SingleFlight], optional): Объединение одинаковых одновременных чтений схем (get_by и get_all с is_model=False) в один запрос к БД. По умолчанию None.
+            single_flight_routes (Optional[list[Literal["get_all", "get_by"]]], optional): GET-маршруты, в которых чтения объединяются через single_flight. По умолчанию None (все).
 
         """
 
@@ -77,9 +170,18 @@ class ManagerApiModelWithSchemes(
             model,
             add_scheme,
             edit_scheme,
-            out_scheme
+            out_scheme,
+            count_cache=count_cache,
+            search_backend=search_backend,
+            statement_cache=statement_cache,
+            batch_get_by=batch_get_by,
+            negative_cache=negative_cache,
+            object_cache=object_cache,
+            single_flight=single_flight
         )
 
+        self.single_flight_routes = single_flight_routes
+
         prefix = prefix if prefix else f"/{self.model.__name__.lower()}"
         tags = tags if tags else [self.model.__name__]
 
@@ -95,6 +197,12 @@ class ManagerApiModelWithSchemes(
             session_factory=session_factory,
             search_fields=search_fields,
             return_get_all=return_get_all,
+            count_strategy=count_strategy,
+            count_mode=count_mode,
+            count_cap=count_cap,
+            read_mode=read_mode,
+            write_mode=write_mode,
+            bulk_routes=bulk_routes,
             prefix=prefix,
             tags=tags,
             dependencies=dependencies
@@ -104,8 +212,15 @@ class ManagerApiModelWithSchemes(
 
     def __fill_router(self) -> None:
         self.__create_get_all()
+        self.__create_get_all_stream()
         self.__create_add()
+        # /count раньше /{pk}, иначе "count" попадет в первичный ключ
+        self.__create_count()
+        # /bulk раньше /{pk} по той же причине
+        if self.bulk_routes:
+            self.__create_bulk()
         self.__create_get_by()
+        self.__create_exists()
         self.__create_edit()
         self.__create_delete()
 
@@ -126,6 +241,7 @@ class ManagerApiModelWithSchemes(
     def __create_func_get_by(self):
         pks = self.pks
         type_cols = self.type_cols
+        is_single_flight = self.single_flight_routes is None or "get_by" in self.single_flight_routes
 
         params = [
             inspect.Parameter(
@@ -142,25 +258,114 @@ class ManagerApiModelWithSchemes(
             annotation=Annotated[AsyncSession, Depends(self.get_db_session)],
         ))
 
+        params.append(inspect.Parameter(
+            name="fields",
+            kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            annotation=Union[str, None],
+            default=None,
+        ))
+
         signature = inspect.Signature(params)
 
-        async def get_by(*args: Any, **kwargs: Any) -> O:
+        async def get_by(*args: Any, **kwargs: Any) -> Response:
             bound_args = signature.bind(*args, **kwargs)
             bound_args.apply_defaults()
 
             pk_values = {pk: bound_args.arguments[pk] for pk in pks}
 
             session = bound_args.arguments["session"]
-            return await self.get_by(
+            fields = _parse_fields(bound_args.arguments["fields"])
+
+            item = await self.get_by(
                 session=session,
                 is_model=False,
                 is_get_none=False,
+                fields=fields,
+                read_mode=self.read_mode,
+                is_single_flight=is_single_flight,
                 **pk_values
             )
 
+            return _json_response(item)
+
         get_by.__signature__ = signature  # type: ignore
         return get_by
 
+    def __create_exists(self):
+        path = ""
+        for pk in self.pks:
+            path += "/{" + pk + "}"
+
+        self.router.add_api_route(
+            path=path,
+            endpoint=self.__create_func_exists(),
+            methods=["HEAD"],
+            response_class=Response
+        )
+
+    def __create_func_exists(self):
+        pks = self.pks
+        type_cols = self.type_cols
+
+        params = [
+            inspect.Parameter(
+                name=pk,
+                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=type_cols[pk]
+            )
+            for pk in pks
+        ]
+
+        params.insert(0, inspect.Parameter(
+            name="session",
+            kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            annotation=Annotated[AsyncSession, Depends(self.get_db_session)],
+        ))
+
+        signature = inspect.Signature(params)
+
+        async def exists(*args: Any, **kwargs: Any) -> Response:
+            bound_args = signature.bind(*args, **kwargs)
+            bound_args.apply_defaults()
+
+            pk_values = {pk: bound_args.arguments[pk] for pk in pks}
+
+            session = bound_args.arguments["session"]
+
+            is_exists = await self.exists(
+                session=session,
+                **pk_values
+            )
+
+            return Response(status_code=200 if is_exists else 404)
+
+        exists.__signature__ = signature  # type: ignore
+        return exists
+
+    def __create_count(self):
+        self.router.add_api_route(
+            path="/count",
+            endpoint=self.__create_func_count(),
+            methods=["GET"],
+            response_model=CountDTO
+        )
+
+    def __create_func_count(self):
+
+        async def count(
+            session: Annotated[AsyncSession, Depends(self.get_db_session)],
+            search: Union[str, None] = None,
+        ) -> CountDTO:
+            total = await self.count(
+                session=session,
+                search=search,
+                search_fields=self.search_fields
+            )
+
+            return CountDTO(count=total)
+
+        return count
+
     def __create_add(self):
         self.router.add_api_route(
             path="",
@@ -197,14 +402,22 @@ class ManagerApiModelWithSchemes(
             return await self.add(
                 session=session,
                 data=data,
-                is_model=False
+                is_model=False,
+                write_mode="orm" if self.write_mode == "direct" else self.write_mode
             )
 
         add.__signature__ = signature  # type: ignore
         return add
 
     def __create_get_all(self):
-        if self.return_get_all == "pagination":
+        if self.return_get_all == "cursor":
+            self.router.add_api_route(
+                path="/all",
+                endpoint=self.__create_func_get_all_cursor(),
+                methods=["GET"],
+                response_model=CursorListDTO[self.out_scheme]
+            )
+        elif self.return_get_all == "pagination":
             self.router.add_api_route(
                 path="/all",
                 endpoint=self.__create_func_get_all(),
@@ -220,6 +433,7 @@ class ManagerApiModelWithSchemes(
             )
 
     def __create_func_get_all(self):
+        is_single_flight = self.single_flight_routes is None or "get_all" in self.single_flight_routes
 
         async def get_all(
             session: Annotated[AsyncSession, Depends(self.get_db_session)],
@@ -228,9 +442,31 @@ class ManagerApiModelWithSchemes(
             desc: int = 0,
             page: int = 1,
             limit: int = -1,
+            fields: Union[str, None] = None,
         ):
+            fields_list = _parse_fields(fields)
+
             if self.return_get_all == "pagination":
-                return await self.get_all(
+                data = await self.get_all(
+                    session=session,
+                    search=search,
+                    search_fields=self.search_fields,
+                    loads=self.loads,
+                    sort_by=sort_by,
+                    desc=desc,
+                    page=page,
+                    limit=limit,
+                    is_model=False,
+                    is_pagination=True,
+                    count_strategy=self.count_strategy,
+                    count_mode=self.count_mode,
+                    count_cap=self.count_cap,
+                    fields=fields_list,
+                    read_mode=self.read_mode,
+                    is_single_flight=is_single_flight
+                )
+            else:
+                data = await self.get_all(
                     session=session,
                     search=search,
                     search_fields=self.search_fields,
@@ -240,24 +476,450 @@ class ManagerApiModelWithSchemes(
                     page=page,
                     limit=limit,
                     is_model=False,
-                    is_pagination=True
+                    is_pagination=False,
+                    fields=fields_list,
+                    read_mode=self.read_mode,
+                    is_single_flight=is_single_flight
                 )
 
-            return await self.get_all(
+            return _json_response(data)
+
+        return get_all
+
+    def __create_func_get_all_cursor(self):
+
+        async def get_all(
+            session: Annotated[AsyncSession, Depends(self.get_db_session)],
+            cursor: Union[str, None] = None,
+            search: Union[str, None] = None,
+            sort_by: Union[str, None] = None,
+            desc: int = 0,
+            limit: int = -1,
+            fields: Union[str, None] = None,
+        ):
+            fields_list = _parse_fields(fields)
+
+            data = await self.get_all_cursor(
                 session=session,
+                cursor=cursor,
                 search=search,
                 search_fields=self.search_fields,
                 loads=self.loads,
                 sort_by=sort_by,
                 desc=desc,
-                page=page,
                 limit=limit,
                 is_model=False,
-                is_pagination=False
+                fields=fields_list
             )
 
+            return _json_response(data)
+
         return get_all
 
+    def __create_get_all_stream(self):
+        self.router.add_api_route(
+            path="/all/stream",
+            endpoint=self.__create_func_get_all_stream(),
+            methods=["GET"],
+            response_class=StreamingResponse,
+            responses={
+                200: {
+                    "content": {
+                        "application/x-ndjson": {},
+                        "application/json": {},
+                    },
+                    "description": "Объекты по одному в строке (ndjson) или JSON-массив (json)",
+                }
+            }
+        )
+
+    def __create_func_get_all_stream(self):
+
+        async def get_all_stream(
+            search: Union[str, None] = None,
+            sort_by: Union[str, None] = None,
+            desc: int = 0,
+            format: Literal["ndjson", "json"] = "ndjson",
+            fields: Union[str, None] = None,
+        ):
+            stack = AsyncExitStack()
+            session = await stack.enter_async_context(self.get_stream_session())
+
+            items = self.stream_all(
+                session=session,
+                search=search,
+                search_fields=self.search_fields,
+                loads=self.loads,
+                sort_by=sort_by,
+                desc=desc,
+                is_model=False,
+                fields=_parse_fields(fields)
+            )
+
+            is_closed = False
+
+            async def close() -> None:
+                # Вызывается из тела ответа и из background: что выполнится раньше
+                nonlocal is_closed
+                if is_closed:
+                    return
+                is_closed = True
+
+                try:
+                    await items.aclose()
+                finally:
+                    await stack.aclose()
+
+            # Первая строка читается до ответа, чтобы ошибки параметров вернулись как HTTP-ошибки
+            try:
+                first = await anext(items, None)
+            except BaseException:
+                await close()
+                raise
+
+            async def content() -> AsyncIterator[bytes]:
+                is_json = format == "json"
+                buffer = bytearray(b"[" if is_json else b"")
+
+                try:
+                    if first is not None:
+                        buffer += first.model_dump_json().encode()
+
+                        async for item in items:
+                            buffer += b"," if is_json else b"\n"
+                            buffer += item.model_dump_json().encode()
+
+                            # Отдаем порциями: send ждет клиента, поэтому чтение из БД не убегает вперед
+                            if len(buffer) >= STREAM_BUFFER_SIZE:
+                                yield bytes(buffer)
+                                buffer.clear()
+
+                        if not is_json:
+                            buffer += b"\n"
+
+                    if is_json:
+                        buffer += b"]"
+
+                    if buffer:
+                        yield bytes(buffer)
+                finally:
+                    await close()
+
+            # Сессия и курсор закрываются и тогда, когда тело ответа не начали читать (клиент отключился)
+            return _ClosingStreamingResponse(
+                content(),
+                media_type="application/json" if format == "json" else "application/x-ndjson",
+                background=BackgroundTask(close)
+            )
+
+        return get_all_stream
+
+    def __create_bulk(self):
+        self.router.add_api_route(
+            path="/bulk",
+            endpoint=self.__create_func_add_bulk(),
+            methods=["POST"],
+            response_model=BulkResultDTO[self.out_scheme]
+        )
+        self.router.add_api_route(
+            path="/bulk",
+            endpoint=self.__create_func_edit_bulk(),
+            methods=["PATCH"],
+            response_model=BulkResultDTO[self.out_scheme]
+        )
+        self.router.add_api_route(
+            path="/bulk",
+            endpoint=self.__create_func_delete_bulk(),
+            methods=["DELETE"],
+            response_model=BulkResultDTO[dict[str, Any]]
+        )
+
+    async def __run_bulk(
+        self,
+        session: AsyncSession,
+        items: Sequence[Any],
+        execute_chunk: Callable[[Sequence[Any]], Awaitable[list[Any]]],
+        execute_item: Callable[[Any], Awaitable[Any]]
+    ) -> BulkResultDTO[Any]:
+        """Выполнение списка пачками по BULK_CHUNK_SIZE, каждая пачка в своей точке сохранения
+
+        Если многострочный запрос пачки завершился ошибкой, пачка выполняется заново
+        по одному элементу: ошибка остается у своего элемента, остальные записываются.
+
+        Args:
+            session (AsyncSession): Сессия
+            items (Sequence[Any]): Элементы запроса
+            execute_chunk (Callable): Выполнение пачки, результат или HTTPException по каждому элементу
+            execute_item (Callable): Выполнение одного элемента
+
+        Returns:
+            BulkResultDTO[Any]: Результат или ошибка по каждому элементу в порядке items
+        """
+
+        results: list[Any] = []
+
+        for start in range(0, len(items), BULK_CHUNK_SIZE):
+            chunk = items[start:start + BULK_CHUNK_SIZE]
+
+            try:
+                async with session.begin_nested():
+                    chunk_results = await execute_chunk(chunk)
+                results.extend(chunk_results)
+                continue
+            except (HTTPException, exc.SQLAlchemyError) as error:
+                _log.debug("Bulk chunk %s failed, retry by item: %s",
+                           self.model.__name__, error)
+
+            for item in chunk:
+                try:
+                    async with session.begin_nested():
+                        result = await execute_item(item)
+                    results.append(result)
+                except (HTTPException, exc.SQLAlchemyError) as error:
+                    results.append(error)
+
+        bulk_items: list[BulkItemDTO[Any]] = []
+        for index, result in enumerate(results):
+            if isinstance(result, HTTPException):
+                bulk_items.append(BulkItemDTO(
+                    index=index, status_code=result.status_code, detail=str(result.detail)))
+            elif isinstance(result, exc.IntegrityError):
+                bulk_items.append(BulkItemDTO(
+                    index=index, status_code=400, detail="Ошибка IntegrityError"))
+            elif isinstance(result, exc.SQLAlchemyError):
+                bulk_items.append(BulkItemDTO(
+                    index=index, status_code=500, detail="Ошибка SQLAlchemyError"))
+            else:
+                bulk_items.append(BulkItemDTO(index=index, item=result))
+
+        failed = sum(1 for item in bulk_items if item.status_code != 200)
+
+        return BulkResultDTO(
+            succeeded=len(bulk_items) - failed,
+            failed=failed,
+            items=bulk_items
+        )
+
+    def __create_func_add_bulk(self):
+        params = [
+            inspect.Parameter(
+                name="session",
+                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=Annotated[AsyncSession,
+                                     Depends(self.get_db_session)],
+            ),
+            inspect.Parameter(
+                name="items",
+                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=list[self.add_scheme],
+            ),
+        ]
+
+        signature = inspect.Signature(params)
+
+        async def add_bulk(*args: Any, **kwargs: Any) -> BulkResultDTO[Any]:
+            bound_args = signature.bind(*args, **kwargs)
+            bound_args.apply_defaults()
+
+            session = bound_args.arguments["session"]
+            items = bound_args.arguments["items"]
+
+            async def execute_chunk(chunk: Sequence[Any]) -> list[Any]:
+                return await self.add_many(
+                    session=session,
+                    data=chunk,
+                    is_model=False,
+                    chunk_size=len(chunk)
+                )
+
+            async def execute_item(item: Any) -> Any:
+                return await self.add(
+                    session=session,
+                    data=item,
+                    is_model=False,
+                    write_mode="orm" if self.write_mode == "direct" else self.write_mode
+                )
+
+            return await self.__run_bulk(
+                session=session,
+                items=items,
+                execute_chunk=execute_chunk,
+                execute_item=execute_item
+            )
+
+        add_bulk.__signature__ = signature  # type: ignore
+        return add_bulk
+
+    def __create_func_edit_bulk(self):
+        pks = self.pks
+        type_cols = self.type_cols
+
+        edit_bulk_scheme = create_model(
+            f"{self.model.__name__}BulkEdit",
+            **{pk: (type_cols[pk], ...) for pk in pks},  # type: ignore
+            changes=(self.edit_scheme, ...)
+        )
+
+        params = [
+            inspect.Parameter(
+                name="session",
+                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=Annotated[AsyncSession,
+                                     Depends(self.get_db_session)],
+            ),
+            inspect.Parameter(
+                name="items",
+                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=list[edit_bulk_scheme],
+            ),
+        ]
+
+        signature = inspect.Signature(params)
+
+        async def edit_bulk(*args: Any, **kwargs: Any) -> BulkResultDTO[Any]:
+            bound_args = signature.bind(*args, **kwargs)
+            bound_args.apply_defaults()
+
+            session = bound_args.arguments["session"]
+            items = bound_args.arguments["items"]
+
+            async def execute_chunk(chunk: Sequence[Any]) -> list[Any]:
+                edit_items: list[dict[str, Any]] = []
+                for item in chunk:
+                    changes = {
+                        key: value
+                        for key, value in item.changes.model_dump(exclude_unset=True).items()
+                        if value is not None or self.write_mode == "direct"
+                    }
+                    edit_items.append({
+                        **{pk: getattr(item, pk) for pk in pks},
+                        "changes": changes
+                    })
+
+                result = await self.edit_many(
+                    session=session,
+                    items=edit_items,
+                    is_return=True,
+                    is_model=False,
+                    chunk_size=len(chunk)
+                )
+
+                return [
+                    model if model is not None else HTTPException(
+                        status_code=404, detail=f"{self.model.__name__} not found")
+                    for model in result.content or []
+                ]
+
+            async def execute_item(item: Any) -> Any:
+                return await self.edit(
+                    session=session,
+                    edit_item=item.changes.model_dump(exclude_unset=True),
+                    loads=None,
+                    is_return=True,
+                    return_query=None,
+                    is_get_none=False,
+                    is_model=False,
+                    write_mode=self.write_mode,
+                    **{pk: getattr(item, pk) for pk in pks}
+                )
+
+            return await self.__run_bulk(
+                session=session,
+                items=items,
+                execute_chunk=execute_chunk,
+                execute_item=execute_item
+            )
+
+        edit_bulk.__signature__ = signature  # type: ignore
+        return edit_bulk
+
+    def __create_func_delete_bulk(self):
+        pks = self.pks
+        type_cols = self.type_cols
+
+        # Список значений ключа, для составного ключа - список объектов с полями ключа
+        if len(pks) == 1:
+            items_annotation: Any = list[type_cols[pks[0]]]
+        else:
+            delete_bulk_scheme = create_model(
+                f"{self.model.__name__}BulkDeleteKey",
+                **{pk: (type_cols[pk], ...) for pk in pks}  # type: ignore
+            )
+            items_annotation = list[delete_bulk_scheme]
+
+        def get_identity(item: Any) -> dict[str, Any]:
+            if len(pks) == 1:
+                return {pks[0]: item}
+            return {pk: getattr(item, pk) for pk in pks}
+
+        params = [
+            inspect.Parameter(
+                name="session",
+                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=Annotated[AsyncSession,
+                                     Depends(self.get_db_session)],
+            ),
+            inspect.Parameter(
+                name="items",
+                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=items_annotation,
+            ),
+        ]
+
+        signature = inspect.Signature(params)
+
+        async def delete_bulk(*args: Any, **kwargs: Any) -> BulkResultDTO[Any]:
+            bound_args = signature.bind(*args, **kwargs)
+            bound_args.apply_defaults()
+
+            session = bound_args.arguments["session"]
+            items = bound_args.arguments["items"]
+
+            async def execute_chunk(chunk: Sequence[Any]) -> list[Any]:
+                identities = [get_identity(item) for item in chunk]
+                columns = [getattr(self.model, pk) for pk in pks]
+
+                if len(pks) == 1:
+                    condition = columns[0].in_(
+                        [identity[pks[0]] for identity in identities])
+                else:
+                    condition = tuple_(*columns).in_(
+                        [tuple(identity.values()) for identity in identities])
+
+                stmt = delete(self.model).where(condition)
+
+                if session.get_bind().dialect.delete_returning:
+                    r = await session.execute(stmt.returning(*columns))
+                    deleted = {tuple(row) for row in r}
+                else:
+                    r = await session.execute(select(*columns).where(condition))
+                    deleted = {tuple(row) for row in r}
+                    await session.execute(stmt)
+
+                return [
+                    identity if tuple(identity.values()) in deleted else HTTPException(
+                        status_code=404, detail=f"{self.model.__name__} not found")
+                    for identity in identities
+                ]
+
+            async def execute_item(item: Any) -> Any:
+                identity = get_identity(item)
+                await self.delete(
+                    session=session,
+                    **identity
+                )
+                return identity
+
+            return await self.__run_bulk(
+                session=session,
+                items=items,
+                execute_chunk=execute_chunk,
+                execute_item=execute_item
+            )
+
+        delete_bulk.__signature__ = signature  # type: ignore
+        return delete_bulk
+
     def __create_edit(self):
         output = self.out_scheme
 
@@ -310,12 +972,13 @@ class ManagerApiModelWithSchemes(
             edit_item = bound_args.arguments["edit_item"]
             return await self.edit(
                 session=session,
-                edit_item=edit_item.model_dump(),
+                edit_item=edit_item.model_dump(exclude_unset=True),
                 loads=None,
                 is_return=True,
                 return_query=None,
                 is_get_none=False,
                 is_model=False,
+                write_mode=self.write_mode,
                 **pk_values
             )
 
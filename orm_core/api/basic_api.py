@@ -1,6 +1,7 @@
+from contextlib import asynccontextmanager
 from enum import Enum
 import logging
-from typing import Any, AsyncGenerator, Literal, Optional, Sequence, Union
+from typing import Any, AsyncGenerator, AsyncIterator, Literal, Optional, Sequence, Union
 from fastapi import APIRouter, HTTPException, params
 from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import async_sessionmaker
@@ -20,7 +21,19 @@ class BasicApi:
 
         search_fields: Optional[list[str]] = None,
 
-        return_get_all: Literal["pagination", "list"] = "pagination",
+        return_get_all: Literal["pagination", "list", "cursor"] = "pagination",
+
+        count_strategy: Literal["query", "window"] = "query",
+
+        count_mode: Literal["exact", "estimate", "capped"] = "exact",
+
+        count_cap: int = 1000,
+
+        read_mode: Literal["orm", "core"] = "orm",
+
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
+        bulk_routes: bool = False,
 
         prefix: Optional[str] = None,
 
@@ -33,7 +46,13 @@ class BasicApi:
         self.router = router
         self.__session_factory = session_factory
         self.search_fields = search_fields
-        self.return_get_all: Literal["pagination", "list"] = return_get_all
+        self.return_get_all: Literal["pagination", "list", "cursor"] = return_get_all
+        self.count_strategy: Literal["query", "window"] = count_strategy
+        self.count_mode: Literal["exact", "estimate", "capped"] = count_mode
+        self.count_cap: int = count_cap
+        self.read_mode: Literal["orm", "core"] = read_mode
+        self.write_mode: Literal["orm", "returning", "direct"] = write_mode
+        self.bulk_routes: bool = bulk_routes
         self.prefix = prefix
         self.tags = tags
         self.dependencies = dependencies
@@ -66,6 +85,16 @@ class BasicApi:
             finally:
                 await session.close()
 
+    @asynccontextmanager
+    async def get_stream_session(self) -> AsyncIterator[AsyncSession]:
+        """Сессия только для чтения для потоковых ответов
+
+        В отличие от get_db_session живет, пока отдается тело ответа,
+        а не до выхода из обработчика.
+        """
+        async with self.__session_factory() as session:
+            yield session
+
     def model_to_dict(self, model: Any) -> dict[str, Any]:
         data = {column.name: getattr(model, column.name)
                 for column in model.__table__.columns}
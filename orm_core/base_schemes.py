@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 
-from typing import Generic, TypeVar
+from typing import Generic, Literal, Optional, TypeVar
 
 T = TypeVar('T')
 
@@ -10,11 +10,51 @@ class ListDTO(BaseModel, Generic[T]):
     page_size: int
     total_pages: int
     total_record: int
+    is_total_approximate: bool = False
     content: list[T]
 
     class Config:
         from_attributes = True
 
 
+class CursorListDTO(BaseModel, Generic[T]):
+    page_size: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    content: list[T]
+
+    class Config:
+        from_attributes = True
+
+
+class CountDTO(BaseModel):
+    count: int
+
+
+class EditManyDTO(BaseModel, Generic[T]):
+    rowcount: int
+    content: Optional[list[Optional[T]]] = None
+
+
+class BulkItemDTO(BaseModel, Generic[T]):
+    index: int
+    status_code: int = 200
+    item: Optional[T] = None
+    detail: Optional[str] = None
+
+
+class BulkResultDTO(BaseModel, Generic[T]):
+    succeeded: int
+    failed: int
+    items: list[BulkItemDTO[T]]
+
+
+class BulkLoadResult(BaseModel):
+    rows: int
+    seconds: float
+    rows_per_second: float
+    method: Literal["copy", "executemany"]
+
+
 class ResponseStatus(BaseModel):
     status: str = "success"
@@ -1,13 +1,18 @@
 import logging
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Optional, TypeVar
 from sqlalchemy import ForeignKey, Column
 from sqlalchemy.orm import class_mapper
 
+from ...cache import TTLCache, register_identity_cache, register_table_cache
+from ...search import SearchBackend
+
 from .add import BasicModelAddOperations
 from .get_all import BasicModelGetAllOperations
 from .get_by import BasicModelGetByOperations
 from .edit import BasicModelEditOperations
 from .delete import BasicModelDeleteOperations
+from .bulk import BasicModelBulkOperations
+from .upsert import BasicModelUpsertOperations
 
 
 _log = logging.getLogger(__name__)
@@ -17,12 +22,15 @@ M = TypeVar('M')
 
 
 # class BasicModelGetByOperations наследуется из BasicModelEditOperations
+# class BasicModelUpsertOperations наследуется из BasicModelAddOperations
 class ManagerModel(
+    BasicModelUpsertOperations[M],
     BasicModelAddOperations[M],
     BasicModelGetAllOperations[M],
     BasicModelGetByOperations[M],
     BasicModelEditOperations[M],
     BasicModelDeleteOperations[M],
+    BasicModelBulkOperations[M],
     Generic[M]
 ):
     """
@@ -34,14 +42,29 @@ class ManagerModel(
         BasicModelEditOperations (_type_): Работа с редактированием и получением по id и полям
         BasicModelDeleteOperations (_type_): Работа с удалением
         BasicModelGetByOperations (_type_): Работа с получением по полям
+        BasicModelBulkOperations (_type_): Массовая загрузка строк
+        BasicModelUpsertOperations (_type_): Создание или обновление (ON CONFLICT)
         Generic (_type_): _type_
     """
 
-    def __init__(self, model: type[M]) -> None:
+    def __init__(
+        self,
+        model: type[M],
+        count_cache: Optional[TTLCache] = None,
+        search_backend: Optional[SearchBackend] = None,
+        statement_cache: Optional[TTLCache] = None,
+        batch_get_by: bool = False,
+        negative_cache: Optional[TTLCache] = None
+    ) -> None:
         """Менеджер для работы с моделями
 
         Args:
             model (type[M]): Модель
+            count_cache (Optional[TTLCache], optional): Кэш total_record для get_all, сбрасывается при записи в таблицу. По умолчанию None.
+            search_backend (Optional[SearchBackend], optional): Стратегия поиска для get_all. По умолчанию None (ILIKE по подстроке).
+            statement_cache (Optional[TTLCache], optional): Кэш построенных запросов чтения get_all, get_by и exists по форме запроса (значения передаются параметрами); add, edit и delete строят запросы заново. По умолчанию None.
+            batch_get_by (bool, optional): Объединять get_by по первичному ключу, вызванные в одной сессии в одном проходе цикла событий, в один запрос get_many. По умолчанию False.
+            negative_cache (Optional[TTLCache], optional): Кэш ненайденных по первичному ключу объектов для get_by (ответ 404 без запроса к БД), запись удаляется при добавлении объекта с этим ключом. По умолчанию None.
         """
         self.model = model
 
@@ -55,6 +78,21 @@ class ManagerModel(
 
         mapper = class_mapper(self.model)
         self.mapper = mapper
+
+        self.count_cache = count_cache
+        if count_cache is not None:
+            register_table_cache(mapper.tables, count_cache)
+
+        if search_backend is not None:
+            self.search_backend = search_backend
+
+        self.statement_cache = statement_cache
+        self.batch_get_by = batch_get_by
+
+        self.negative_cache = negative_cache
+        if negative_cache is not None:
+            register_identity_cache(mapper.tables, negative_cache)
+
         self.attrs_rel: dict[str, str] = {}
 
         self.type_cols: dict[str, Any] = {}
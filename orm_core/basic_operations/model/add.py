@@ -1,9 +1,12 @@
 import logging
-from typing import Any, Literal, Optional, TypeVar, Generic, Union, overload
-from sqlalchemy import Select, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Callable, Literal, Optional, Sequence, TypeVar, Generic, Union, overload
+from sqlalchemy import Select, exc, inspect, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import selectinload, joinedload
 
+from .coalescer import ADD_COALESCER_BATCH_SIZE, ADD_COALESCER_DELAY, AddCoalescer
+from .identity import BasicModelIdentityOperations
+
 
 _log = logging.getLogger(__name__)
 
@@ -11,7 +14,13 @@ _log = logging.getLogger(__name__)
 M = TypeVar('M')
 
 
-class BasicModelAddOperations(Generic[M]):
+ADD_MANY_CHUNK_SIZE = 1000
+
+
+class BasicModelAddOperations(
+        BasicModelIdentityOperations[M],
+        Generic[M]
+):
 
     model: type[M]
     pks: list[str]
@@ -21,7 +30,8 @@ class BasicModelAddOperations(Generic[M]):
         self,
         *,
         session: AsyncSession,
-        data: Union[M, dict[str, Any]]
+        data: Union[M, dict[str, Any]],
+        write_mode: Literal["orm", "returning"] = "orm"
     ) -> M:
         ...
 
@@ -31,7 +41,8 @@ class BasicModelAddOperations(Generic[M]):
         *,
         session: AsyncSession,
         data: Union[M, dict[str, Any]],
-        loads: dict[str, str]
+        loads: dict[str, str],
+        write_mode: Literal["orm", "returning"] = "orm"
     ) -> M:
         ...
 
@@ -41,7 +52,8 @@ class BasicModelAddOperations(Generic[M]):
         *,
         session: AsyncSession,
         data: Union[M, dict[str, Any]],
-        return_query: Select[Any]
+        return_query: Select[Any],
+        write_mode: Literal["orm", "returning"] = "orm"
     ) -> M:
         ...
 
@@ -51,7 +63,8 @@ class BasicModelAddOperations(Generic[M]):
         *,
         session: AsyncSession,
         data: Union[M, dict[str, Any]],
-        is_return: Literal[False] = False
+        is_return: Literal[False] = False,
+        write_mode: Literal["orm", "returning"] = "orm"
     ) -> None:
         ...
 
@@ -63,7 +76,8 @@ class BasicModelAddOperations(Generic[M]):
         data: Union[M, dict[str, Any]],
         is_return: bool = True,
         loads: Optional[dict[str, str]] = None,
-        return_query: Optional[Select[Any]] = None
+        return_query: Optional[Select[Any]] = None,
+        write_mode: Literal["orm", "returning"] = "orm"
     ) -> Optional[M]:
         ...
 
@@ -78,7 +92,9 @@ class BasicModelAddOperations(Generic[M]):
 
         loads: Optional[dict[str, str]] = None,
 
-        return_query: Optional[Select[Any]] = None
+        return_query: Optional[Select[Any]] = None,
+
+        write_mode: Literal["orm", "returning"] = "orm"
 
     ) -> Optional[M]:
         """Создание объекта в базе
@@ -89,6 +105,8 @@ class BasicModelAddOperations(Generic[M]):
             is_return (bool, optional): Возвращать ли объект после создания. По умолчанию возвращается.
             loads (Optional[dict[str, str]], optional): Список полей для дополнительной загрузки. По умолчанию не загружается.
             return_query (Optional[Select], optional): Запрос для возврата объекта. (Какие-то дополнительные условия).
+            write_mode (Literal["orm", "returning"], optional): "returning" - один запрос INSERT ... RETURNING вместо
+                flush и повторного SELECT (Postgres, SQLite >= 3.35), связи загружаются только по loads. По умолчанию "orm".
 
         Raises:
             HTTPException: 500 - ошибка в базе при добавлении
@@ -124,6 +142,20 @@ class BasicModelAddOperations(Generic[M]):
 
         _log.debug("Add model %s", self.model.__name__)
 
+        if write_mode == "returning" and return_query is None:
+            values = [self._get_insert_values(data)]
+
+            if not is_return:
+                await session.execute(insert(self.model), values)
+                return None
+
+            models = await self._insert_returning(
+                session=session,
+                values=values,
+                loads=loads
+            )
+            return models[0]
+
         if isinstance(data, dict):
             model: M = self.model(**data)
         else:
@@ -164,3 +196,211 @@ class BasicModelAddOperations(Generic[M]):
         return_model = r.scalars().first()
 
         return return_model
+
+    @overload
+    async def add_many(
+        self,
+        *,
+        session: AsyncSession,
+        data: Sequence[Union[M, dict[str, Any]]],
+        loads: Optional[dict[str, str]] = None,
+        chunk_size: int = ADD_MANY_CHUNK_SIZE
+    ) -> list[M]:
+        ...
+
+    @overload
+    async def add_many(
+        self,
+        *,
+        session: AsyncSession,
+        data: Sequence[Union[M, dict[str, Any]]],
+        is_return: Literal[False],
+        chunk_size: int = ADD_MANY_CHUNK_SIZE
+    ) -> None:
+        ...
+
+    async def add_many(
+        self,
+
+        session: AsyncSession,
+
+        data: Sequence[Union[M, dict[str, Any]]],
+
+        is_return: bool = True,
+
+        loads: Optional[dict[str, str]] = None,
+
+        chunk_size: int = ADD_MANY_CHUNK_SIZE
+
+    ) -> Optional[list[M]]:
+        """Создание объектов многострочным INSERT (insertmanyvalues) по chunk_size строк
+
+        Объекты создаются из INSERT ... RETURNING, без отдельного SELECT по каждому объекту.
+        Объекты модели из data в сессию не добавляются: вставляются значения их колонок.
+
+        Args:
+            session (AsyncSession): Сессия
+            data (Sequence[Union[M, dict[str, Any]]]): Объекты или словари значений колонок
+            is_return (bool, optional): Возвращать ли объекты после создания. По умолчанию возвращаются.
+            loads (Optional[dict[str, str]], optional): Список полей для дополнительной загрузки (один запрос IN на chunk). По умолчанию не загружается.
+            chunk_size (int, optional): Количество строк в одном INSERT. По умолчанию ADD_MANY_CHUNK_SIZE.
+
+        Returns:
+            Optional[list[M]]: Объекты в порядке data
+
+
+        Example:
+
+            users = await db_client.user.add_many(
+                session=session,
+                data=[{"name": "user1"}, {"name": "user2"}],
+                chunk_size=500
+            )
+        """
+
+        _log.debug("Add many model %s", self.model.__name__)
+
+        values = [self._get_insert_values(item) for item in data]
+
+        if not values:
+            return [] if is_return else None
+
+        if not is_return:
+            for start in range(0, len(values), chunk_size):
+                await session.execute(
+                    insert(self.model),
+                    values[start:start + chunk_size]
+                )
+            return None
+
+        models: list[M] = []
+        for start in range(0, len(values), chunk_size):
+            models.extend(await self._insert_returning(
+                session=session,
+                values=values[start:start + chunk_size],
+                loads=loads
+            ))
+
+        return models
+
+    def get_add_coalescer(
+        self,
+
+        session_factory: async_sessionmaker[AsyncSession],
+
+        max_batch_size: int = ADD_COALESCER_BATCH_SIZE,
+
+        max_delay: float = ADD_COALESCER_DELAY,
+
+        loads: Optional[dict[str, str]] = None,
+
+    ) -> AddCoalescer[M]:
+        """Объединение одновременных add из независимых запросов в многострочные INSERT
+
+        Пачка записывается через add_many в своей сессии и транзакции с commit.
+        Если пачка не записалась (например, нарушение уникальности в одной строке),
+        строки записываются по одной в точках сохранения: ошибку получает только ее вызывающий.
+        Возвращаемые объекты отсоединены от сессии, связи загружены только по loads.
+
+        Args:
+            session_factory (async_sessionmaker[AsyncSession]): Фабрика сессий для записи пачек
+            max_batch_size (int, optional): Максимум строк в пачке. По умолчанию ADD_COALESCER_BATCH_SIZE.
+            max_delay (float, optional): Максимальное ожидание пачки в секундах. По умолчанию ADD_COALESCER_DELAY.
+            loads (Optional[dict[str, str]], optional): Список полей для дополнительной загрузки. По умолчанию не загружается.
+
+        Returns:
+            AddCoalescer[M]: Объединитель вызовов, создается один раз на приложение
+
+
+        Example:
+
+            coalescer = db_client.user.get_add_coalescer(db_client.session_factory)
+            user = await coalescer.add({"name": "user"})
+        """
+
+        async def write_many(data: list[Any]) -> list[Any]:
+            return await self._write_coalesced(
+                session_factory=session_factory,
+                data=data,
+                loads=loads
+            )
+
+        return AddCoalescer(
+            write_many,
+            max_batch_size=max_batch_size,
+            max_delay=max_delay
+        )
+
+    async def _write_coalesced(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        data: list[Any],
+        loads: Optional[dict[str, str]] = None,
+        convert: Optional[Callable[[list[M]], list[Any]]] = None
+    ) -> list[Any]:
+        """Запись пачки в одной транзакции: многострочный INSERT, при ошибке - по одной строке в точках сохранения"""
+
+        async with session_factory() as session:
+            try:
+                async with session.begin_nested():
+                    models = await self.add_many(
+                        session=session, data=data, loads=loads)
+                    results: list[Any] = convert(models) if convert else models  # type: ignore
+            except exc.SQLAlchemyError as error:
+                _log.debug("Coalesced add %s failed, retry by row: %s",
+                           self.model.__name__, error)  # type: ignore
+
+                results = []
+                for item in data:
+                    try:
+                        async with session.begin_nested():
+                            models = await self.add_many(
+                                session=session, data=[item], loads=loads)
+                            results.extend(convert(models) if convert else models)  # type: ignore
+                    except exc.SQLAlchemyError as row_error:
+                        results.append(row_error)
+
+            # Отсоединенные объекты не истекают при commit и остаются загруженными
+            session.expunge_all()
+            await session.commit()
+
+        return results
+
+    def _get_insert_values(self, data: Union[M, dict[str, Any]]) -> dict[str, Any]:
+        """Значения колонок для INSERT из словаря или объекта модели"""
+
+        if isinstance(data, dict):
+            return data
+
+        # Только заданные значения: для остальных колонок применяются default БД и модели
+        state_dict = inspect(data).dict
+        return {
+            key: state_dict[key]
+            for key in inspect(self.model).column_attrs.keys()
+            if key in state_dict
+        }
+
+    async def _insert_returning(
+        self,
+        session: AsyncSession,
+        values: list[dict[str, Any]],
+        loads: Optional[dict[str, str]] = None
+    ) -> list[M]:
+        """INSERT ... RETURNING: объекты строятся из возвращенных строк, связи загружаются только по loads"""
+
+        r = await session.scalars(
+            insert(self.model).returning(
+                self.model, sort_by_parameter_order=len(values) > 1),
+            values
+        )
+        models = list(r.all())
+
+        if loads:
+            # Объекты уже в identity map сессии: запрос с загрузками только заполняет связи
+            await self._get_many(
+                session=session,
+                pks=[inspect(model).identity for model in models],
+                loads=loads
+            )
+
+        return models
@@ -0,0 +1,182 @@
+import logging
+import time
+from typing import Any, AsyncIterable, AsyncIterator, Generic, Iterable, Literal, Mapping, Optional, Sequence, TypeVar, Union
+from sqlalchemy import Table, insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from ...base_schemes import BulkLoadResult
+from ...cache import invalidate_identities, invalidate_tables, touch_tables
+
+
+_log = logging.getLogger(__name__)
+
+
+M = TypeVar('M')
+
+
+BULK_LOAD_CHUNK_SIZE = 10000
+
+
+async def _iter_chunks(
+    rows: Union[Iterable[Any], AsyncIterable[Any]],
+    chunk_size: int
+) -> AsyncIterator[list[Any]]:
+    """Разбиение строк на пачки, не читая весь источник в память"""
+
+    chunk: list[Any] = []
+
+    if isinstance(rows, AsyncIterable):
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+
+    if chunk:
+        yield chunk
+
+
+class BasicModelBulkOperations(Generic[M]):
+    """Загрузка большого количества строк в таблицу модели"""
+
+    model: type[M]
+
+    async def bulk_load(
+        self,
+
+        session: Union[AsyncSession, AsyncConnection, AsyncEngine],
+
+        rows: Union[Iterable[Union[Mapping[str, Any], Sequence[Any]]], AsyncIterable[Union[Mapping[str, Any], Sequence[Any]]]],
+
+        columns: Optional[list[str]] = None,
+
+        chunk_size: int = BULK_LOAD_CHUNK_SIZE,
+
+    ) -> BulkLoadResult:
+        """Загрузка строк в таблицу модели пачками по chunk_size строк
+
+        На asyncpg используется бинарный COPY (copy_records_to_table),
+        на остальных драйверах - INSERT через executemany.
+        Объекты моделей не создаются, события ORM не вызываются.
+        Колонкам, которых нет в columns, при COPY присваивается только server_default,
+        при executemany - также default колонки на стороне Python.
+
+        Кэши таблицы сбрасываются: для сессии - сразу и повторно после commit, для движка - после commit.
+        Для соединения кэши сбрасываются один раз сразу после загрузки, до того как вызывающий
+        зафиксирует транзакцию: чтение до commit может снова положить в кэш старые данные.
+
+        Args:
+            session (Union[AsyncSession, AsyncConnection, AsyncEngine]): Сессия или соединение (фиксирует вызывающий)
+                или движок (загрузка в отдельной транзакции с commit)
+            rows (Union[Iterable, AsyncIterable]): Строки: словари по именам колонок или кортежи в порядке columns
+            columns (Optional[list[str]], optional): Имена колонок таблицы. По умолчанию ключи первой строки-словаря
+                или все колонки таблицы для кортежей.
+            chunk_size (int, optional): Количество строк в пачке. По умолчанию BULK_LOAD_CHUNK_SIZE.
+
+        Returns:
+            BulkLoadResult: Количество строк, время и скорость загрузки
+
+
+        Example:
+
+            async def read_rows():
+                async for line in source:
+                    yield (line.id, line.name)
+
+            result = await db_client.user.bulk_load(
+                db_client.engine,
+                read_rows(),
+                columns=["id", "name"]
+            )
+            result.rows_per_second
+        """
+
+        _log.info("Bulk load %s", self.model.__name__)  # type: ignore
+
+        table: Table = self.model.__table__  # type: ignore
+
+        started = time.perf_counter()
+
+        if isinstance(session, AsyncEngine):
+            async with session.begin() as conn:
+                total, method = await self._bulk_load(conn, table, rows, columns, chunk_size)
+
+            invalidate_tables([table.fullname])
+            invalidate_identities([(table.fullname, None)])
+        elif isinstance(session, AsyncSession):
+            conn = await session.connection()
+            total, method = await self._bulk_load(conn, table, rows, columns, chunk_size)
+
+            touch_tables(session.sync_session, {table.fullname})
+        else:
+            total, method = await self._bulk_load(session, table, rows, columns, chunk_size)
+
+            invalidate_tables([table.fullname])
+            invalidate_identities([(table.fullname, None)])
+
+        seconds = time.perf_counter() - started
+
+        result = BulkLoadResult(
+            rows=total,
+            seconds=seconds,
+            rows_per_second=total / seconds if seconds > 0 else 0.0,
+            method=method
+        )
+
+        _log.info("Bulk load %s: %s rows, %.0f rows/s (%s)",
+                  self.model.__name__, result.rows, result.rows_per_second, method)  # type: ignore
+
+        return result
+
+    async def _bulk_load(
+        self,
+        conn: AsyncConnection,
+        table: Table,
+        rows: Union[Iterable[Any], AsyncIterable[Any]],
+        columns: Optional[list[str]],
+        chunk_size: int
+    ) -> tuple[int, Literal["copy", "executemany"]]:
+        """Загрузка пачек в соединении"""
+
+        method: Literal["copy", "executemany"] = "copy" if conn.dialect.driver == "asyncpg" else "executemany"
+
+        driver_connection: Any = None
+        if method == "copy":
+            raw_connection = await conn.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+
+        total = 0
+        async for chunk in _iter_chunks(rows, chunk_size):
+            if columns is None:
+                first = chunk[0]
+                columns = list(first.keys()) if isinstance(first, Mapping) else [
+                    column.name for column in table.columns
+                ]
+
+            records = [
+                tuple(row[column] for column in columns) if isinstance(row, Mapping) else tuple(row)
+                for row in chunk
+            ]
+
+            if driver_connection is not None:
+                await driver_connection.copy_records_to_table(
+                    table.name,
+                    records=records,
+                    columns=columns,
+                    schema_name=table.schema
+                )
+            else:
+                await conn.execute(
+                    insert(table),
+                    [dict(zip(columns, record)) for record in records]
+                )
+
+            total += len(records)
+
+        return total, method
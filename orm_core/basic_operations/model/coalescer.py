@@ -0,0 +1,164 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Generic, Optional, TypeVar, Union
+
+
+_log = logging.getLogger(__name__)
+
+
+T = TypeVar('T')
+
+
+ADD_COALESCER_BATCH_SIZE = 100
+ADD_COALESCER_DELAY = 0.005
+
+
+class AddCoalescer(Generic[T]):
+    """Объединение одновременных вызовов add в многострочный INSERT
+
+    Вызовы add копятся не дольше max_delay секунд или до max_batch_size строк
+    и записываются одним вызовом write_many в своей транзакции.
+    Каждый вызывающий получает свою строку или свою ошибку.
+    Отмена вызывающего не отменяет запись уже отправленной строки.
+
+    Example:
+
+        coalescer = db_client.user.get_add_coalescer(db_client.session_factory, max_batch_size=500)
+
+        @router.post("/events")
+        async def add_event(data: EventAdd) -> EventOut:
+            return await coalescer.add(data)
+
+        coalescer.stats  # {"batches": ..., "rows_per_batch": ..., ...}
+    """
+
+    def __init__(
+        self,
+        write_many: Callable[[list[Any]], Awaitable[list[Union[T, BaseException]]]],
+        max_batch_size: int = ADD_COALESCER_BATCH_SIZE,
+        max_delay: float = ADD_COALESCER_DELAY
+    ) -> None:
+        """Объединение вызовов add
+
+        Args:
+            write_many (Callable[[list[Any]], Awaitable[list[Union[T, BaseException]]]]): Запись пачки, результат или ошибка по каждой строке в порядке строк
+            max_batch_size (int, optional): Максимум строк в пачке. По умолчанию ADD_COALESCER_BATCH_SIZE.
+            max_delay (float, optional): Максимальное ожидание первой строки пачки в секундах. По умолчанию ADD_COALESCER_DELAY.
+        """
+
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size должен быть больше 0")
+
+        self.write_many = write_many
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+
+        self.__pending: list[tuple[Any, asyncio.Future[T]]] = []
+        self.__pending_since = 0.0
+        self.__timer: Optional[asyncio.TimerHandle] = None
+        self.__tasks: set[asyncio.Task[None]] = set()
+
+        self.batches = 0
+        self.rows = 0
+        self.errors = 0
+        self.max_batch_rows = 0
+        self.wait_seconds = 0.0
+        self.write_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self.__pending)
+
+    async def add(self, data: Any) -> T:
+        """Добавление строки в ближайшую пачку
+
+        Args:
+            data (Any): Данные для создания (как для add_many менеджера)
+
+        Returns:
+            T: Созданный объект
+        """
+
+        loop = asyncio.get_running_loop()
+
+        future: asyncio.Future[T] = loop.create_future()
+        self.__pending.append((data, future))
+
+        if len(self.__pending) >= self.max_batch_size:
+            self.__dispatch()
+        elif len(self.__pending) == 1:
+            self.__pending_since = loop.time()
+            self.__timer = loop.call_later(self.max_delay, self.__dispatch)
+
+        return await future
+
+    async def flush(self) -> None:
+        """Запись накопленных строк без ожидания и ожидание всех начатых пачек (например, при остановке приложения)"""
+
+        if self.__pending:
+            self.__dispatch()
+
+        if self.__tasks:
+            await asyncio.gather(*self.__tasks, return_exceptions=True)
+
+    def __dispatch(self) -> None:
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+
+        pending, self.__pending = self.__pending, []
+        if not pending:
+            return
+
+        self.wait_seconds += asyncio.get_running_loop().time() - self.__pending_since
+
+        task = asyncio.ensure_future(self.__run(pending))
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+    async def __run(self, pending: list[tuple[Any, "asyncio.Future[T]"]]) -> None:
+        self.batches += 1
+        self.rows += len(pending)
+        self.max_batch_rows = max(self.max_batch_rows, len(pending))
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        try:
+            results = await self.write_many([data for data, _ in pending])
+        except BaseException as e:
+            self.errors += len(pending)
+            _log.debug("Add coalescer batch of %s rows failed: %s", len(pending), e)
+
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        finally:
+            self.write_seconds += loop.time() - started
+
+        for (_, future), result in zip(pending, results):
+            if isinstance(result, BaseException):
+                self.errors += 1
+                if not future.done():
+                    future.set_exception(result)
+            elif not future.done():
+                future.set_result(result)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Настройки и метрики пачек: размер, ожидание перед записью и время записи"""
+
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_delay": self.max_delay,
+            "pending": len(self.__pending),
+            "batches": self.batches,
+            "rows": self.rows,
+            "errors": self.errors,
+            "rows_per_batch": self.rows / self.batches if self.batches else 0.0,
+            "max_batch_rows": self.max_batch_rows,
+            "avg_wait_seconds": self.wait_seconds / self.batches if self.batches else 0.0,
+            "avg_write_seconds": self.write_seconds / self.batches if self.batches else 0.0,
+        }
@@ -0,0 +1,94 @@
+import base64
+import binascii
+import json
+import logging
+from typing import Any, Optional
+
+from fastapi import HTTPException
+from pydantic import TypeAdapter
+from pydantic_core import to_jsonable_python
+
+
+_log = logging.getLogger(__name__)
+
+
+def encode_cursor(
+    values: list[Any],
+    sort_by: Optional[str],
+    desc: int,
+    is_backward: bool = False
+) -> str:
+    """Кодирование позиции keyset-пагинации в непрозрачный курсор
+
+    Args:
+        values (list[Any]): Значения поля сортировки и первичных ключей последней строки
+        sort_by (Optional[str]): Поле сортировки
+        desc (int): Порядок сортировки
+        is_backward (bool, optional): Курсор на предыдущую страницу. По умолчанию False.
+
+    Returns:
+        str: Курсор в base64url
+    """
+
+    payload = {
+        "v": to_jsonable_python(values),
+        "s": sort_by,
+        "d": 1 if desc else 0,
+        "b": 1 if is_backward else 0,
+    }
+
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(
+    cursor: str,
+    types: list[Any],
+    sort_by: Optional[str],
+    desc: int
+) -> tuple[list[Any], bool]:
+    """Декодирование курсора keyset-пагинации
+
+    Args:
+        cursor (str): Курсор
+        types (list[Any]): Python-типы значений курсора для приведения
+        sort_by (Optional[str]): Поле сортировки текущего запроса
+        desc (int): Порядок сортировки текущего запроса
+
+    Raises:
+        HTTPException: 400 - Некорректный курсор или курсор от другой сортировки
+
+    Returns:
+        tuple[list[Any], bool]: Значения позиции и флаг движения назад
+    """
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = payload["v"]
+        is_backward = bool(payload["b"])
+        cursor_sort_by = payload["s"]
+        cursor_desc = payload["d"]
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        _log.debug(e)
+        raise HTTPException(status_code=400, detail="Некорректный курсор")
+
+    if cursor_sort_by != sort_by or cursor_desc != (1 if desc else 0):
+        raise HTTPException(
+            status_code=400,
+            detail="Курсор не соответствует параметрам сортировки"
+        )
+
+    if not isinstance(values, list) or len(values) != len(types):
+        raise HTTPException(status_code=400, detail="Некорректный курсор")
+
+    try:
+        values = [
+            TypeAdapter(type_).validate_python(value) if value is not None else None
+            for type_, value in zip(types, values)
+        ]
+    except ValueError as e:
+        _log.debug(e)
+        raise HTTPException(status_code=400, detail="Некорректный курсор")
+
+    return values, is_backward
@@ -1,10 +1,15 @@
 import logging
-from typing import Any, Literal, Optional,  TypeVar, Generic,  overload
+from typing import Any, Iterable, Literal, Optional, Sequence, TypeVar, Generic, Union, overload
 from fastapi import HTTPException
-from sqlalchemy import Select, select
+from sqlalchemy import ColumnElement, Select, bindparam, func, inspect, select, tuple_, update
 from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...base_schemes import EditManyDTO
+from ...cache import touch_tables
+from .identity import BasicModelIdentityOperations
+
 
 _log = logging.getLogger(__name__)
 
@@ -12,7 +17,13 @@ _log = logging.getLogger(__name__)
 M = TypeVar('M')
 
 
-class BasicModelEditOperations(Generic[M]):
+EDIT_MANY_CHUNK_SIZE = 1000
+
+
+class BasicModelEditOperations(
+        BasicModelIdentityOperations[M],
+        Generic[M]
+):
 
     model: type[M]
 
@@ -32,6 +43,8 @@ class BasicModelEditOperations(Generic[M]):
 
         is_get_none: bool = True,
 
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
         **pks: Any
 
     ) -> None: ...
@@ -52,6 +65,8 @@ class BasicModelEditOperations(Generic[M]):
 
         is_get_none: Literal[False] = False,
 
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
         **pks: Any
 
     ) -> M: ...
@@ -72,6 +87,8 @@ class BasicModelEditOperations(Generic[M]):
 
         is_get_none: Literal[True] = True,
 
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
         **pks: Any
 
     ) -> Optional[M]: ...
@@ -92,6 +109,8 @@ class BasicModelEditOperations(Generic[M]):
 
         is_get_none: bool,
 
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
         **pks: Any
 
     ) -> Optional[M]: ...
@@ -111,6 +130,8 @@ class BasicModelEditOperations(Generic[M]):
 
         is_get_none: bool = True,
 
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
         **pks: Any
 
     ) -> Optional[M]:
@@ -123,6 +144,10 @@ class BasicModelEditOperations(Generic[M]):
             is_return (bool, optional): Возвращать ли объект. Defaults to True.
             return_query (Optional[Select[Any]], optional): Кастомный запрос для возврата. Defaults to None.
             is_get_none (bool, optional): Возвращать ли None, если объект не найден. Defaults to True.
+            write_mode (Literal["orm", "returning", "direct"], optional): "returning" - один запрос UPDATE ... WHERE pk RETURNING
+                вместо SELECT, flush и повторного SELECT (для полного первичного ключа и без return_query),
+                связи загружаются только по loads. "direct" - один запрос UPDATE ... WHERE pk только с полями edit_item
+                (None тоже записывается), объект не найден - по rowcount, чтение только при is_return. Defaults to "orm".
             **pks (Any): Первыичные ключи
 
         Raises:
@@ -134,39 +159,78 @@ class BasicModelEditOperations(Generic[M]):
 
         _log.info("Edit model %s", self.model.__name__)
 
+        identity = self._get_identity(pks)
+
+        if write_mode == "direct" and identity is not None and return_query is None:
+            return await self._edit_direct(
+                session=session,
+                identity=identity,
+                edit_item=edit_item,
+                loads=loads,
+                is_return=is_return
+            )
+
+        if write_mode == "returning" and identity is not None and return_query is None:
+            return await self._edit_returning(
+                session=session,
+                identity=identity,
+                edit_item=edit_item,
+                loads=loads,
+                is_return=is_return
+            )
+
         stmt = select(self.model).filter_by(**pks)
 
-        r = await session.execute(stmt)
-        model = r.scalars().first()
+        if identity is not None:
+            model = await self._get_by_identity(
+                session=session,
+                identity=identity
+            )
+        else:
+            r = await session.execute(stmt)
+            model = r.scalars().first()
 
         if model is None:
             raise HTTPException(
                 status_code=404, detail=f"{self.model.__name__} not found")
 
+        changed: set[str] = set()
         for key, value in edit_item.items():
             if value is not None:
                 setattr(model, key, value)
+                changed.add(key)
 
         await session.flush()
 
-        if loads is not None:
-            for key, val in loads.items():
-                if val == "s":
-                    stmt = stmt.options(
-                        selectinload(getattr(self.model, key))
-                    )
-                elif val == "j":
-                    stmt = stmt.options(
-                        joinedload(getattr(self.model, key))
-                    )
-
-        r = await session.execute(stmt)
-        model = r.scalars().first()
-
         if not is_return:
             return None
 
         if return_query is None:
+            if identity is not None:
+                if loads:
+                    self._expire_changed_relationships(
+                        session, model, loads, changed)
+
+                model = await self._get_by_identity(
+                    session=session,
+                    identity=identity,
+                    loads=loads
+                )
+            else:
+                if loads is not None:
+                    for key, val in loads.items():
+                        if val == "s":
+                            stmt = stmt.options(
+                                selectinload(getattr(self.model, key))
+                            )
+                        elif val == "j":
+                            stmt = stmt.options(
+                                joinedload(getattr(self.model, key))
+                            )
+
+                r = await session.execute(stmt)
+                model = r.scalars().first()
+
             return model
 
         stmt = return_query.filter_by(**pks)
@@ -182,3 +246,382 @@ class BasicModelEditOperations(Generic[M]):
 
         raise HTTPException(
             status_code=404, detail=f"{self.model.__name__} not found")
+
+    @overload
+    async def edit_many(
+        self,
+        *,
+        session: AsyncSession,
+        where: Union[dict[str, Any], ColumnElement[bool]],
+        values: dict[str, Any],
+        is_return: bool = False,
+        loads: Optional[dict[str, str]] = None
+    ) -> EditManyDTO[M]: ...
+
+    @overload
+    async def edit_many(
+        self,
+        *,
+        session: AsyncSession,
+        items: Sequence[dict[str, Any]],
+        is_return: bool = False,
+        loads: Optional[dict[str, str]] = None,
+        chunk_size: int = EDIT_MANY_CHUNK_SIZE
+    ) -> EditManyDTO[M]: ...
+
+    async def edit_many(
+        self,
+
+        session: AsyncSession,
+
+        where: Union[dict[str, Any], ColumnElement[bool], None] = None,
+
+        values: Optional[dict[str, Any]] = None,
+
+        items: Optional[Sequence[dict[str, Any]]] = None,
+
+        is_return: bool = False,
+
+        loads: Optional[dict[str, str]] = None,
+
+        chunk_size: int = EDIT_MANY_CHUNK_SIZE
+
+    ) -> EditManyDTO[M]:
+        """Редактирование многих строк без загрузки объектов
+
+        where и values - один запрос UPDATE ... WHERE по условию.
+        items - UPDATE по первичному ключу (executemany) пачками по chunk_size строк,
+        строки с одинаковым набором изменяемых полей выполняются одним запросом.
+        Значения записываются как есть, включая None.
+
+        Args:
+            session (AsyncSession): Сессия
+            where (Union[dict[str, Any], ColumnElement[bool], None], optional): Условие: поля и значения (filter_by) или выражение SQLAlchemy
+            values (Optional[dict[str, Any]], optional): Новые значения полей: значения или выражения SQLAlchemy
+            items (Optional[Sequence[dict[str, Any]]], optional): Строки {первичный ключ..., "changes": {поле: значение}}
+            is_return (bool, optional): Возвращать ли объекты (RETURNING для where, чтение по первичным ключам для items). Defaults to False.
+            loads (Optional[dict[str, str]], optional): Список полей для загрузки связанных объектов (при is_return). Defaults to None.
+            chunk_size (int, optional): Количество строк items в одной пачке. Defaults to EDIT_MANY_CHUNK_SIZE.
+
+        Raises:
+            ValueError: Переданы одновременно where/values и items или не передано ни то, ни другое
+            HTTPException: 400 - В строке items нет первичного ключа или изменяемое поле не является колонкой модели
+
+        Returns:
+            EditManyDTO[M]: Количество измененных строк и (при is_return) объекты:
+                для where - измененные, для items - в порядке items, None для ненайденных
+
+
+        Example:
+
+            result = await db_client.order.edit_many(
+                session=session,
+                where=(Order.status == "pending") & (Order.created_at < deadline),
+                values={"status": "expired"}
+            )
+            result.rowcount
+
+            result = await db_client.product.edit_many(
+                session=session,
+                items=[{"id": 1, "changes": {"price": 100}}, {"id": 2, "changes": {"price": 200}}],
+                is_return=True
+            )
+        """
+
+        _log.info("Edit many model %s", self.model.__name__)  # type: ignore
+
+        if items is not None:
+            if where is not None or values is not None:
+                raise ValueError("Для edit_many передаются либо where и values, либо items")
+
+            return await self._edit_many_items(
+                session=session,
+                items=items,
+                is_return=is_return,
+                loads=loads,
+                chunk_size=chunk_size
+            )
+
+        if where is None or values is None:
+            raise ValueError("Для edit_many передаются либо where и values, либо items")
+
+        return await self._edit_many_where(
+            session=session,
+            where=where,
+            values=values,
+            is_return=is_return,
+            loads=loads
+        )
+
+    async def _edit_many_where(
+        self,
+        session: AsyncSession,
+        where: Union[dict[str, Any], ColumnElement[bool]],
+        values: dict[str, Any],
+        is_return: bool = False,
+        loads: Optional[dict[str, str]] = None
+    ) -> EditManyDTO[M]:
+        """Редактирование одним запросом UPDATE ... WHERE по условию"""
+
+        if not values:
+            return EditManyDTO[M](rowcount=0, content=[] if is_return else None)
+
+        stmt = update(self.model)
+        if isinstance(where, dict):
+            stmt = stmt.filter_by(**where)
+        else:
+            stmt = stmt.where(where)
+
+        stmt = stmt.values(**values)
+
+        if not is_return:
+            r = await session.execute(stmt)
+            return EditManyDTO[M](rowcount=r.rowcount)  # type: ignore
+
+        r = await session.scalars(stmt.returning(self.model))
+        models = list(r.all())
+
+        if loads and models:
+            keys = self._get_identity_keys()
+
+            # Связи с изменившимся внешним ключом перезагружаются вместе с остальными
+            await self._get_many(
+                session=session,
+                pks=[tuple(getattr(model, key) for key in keys) for model in models],
+                loads=loads,
+                populate_existing=True
+            )
+
+        return EditManyDTO[M](rowcount=len(models), content=models)
+
+    async def _edit_many_items(
+        self,
+        session: AsyncSession,
+        items: Sequence[dict[str, Any]],
+        is_return: bool = False,
+        loads: Optional[dict[str, str]] = None,
+        chunk_size: int = EDIT_MANY_CHUNK_SIZE
+    ) -> EditManyDTO[M]:
+        """Редактирование по первичному ключу: executemany UPDATE пачками"""
+
+        mapper = inspect(self.model)
+        table = mapper.local_table
+        columns = mapper.columns
+        keys = self._get_identity_keys()
+
+        # Строки проверяются до первого запроса, чтобы ошибка в данных не оставила часть изменений
+        rows: list[tuple[dict[str, Any], dict[str, Any]]] = []
+        for index, item in enumerate(items):
+            missing = [key for key in keys if key not in item]
+            if missing:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Строка {index}: не передан первичный ключ {', '.join(missing)}"
+                )
+
+            changes = dict(item.get("changes") or {})
+            for key in changes:
+                if key not in columns:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Строка {index}: поле {key} для изменения не найдено"
+                    )
+
+            rows.append(({key: item[key] for key in keys}, changes))
+
+        # UPDATE с WHERE и списком параметров выполняется через соединение: ORM
+        # выполняет executemany только как UPDATE по первичному ключу с ошибкой на ненайденных строках
+        conn = await session.connection()
+
+        rowcount = 0
+        for start in range(0, len(rows), chunk_size):
+            chunk = [row for row in rows[start:start + chunk_size] if row[1]]
+            if not chunk:
+                continue
+
+            groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+            for identity, changes in chunk:
+                params = {f"pk_{key}": value for key, value in identity.items()}
+                params.update(
+                    {f"v_{key}": value for key, value in changes.items()})
+                groups.setdefault(tuple(changes), []).append(params)
+
+            for group_keys, params in groups.items():
+                stmt = update(table).where(
+                    *[columns[key] == bindparam(f"pk_{key}") for key in keys]
+                ).values({
+                    columns[key]: bindparam(f"v_{key}") for key in group_keys
+                })
+
+                r = await conn.execute(stmt, params)
+                if conn.dialect.supports_sane_multi_rowcount:
+                    rowcount += r.rowcount  # type: ignore
+
+            # Драйвер не сообщает количество строк executemany (asyncpg) - считаются найденные ключи
+            if not conn.dialect.supports_sane_multi_rowcount:
+                if len(keys) == 1:
+                    condition = columns[keys[0]].in_(
+                        [identity[keys[0]] for identity, _ in chunk])
+                else:
+                    condition = tuple_(*[columns[key] for key in keys]).in_(
+                        [tuple(identity.values()) for identity, _ in chunk])
+
+                rowcount += await session.scalar(
+                    select(func.count()).select_from(table).where(condition)
+                ) or 0
+
+            # Объекты, уже загруженные в сессию, получают новые значения без отметки об изменении
+            relationships = mapper.relationships.keys()
+            for identity, changes in chunk:
+                model = session.identity_map.get(
+                    mapper.identity_key_from_primary_key(list(identity.values())))
+                if model is None:
+                    continue
+
+                for key, value in changes.items():
+                    set_committed_value(model, key, value)
+                self._expire_changed_relationships(
+                    session, model, relationships, set(changes))
+
+        touch_tables(session.sync_session, {table.fullname})
+
+        if not is_return:
+            return EditManyDTO[M](rowcount=rowcount)
+
+        content = await self._get_many(
+            session=session,
+            pks=[identity for identity, _ in rows],
+            loads=loads,
+            populate_existing=True
+        )
+
+        return EditManyDTO[M](rowcount=rowcount, content=content)
+
+    async def _edit_returning(
+        self,
+        session: AsyncSession,
+        identity: dict[str, Any],
+        edit_item: dict[str, Any],
+        loads: Optional[dict[str, str]] = None,
+        is_return: bool = True
+    ) -> Optional[M]:
+        """Редактирование одним запросом UPDATE ... WHERE pk RETURNING
+
+        Raises:
+            HTTPException: 404 - Объект не найден
+        """
+
+        values = {
+            key: value for key, value in edit_item.items() if value is not None
+        }
+
+        if not values:
+            model = await self._get_by_identity(
+                session=session,
+                identity=identity,
+                loads=loads if is_return else None
+            )
+            if model is None:
+                raise HTTPException(
+                    status_code=404, detail=f"{self.model.__name__} not found")
+
+            return model if is_return else None
+
+        stmt = update(self.model).filter_by(**identity).values(**values)
+
+        if not is_return:
+            r = await session.execute(stmt)
+            if r.rowcount == 0:  # type: ignore
+                raise HTTPException(
+                    status_code=404, detail=f"{self.model.__name__} not found")
+            return None
+
+        r = await session.scalars(stmt.returning(self.model))
+        model = r.first()
+
+        if model is None:
+            raise HTTPException(
+                status_code=404, detail=f"{self.model.__name__} not found")
+
+        if loads:
+            self._expire_changed_relationships(
+                session, model, loads, set(values))
+
+            model = await self._get_by_identity(
+                session=session,
+                identity=identity,
+                loads=loads
+            )
+
+        return model
+
+    async def _edit_direct(
+        self,
+        session: AsyncSession,
+        identity: dict[str, Any],
+        edit_item: dict[str, Any],
+        loads: Optional[dict[str, str]] = None,
+        is_return: bool = True
+    ) -> Optional[M]:
+        """Редактирование одним запросом UPDATE ... WHERE pk только с переданными полями
+
+        Raises:
+            HTTPException: 404 - Объект не найден
+        """
+
+        if edit_item:
+            r = await session.execute(
+                update(self.model).filter_by(**identity).values(**edit_item)
+            )
+            if r.rowcount == 0:  # type: ignore
+                raise HTTPException(
+                    status_code=404, detail=f"{self.model.__name__} not found")
+
+            if not is_return:
+                return None
+
+            # UPDATE обновил поля объекта в identity map (synchronize_session), но не связи
+            if loads:
+                key = inspect(self.model).identity_key_from_primary_key(
+                    list(identity.values()))
+                model = session.identity_map.get(key)
+                if model is not None:
+                    self._expire_changed_relationships(
+                        session, model, loads, set(edit_item))
+
+        model = await self._get_by_identity(
+            session=session,
+            identity=identity,
+            loads=loads if is_return else None
+        )
+
+        if model is None:
+            raise HTTPException(
+                status_code=404, detail=f"{self.model.__name__} not found")
+
+        return model if is_return else None
+
+    def _expire_changed_relationships(
+        self,
+        session: AsyncSession,
+        model: M,
+        loads: Iterable[str],
+        changed: set[str]
+    ) -> None:
+        """Сброс загруженных связей, внешний ключ которых изменился: сама связь при этом не обновляется"""
+
+        mapper = inspect(self.model)
+        column_keys = {
+            column: prop.key
+            for prop in mapper.column_attrs
+            for column in prop.columns
+        }
+        expired = [
+            key for key in loads
+            if key in mapper.relationships and any(
+                column_keys.get(column) in changed
+                for column in mapper.relationships[key].local_columns
+            )
+        ]
+        if expired:
+            session.expire(model, expired)
@@ -1,12 +1,15 @@
 import logging
-from typing import Any, Literal, Optional, Sequence, TypeVar, Generic, Union, overload
+from typing import Any, AsyncIterator, Hashable, Literal, Optional, Sequence, TypeVar, Generic, Union, overload
 from fastapi import HTTPException
-from sqlalchemy import Select, asc,  desc as func_desc, func, or_, select, cast
-from sqlalchemy.types import String
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy import Select, and_, asc, bindparam, desc as func_desc, func, inspect, literal_column, or_, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.orm import load_only, selectinload, joinedload
 
-from ...base_schemes import ListDTO
+from ...base_schemes import CursorListDTO, ListDTO
+from ...cache import MISSING, TTLCache, has_pending_writes
+from ...search import IlikeSearch, SearchBackend
+from .cursor import decode_cursor, encode_cursor
+from .statements import BasicModelStatementOperations
 
 
 _log = logging.getLogger(__name__)
@@ -15,10 +18,16 @@ _log = logging.getLogger(__name__)
 M = TypeVar('M')
 
 
-class BasicModelGetAllOperations(Generic[M]):
+class BasicModelGetAllOperations(
+        BasicModelStatementOperations[M],
+        Generic[M]
+):
 
     model: type[M]
 
+    count_cache: Optional[TTLCache] = None
+    search_backend: SearchBackend = IlikeSearch()
+
     @overload
     async def get_all(
         self,
@@ -43,6 +52,16 @@ class BasicModelGetAllOperations(Generic[M]):
 
         is_pagination: Literal[False] = False,
 
+        count_strategy: Literal["query", "window"] = "query",
+
+        count_mode: Literal["exact", "estimate", "capped"] = "exact",
+
+        count_cap: int = 1000,
+
+        columns: Optional[list[str]] = None,
+
+        read_mode: Literal["orm", "core"] = "orm",
+
         **kwargs: Any
 
     ) -> Sequence[M]:
@@ -72,6 +91,16 @@ class BasicModelGetAllOperations(Generic[M]):
 
         is_pagination: Literal[True] = True,
 
+        count_strategy: Literal["query", "window"] = "query",
+
+        count_mode: Literal["exact", "estimate", "capped"] = "exact",
+
+        count_cap: int = 1000,
+
+        columns: Optional[list[str]] = None,
+
+        read_mode: Literal["orm", "core"] = "orm",
+
         **kwargs: Any
 
     ) -> ListDTO[M]:
@@ -100,6 +129,16 @@ class BasicModelGetAllOperations(Generic[M]):
 
         is_pagination: bool = True,
 
+        count_strategy: Literal["query", "window"] = "query",
+
+        count_mode: Literal["exact", "estimate", "capped"] = "exact",
+
+        count_cap: int = 1000,
+
+        columns: Optional[list[str]] = None,
+
+        read_mode: Literal["orm", "core"] = "orm",
+
         **kwargs: Any
 
     ) -> Union[ListDTO[M], Sequence[M]]:
@@ -116,6 +155,15 @@ class BasicModelGetAllOperations(Generic[M]):
             page (int, optional): Номер страницы. Defaults to 1.
             limit (int, optional): Количество элементов на странице. Defaults to -1.
             is_pagination (bool, optional): Пагинация. Defaults to True.
+            count_strategy (Literal["query", "window"], optional): Подсчет total_record отдельным запросом
+                или в том же запросе через count(*) OVER (). Defaults to "query".
+            count_mode (Literal["exact", "estimate", "capped"], optional): Точный подсчет, оценка по статистике
+                планировщика (только без фильтров и поиска) или подсчет не более count_cap строк. Defaults to "exact".
+            count_cap (int, optional): Максимум считаемых строк для count_mode="capped". Defaults to 1000.
+            columns (Optional[list[str]], optional): Загружаемые поля модели (load_only), остальные колонки не читаются.
+                Defaults to None (все колонки).
+            read_mode (Literal["orm", "core"], optional): "core" - выборка только колонок columns без создания
+                экземпляров моделей, content содержит словари колонок, loads не применяется. Defaults to "orm".
             **kwargs (Any): Параметры фильтрации
 
         Raises:
@@ -128,7 +176,406 @@ class BasicModelGetAllOperations(Generic[M]):
 
         _log.debug("Get all model %s", self.model.__name__)
 
-        desc_int = desc
+        is_filtered = query_select is not None or bool(kwargs) or bool(
+            search and search_fields)
+
+        if page < 1:
+            raise HTTPException(
+                status_code=400, detail="Номер страницы должен быть больше 0"
+            )
+
+        is_window = is_pagination and count_strategy == "window" and count_mode == "exact"
+        is_search = bool(search and search_fields)
+
+        shape: Optional[Hashable] = None
+        filters, params = kwargs, {}
+        if query_select is None:
+            shape, filters, params = self._bind_filters(kwargs)
+        is_bind = shape is not None
+
+        def build() -> tuple[Select[Any], Select[Any]]:
+            query = self._filter_query(
+                query_select=query_select,
+                search=search,
+                search_fields=search_fields,
+                is_bind=is_bind,
+                **filters
+            )
+
+            q_total = query
+
+            if read_mode == "core":
+                query = query.with_only_columns(
+                    *self._get_columns(columns)
+                )
+            else:
+                query = self._load_query(query, loads, columns)
+
+            if sort_by:
+                sort_column = self._get_sort_column(sort_by)
+                query = query.order_by(
+                    func_desc(sort_column) if desc else asc(sort_column)
+                )
+
+            query = query.offset(
+                bindparam("page_offset") if is_bind else (page - 1) * limit
+            )
+            if limit != -1:
+                query = query.limit(bindparam("page_limit") if is_bind else limit)
+
+            if is_window:
+                query = query.add_columns(
+                    func.count().over().label("total_record")
+                )
+
+            return query, q_total
+
+        if is_bind:
+            query_select, q_total_record = self._get_statement(
+                (
+                    "get_all", shape,
+                    tuple(search_fields) if is_search else None,  # type: ignore
+                    tuple(sorted(loads.items())) if loads else None,
+                    tuple(columns) if columns is not None else None,
+                    read_mode, sort_by, bool(desc), limit != -1, is_window
+                ),
+                build
+            )
+
+            params["page_offset"] = (page - 1) * limit
+            if limit != -1:
+                params["page_limit"] = limit
+            if is_search:
+                params["search_value"] = self.search_backend.prepare(search)  # type: ignore
+        else:
+            query_select, q_total_record = build()
+
+        total_record: Optional[int] = None
+
+        is_total_approximate = False
+
+        if is_window:
+            result = await session.execute(query_select, params)
+            rows = result.all()
+            if read_mode == "core":
+                # zip отбрасывает последнюю колонку total_record
+                keys = list(result.keys())[:-1]
+                content = [dict(zip(keys, row)) for row in rows]
+            else:
+                content = [row[0] for row in rows]
+
+            if rows:
+                total_record = rows[0][-1]
+            elif page == 1:
+                total_record = 0
+        else:
+            result = await session.execute(query_select, params)
+            if read_mode == "core":
+                # Словари валидируются pydantic быстрее, чем RowMapping
+                keys = list(result.keys())
+                content = [dict(zip(keys, row)) for row in result.all()]
+            else:
+                content = result.scalars().all()
+
+        if is_pagination:
+            # На пустой странице (page за пределами) оконная функция ничего не вернет
+            if total_record is None:
+                total_record, is_total_approximate = await self._count_total(
+                    session=session,
+                    query_select=q_total_record,
+                    count_mode=count_mode,
+                    count_cap=count_cap,
+                    is_filtered=is_filtered,
+                    params=params if is_bind else None
+                )
+
+            if limit == -1:
+                pages = 1
+            else:
+                pages = total_record // limit if total_record % limit == 0 else total_record // limit + 1
+
+            return ListDTO[M](
+                page_number=page,
+                page_size=limit if limit != -1 else total_record,
+                total_pages=pages,
+                total_record=total_record,
+                is_total_approximate=is_total_approximate,
+                content=[item for item in content]
+            )
+        else:
+            return content
+
+    async def count(
+        self,
+
+        session: AsyncSession,
+
+        search: Optional[str] = None,
+
+        search_fields: Optional[list[str]] = None,
+
+        query_select: Optional[Select[Any]] = None,
+
+        **kwargs: Any
+
+    ) -> int:
+        """Количество объектов по фильтрам и поиску get_all, без выборки строк
+
+        Args:
+            session (AsyncSession): Сессия базы данных
+            search (Optional[str], optional): Поиск по полям. Defaults to None.
+            search_fields (Optional[list[str]], optional): Поля для поиска. Defaults to None.
+            query_select (Optional[Select[Any]], optional): Запрос для выборки. Defaults to None.
+            **kwargs (Any): Параметры фильтрации
+
+        Raises:
+            HTTPException: 400 - Некорректные параметры
+
+        Returns:
+            int: Количество объектов
+        """
+
+        _log.debug("Count model %s", self.model.__name__)
+
+        is_search = bool(search and search_fields)
+
+        shape: Optional[Hashable] = None
+        filters, params = kwargs, {}
+        if query_select is None:
+            shape, filters, params = self._bind_filters(kwargs)
+        is_bind = shape is not None
+
+        def build() -> Select[Any]:
+            return self._filter_query(
+                query_select=query_select,
+                search=search,
+                search_fields=search_fields,
+                is_bind=is_bind,
+                **filters
+            )
+
+        if is_bind:
+            q_total_record = self._get_statement(
+                ("count_filter", shape, tuple(search_fields) if is_search else None),  # type: ignore
+                build
+            )
+
+            if is_search:
+                params["search_value"] = self.search_backend.prepare(search)  # type: ignore
+        else:
+            q_total_record = build()
+
+        total_record, _ = await self._count_total(
+            session=session,
+            query_select=q_total_record,
+            params=params if is_bind else None
+        )
+
+        return total_record
+
+    async def get_all_cursor(
+        self,
+
+        session: AsyncSession,
+
+        cursor: Optional[str] = None,
+
+        search: Optional[str] = None,
+
+        search_fields: Optional[list[str]] = None,
+
+        loads: Optional[dict[str, str]] = None,
+
+        sort_by: Optional[str] = None,
+
+        query_select: Optional[Select[Any]] = None,
+
+        desc: int = 0,
+
+        limit: int = -1,
+
+        columns: Optional[list[str]] = None,
+
+        **kwargs: Any
+
+    ) -> CursorListDTO[M]:
+        """Получение списка моделей с keyset-пагинацией (по курсору)
+
+        Вместо OFFSET страница ищется условием (sort_by, pk) > (последние значения),
+        поэтому глубокие страницы стоят столько же, сколько первая.
+        NULL в поле сортировки считается больше любого значения (в конце по возрастанию).
+
+        Args:
+            session (AsyncSession): Сессия базы данных
+            cursor (Optional[str], optional): Курсор из next_cursor или prev_cursor. Defaults to None (первая страница).
+            search (Optional[str], optional): Поиск по полям. Defaults to None.
+            search_fields (Optional[list[str]], optional): Поля для поиска. Defaults to None.
+            loads (Optional[dict[str, str]], optional): Поля для загрузки. Defaults to None.
+            sort_by (Optional[str], optional): Поле для сортировки. Defaults to None (только по первичному ключу).
+            query_select (Optional[Select[Any]], optional): Запрос для выборки. Defaults to None.
+            desc (int, optional): Порядок сортировки. Defaults to 0.
+            limit (int, optional): Количество элементов на странице. Defaults to -1.
+            columns (Optional[list[str]], optional): Загружаемые поля модели (load_only), остальные колонки не читаются.
+                Defaults to None (все колонки).
+            **kwargs (Any): Параметры фильтрации
+
+        Raises:
+            HTTPException: 400 - Некорректные параметры или курсор
+
+        Returns:
+            CursorListDTO[M]: Страница моделей с курсорами соседних страниц
+        """
+
+        _log.debug("Get all by cursor model %s", self.model.__name__)
+
+        query_select = self._filter_query(
+            query_select=query_select,
+            search=search,
+            search_fields=search_fields,
+            **kwargs
+        )
+
+        key_columns = self._get_primary_key_columns()
+        is_nullable = False
+        if sort_by:
+            sort_column = self._get_sort_column(sort_by)
+            is_nullable = bool(getattr(getattr(sort_column, "expression", None), "nullable", True))
+            key_columns.insert(0, sort_column)
+
+        # Курсор строится из значений полей сортировки, поэтому они читаются всегда
+        if columns is not None:
+            columns = list(dict.fromkeys([*columns, *(column.key for column in key_columns)]))
+
+        query_select = self._load_query(query_select, loads, columns)
+
+        is_backward = False
+        if cursor:
+            values, is_backward = decode_cursor(
+                cursor=cursor,
+                types=[column.type.python_type for column in key_columns],
+                sort_by=sort_by,
+                desc=desc
+            )
+
+            # Назад по возрастанию - то же, что вперед по убыванию
+            query_select = query_select.filter(
+                self._get_keyset_condition(
+                    key_columns=key_columns,
+                    values=values,
+                    is_less=bool(desc) != is_backward,
+                    is_nullable=is_nullable
+                )
+            )
+
+        is_order_desc = bool(desc) != is_backward
+        order_by = [
+            func_desc(column) if is_order_desc else asc(column)
+            for column in key_columns
+        ]
+        if is_nullable:
+            # NULL больше любого значения, как по умолчанию в Postgres
+            order_by[0] = order_by[0].nulls_first() if is_order_desc else order_by[0].nulls_last()
+        query_select = query_select.order_by(*order_by)
+
+        if limit != -1:
+            query_select = query_select.limit(limit + 1)
+
+        result = await session.execute(query_select)
+        content = list(result.scalars().all())
+
+        is_more = limit != -1 and len(content) > limit
+        if is_more:
+            content = content[:limit]
+
+        if is_backward:
+            content.reverse()
+
+        def item_cursor(item: Any, is_backward_cursor: bool) -> str:
+            return encode_cursor(
+                values=[getattr(item, column.key) for column in key_columns],
+                sort_by=sort_by,
+                desc=desc,
+                is_backward=is_backward_cursor
+            )
+
+        next_cursor = None
+        prev_cursor = None
+        if content:
+            if is_backward or is_more:
+                next_cursor = item_cursor(content[-1], False)
+            if (cursor and not is_backward) or (is_backward and is_more):
+                prev_cursor = item_cursor(content[0], True)
+
+        return CursorListDTO[M](
+            page_size=limit if limit != -1 else len(content),
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+            content=content
+        )
+
+    def _get_keyset_condition(
+        self,
+        key_columns: list[Any],
+        values: list[Any],
+        is_less: bool,
+        is_nullable: bool
+    ) -> Any:
+        """Условие keyset-пагинации: строки после позиции курсора в порядке (поле сортировки, первичный ключ)
+
+        Для поля сортировки с NULL сравнение кортежей не подходит (NULL не больше и не меньше значения),
+        поэтому NULL считается больше любого значения.
+        """
+
+        if not is_nullable:
+            if is_less:
+                return tuple_(*key_columns) < tuple_(*values)
+            return tuple_(*key_columns) > tuple_(*values)
+
+        sort_column, *pk_columns = key_columns
+        sort_value, *pk_values = values
+
+        if is_less:
+            pk_condition = tuple_(*pk_columns) < tuple_(*pk_values)
+        else:
+            pk_condition = tuple_(*pk_columns) > tuple_(*pk_values)
+
+        if sort_value is None:
+            if is_less:
+                return or_(
+                    and_(sort_column.is_(None), pk_condition),
+                    sort_column.is_not(None)
+                )
+            return and_(sort_column.is_(None), pk_condition)
+
+        if is_less:
+            return or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, pk_condition)
+            )
+        return or_(
+            sort_column > sort_value,
+            and_(sort_column == sort_value, pk_condition),
+            sort_column.is_(None)
+        )
+
+    def _filter_query(
+        self,
+
+        query_select: Optional[Select[Any]] = None,
+
+        search: Optional[str] = None,
+
+        search_fields: Optional[list[str]] = None,
+
+        is_bind: bool = False,
+
+        **kwargs: Any
+
+    ) -> Select[Any]:
+        """Построение запроса с фильтрами и поиском, без загрузок, сортировки и пагинации
+
+        При is_bind строка поиска передается параметром search_value (значение из prepare).
+        """
 
         if query_select is None:
             query_select = select(
@@ -136,21 +583,306 @@ class BasicModelGetAllOperations(Generic[M]):
             )
 
         if search and search_fields:
-            search_conditions = []
             for field in search_fields:
-                if hasattr(self.model, field):
-                    column = getattr(self.model, field)
-                    search_conditions.append(  # type: ignore
-                        # type: ignore
-                        cast(column, String).ilike(f"%{search}%"))
-                else:
+                if not hasattr(self.model, field):
                     raise HTTPException(
                         status_code=400, detail=f"Поле {field} для поиска не найдено"
                     )
 
-            if search_conditions:
-                query_select = query_select.filter(
-                    or_(*search_conditions))  # type: ignore
+            query_select = query_select.filter(
+                self.search_backend.condition(
+                    self.model,
+                    search_fields,
+                    bindparam("search_value") if is_bind else self.search_backend.prepare(search)
+                )
+            )
+
+        if kwargs:
+            query_select = query_select.filter_by(**kwargs)
+
+        return query_select
+
+    async def stream_all(
+        self,
+
+        session: AsyncSession,
+
+        search: Optional[str] = None,
+
+        search_fields: Optional[list[str]] = None,
+
+        loads: Optional[dict[str, str]] = None,
+
+        sort_by: Optional[str] = None,
+
+        query_select: Optional[Select[Any]] = None,
+
+        desc: int = 0,
+
+        chunk_size: int = 1000,
+
+        columns: Optional[list[str]] = None,
+
+        **kwargs: Any
+
+    ) -> AsyncIterator[M]:
+        """Потоковое получение моделей по фильтрам и сортировке через серверный курсор
+
+        Строки читаются из БД порциями по chunk_size (yield_per), поэтому
+        потребление памяти не зависит от размера таблицы.
+
+        Args:
+            session (AsyncSession): Сессия базы данных
+            search (Optional[str], optional): Поиск по полям. Defaults to None.
+            search_fields (Optional[list[str]], optional): Поля для поиска. Defaults to None.
+            loads (Optional[dict[str, str]], optional): Поля для загрузки. Defaults to None.
+            sort_by (Optional[str], optional): Поле для сортировки. Defaults to None.
+            query_select (Optional[Select[Any]], optional): Запрос для выборки. Defaults to None.
+            desc (int, optional): Порядок сортировки. Defaults to 0.
+            chunk_size (int, optional): Количество строк, читаемых из БД за раз. Defaults to 1000.
+            columns (Optional[list[str]], optional): Загружаемые поля модели (load_only), остальные колонки не читаются.
+                Defaults to None (все колонки).
+            **kwargs (Any): Параметры фильтрации
+
+        Raises:
+            HTTPException: 400 - Некорректные параметры
+
+        Yields:
+            M: Модель
+
+        Example:
+
+            async for user in db_client.user.stream_all(session=session, sort_by="id"):
+                ...
+        """
+
+        _log.debug("Stream all model %s", self.model.__name__)
+
+        query_select = self._filter_query(
+            query_select=query_select,
+            search=search,
+            search_fields=search_fields,
+            **kwargs
+        )
+        query_select = self._load_query(query_select, loads, columns)
+
+        if sort_by:
+            sort_column = self._get_sort_column(sort_by)
+            query_select = query_select.order_by(
+                func_desc(sort_column) if desc else asc(sort_column)
+            )
+
+        query_select = query_select.execution_options(yield_per=chunk_size)
+
+        result = await session.stream(query_select)
+        try:
+            async for partition in result.scalars().partitions():
+                for item in partition:
+                    yield item
+        finally:
+            await result.close()
+
+    async def create_search_index(
+        self,
+        conn: AsyncConnection,
+        search_fields: Optional[list[str]] = None
+    ) -> None:
+        """Создание индекса (или виртуальной таблицы) для стратегии поиска менеджера
+
+        Вызывается автоматически из ClientDB.init_db для менеджеров-атрибутов клиента.
+
+        Args:
+            conn (AsyncConnection): Соединение
+            search_fields (Optional[list[str]], optional): Поля поиска. Defaults to None (search_fields менеджера API).
+        """
+
+        if search_fields is None:
+            search_fields = getattr(self, "search_fields", None)
+
+        if not search_fields:
+            return
+
+        _log.debug("Create search index for model %s", self.model.__name__)
+
+        columns = inspect(self.model).columns
+        await self.search_backend.create_index(
+            conn,
+            self.model.__table__,  # type: ignore
+            [columns[field].name for field in search_fields]
+        )
+
+    async def _count_total(
+        self,
+
+        session: AsyncSession,
+
+        query_select: Select[Any],
+
+        count_mode: Literal["exact", "estimate", "capped"] = "exact",
+
+        count_cap: int = 1000,
+
+        is_filtered: bool = True,
+
+        params: Optional[dict[str, Any]] = None
+
+    ) -> tuple[int, bool]:
+        """Подсчет количества строк запроса
+
+        Args:
+            session (AsyncSession): Сессия базы данных
+            query_select (Select[Any]): Запрос с фильтрами, без сортировки и пагинации
+            count_mode (Literal["exact", "estimate", "capped"], optional): Режим подсчета. Defaults to "exact".
+            count_cap (int, optional): Максимум считаемых строк для "capped". Defaults to 1000.
+            is_filtered (bool, optional): Есть ли в запросе фильтры или поиск. Defaults to True.
+            params (Optional[dict[str, Any]], optional): Параметры запроса из кэша запросов. Defaults to None.
+
+        Returns:
+            tuple[int, bool]: Количество строк и флаг, что количество приблизительное
+        """
+
+        # Количество в сессии с незафиксированными изменениями не должно попасть в общий кэш
+        if self.count_cache is None or has_pending_writes(session.sync_session):
+            return await self._execute_count(
+                session=session,
+                query_select=query_select,
+                count_mode=count_mode,
+                count_cap=count_cap,
+                is_filtered=is_filtered,
+                params=params
+            )
+
+        if params is not None:
+            # Запрос из кэша запросов однозначно задает форму, значения - в параметрах
+            key: Hashable = (count_mode, count_cap, query_select,
+                             repr(sorted(params.items())))
+        else:
+            # Ключ - скомпилированный запрос подсчета с параметрами фильтров и поиска
+            compiled = self._count_query(query_select).compile(
+                dialect=session.get_bind().dialect
+            )
+            key = (count_mode, count_cap, str(compiled), repr(compiled.params))
+
+        total = self.count_cache.get(key)
+        if total is not MISSING:
+            return total
+
+        total = await self._execute_count(
+            session=session,
+            query_select=query_select,
+            count_mode=count_mode,
+            count_cap=count_cap,
+            is_filtered=is_filtered,
+            params=params
+        )
+        if not has_pending_writes(session.sync_session):
+            self.count_cache.set(key, total)
+
+        return total
+
+    async def _execute_count(
+        self,
+
+        session: AsyncSession,
+
+        query_select: Select[Any],
+
+        count_mode: Literal["exact", "estimate", "capped"] = "exact",
+
+        count_cap: int = 1000,
+
+        is_filtered: bool = True,
+
+        params: Optional[dict[str, Any]] = None
+
+    ) -> tuple[int, bool]:
+        """Подсчет количества строк запроса в БД, без кэша"""
+
+        if count_mode == "estimate" and not is_filtered:
+            estimate = await self._estimate_count(session)
+            if estimate is not None:
+                return estimate, True
+
+        if count_mode == "capped":
+            r_total_record = await session.execute(
+                self._count_query(query_select.limit(count_cap + 1)),
+                params
+            )
+            total_record = r_total_record.scalar_one_or_none() or 0
+
+            if total_record > count_cap:
+                return count_cap, True
+
+            return total_record, False
+
+        if params is not None:
+            count_select = self._get_statement(
+                ("count", query_select),
+                lambda: self._count_query(query_select)
+            )
+        else:
+            count_select = self._count_query(query_select)
+
+        r_total_record = await session.execute(count_select, params)
+        return r_total_record.scalar_one_or_none() or 0, False
+
+    async def _estimate_count(self, session: AsyncSession) -> Optional[int]:
+        """Оценка количества строк всей таблицы без ее сканирования
+
+        Postgres - статистика планировщика (pg_class.reltuples),
+        SQLite - max(rowid). Для остальных СУБД или без статистики возвращает None.
+        """
+
+        table = self.model.__table__  # type: ignore
+        dialect = session.get_bind().dialect
+
+        if dialect.name == "postgresql":
+            r = await session.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"
+                ),
+                {"name": dialect.identifier_preparer.format_table(table)}
+            )
+            estimate = r.scalar_one_or_none()
+
+            # reltuples = -1, если таблица еще ни разу не анализировалась
+            if estimate is None or estimate < 0:
+                return None
+
+            return int(estimate)
+
+        if dialect.name == "sqlite" and table.dialect_options["sqlite"].get("with_rowid", True):
+            r = await session.execute(
+                select(func.max(literal_column("rowid"))).select_from(table)
+            )
+            return r.scalar_one_or_none() or 0
+
+        return None
+
+    def _count_query(self, query_select: Select[Any]) -> Select[Any]:
+        """Запрос количества строк, подходящих под фильтры запроса
+
+        Не зависит от имени первичного ключа, поэтому работает и для составных ключей.
+        """
+
+        return select(
+            func.count()
+        ).select_from(
+            query_select.order_by(None).subquery()
+        )
+
+    def _load_query(
+        self,
+        query_select: Select[Any],
+        loads: Optional[dict[str, str]] = None,
+        columns: Optional[list[str]] = None
+    ) -> Select[Any]:
+        """Добавление в запрос загрузки связанных объектов и ограничения загружаемых колонок"""
+
+        if columns is not None:
+            query_select = query_select.options(
+                load_only(*self._get_columns(columns))
+            )
 
         if loads:
             for key, val in loads.items():
@@ -175,54 +907,40 @@ class BasicModelGetAllOperations(Generic[M]):
                             detail=f"Поле {key} для загрузки не найдено"
                         )
 
-        if kwargs:
-            query_select = query_select.filter_by(**kwargs)
+        return query_select
 
-        if page < 1:
-            raise HTTPException(
-                status_code=400, detail="Номер страницы должен быть больше 0"
-            )
+    def _get_columns(self, columns: Optional[list[str]] = None) -> list[Any]:
+        """Поля модели для выборки колонок, None - все колонки"""
 
-        q_total_record = query_select
+        column_attrs = inspect(self.model).column_attrs
 
-        if sort_by:
-            if hasattr(self.model, sort_by):
-                query_select = query_select.order_by(
-                    func_desc(getattr(self.model, sort_by)) if desc_int else asc(
-                        getattr(self.model, sort_by))
-                )
-            else:
+        if columns is None:
+            return [getattr(self.model, key) for key in column_attrs.keys()]
+
+        for key in columns:
+            if key not in column_attrs:
                 raise HTTPException(
-                    status_code=400, detail=f"Поле {sort_by} для сортировки не найдено"
+                    status_code=400,
+                    detail=f"Поле {key} для загрузки не найдено"
                 )
 
-        query_select = query_select.offset((page - 1) * limit)
-        if limit != -1:
-            query_select = query_select.limit(limit)
+        return [getattr(self.model, key) for key in columns]
 
-        result = await session.execute(query_select)
-        content = result.scalars().all()
+    def _get_sort_column(self, sort_by: str) -> Any:
+        """Поле модели для сортировки"""
 
-        if is_pagination:
-            q_total_record = q_total_record.with_only_columns(
-                func.count(self.model.id))  # type: ignore
-            r_total_record = await session.execute(q_total_record)
-            total_record = r_total_record.scalar_one_or_none()
+        if not hasattr(self.model, sort_by):
+            raise HTTPException(
+                status_code=400, detail=f"Поле {sort_by} для сортировки не найдено"
+            )
 
-            if total_record is None:
-                total_record = 0
+        return getattr(self.model, sort_by)
 
-            if limit == -1:
-                pages = 1
-            else:
-                pages = total_record // limit if total_record % limit == 0 else total_record // limit + 1
+    def _get_primary_key_columns(self) -> list[Any]:
+        """Поля модели, входящие в первичный ключ (включая составной)"""
 
-            return ListDTO[M](
-                page_number=page,
-                page_size=limit if limit != -1 else total_record,
-                total_pages=pages,
-                total_record=total_record,
-                content=[item for item in content]
-            )
-        else:
-            return content
+        mapper = inspect(self.model)
+        return [
+            getattr(self.model, mapper.get_property_by_column(column).key)
+            for column in mapper.primary_key
+        ]
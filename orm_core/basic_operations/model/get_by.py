@@ -1,9 +1,15 @@
+import asyncio
 import logging
-from typing import Any, Literal, Optional, TypeVar, Generic, overload
+from typing import Any, Literal, Optional, Sequence, TypeVar, Generic, overload
 from fastapi import HTTPException
-from sqlalchemy import Select, select
+from sqlalchemy import Select, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import load_only, selectinload, joinedload
+
+from ...cache import MISSING, TTLCache, has_pending_writes
+from .identity import BasicModelIdentityOperations
+from .loader import DataLoader
+from .statements import BasicModelStatementOperations
 
 
 _log = logging.getLogger(__name__)
@@ -12,10 +18,22 @@ _log = logging.getLogger(__name__)
 M = TypeVar('M')
 
 
-class BasicModelGetByOperations(Generic[M]):
+_LOADERS_INFO_KEY = "orm_core_loaders"
+_LOCK_INFO_KEY = "orm_core_loader_lock"
+
+
+class BasicModelGetByOperations(
+        BasicModelIdentityOperations[M],
+        BasicModelStatementOperations[M],
+        Generic[M]
+):
 
     model: type[M]
 
+    batch_get_by: bool = False
+
+    negative_cache: Optional[TTLCache] = None
+
     @overload
     async def get_by(
         self,
@@ -23,6 +41,8 @@ class BasicModelGetByOperations(Generic[M]):
         session: AsyncSession,
         loads: Optional[dict[str, str]] = None,
         is_get_none: Literal[True],
+        columns: Optional[list[str]] = None,
+        read_mode: Literal["orm", "core"] = "orm",
         **kwargs: Any
     ) -> Optional[M]: ...
 
@@ -33,6 +53,8 @@ class BasicModelGetByOperations(Generic[M]):
         session: AsyncSession,
         loads: Optional[dict[str, str]] = None,
         is_get_none: Literal[False] = False,
+        columns: Optional[list[str]] = None,
+        read_mode: Literal["orm", "core"] = "orm",
         **kwargs: Any
     ) -> M: ...
 
@@ -41,6 +63,8 @@ class BasicModelGetByOperations(Generic[M]):
         session: AsyncSession,
         loads: Optional[dict[str, str]] = None,
         is_get_none: bool = False,
+        columns: Optional[list[str]] = None,
+        read_mode: Literal["orm", "core"] = "orm",
         **kwargs: Any
     ) -> Optional[M]:
         """Получение объекта по полям
@@ -49,6 +73,9 @@ class BasicModelGetByOperations(Generic[M]):
             session (AsyncSession): Сессия БД
             loads (Optional[dict[str, str]], optional): Список полей для загрузки. Defaults to None.
             is_get_none (bool, optional): Возвращает None если не найден. Defaults to False.
+            columns (Optional[list[str]], optional): Загружаемые поля модели (load_only). Defaults to None (все колонки).
+            read_mode (Literal["orm", "core"], optional): "core" - выборка только колонок columns без создания
+                экземпляра модели, возвращается словарь колонок, loads не применяется. Defaults to "orm".
             **kwargs: Поля
 
         Raises:
@@ -60,35 +87,234 @@ class BasicModelGetByOperations(Generic[M]):
 
         _log.info("Get by kwargs %s", self.model.__name__)
 
-        query = select(
-            self.model
-        )
-
-        query = query.filter_by(
-            **kwargs
-        )
-
-        if loads is not None:
-            for key, val in loads.items():
-                if val == "s":
-                    query = query.options(
-                        selectinload(getattr(self.model, key))
-                    )
-                elif val == "j":
-                    query = query.options(
-                        joinedload(getattr(self.model, key))
-                    )
-
-        result = await session.execute(query)
-        item = result.scalars().first()
+        identity = self._get_identity(kwargs)
+
+        negative_key = None
+        # Промах в сессии с незафиксированными изменениями (например, после удаления) может не пережить rollback
+        if identity is not None and self.negative_cache is not None and not has_pending_writes(session.sync_session):
+            negative_key = (self.model, tuple(identity.values()))
+
+            if self.negative_cache.get(negative_key) is not MISSING:
+                if is_get_none:
+                    return None
+                raise HTTPException(
+                    status_code=404, detail=f"{self.model.__name__} not found")
+
+        if identity is not None and read_mode == "orm":
+            if self.batch_get_by:
+                item = await self.get_loader(
+                    session=session,
+                    loads=loads,
+                    columns=columns
+                ).load(tuple(identity.values()))
+            else:
+                item = await self._get_by_identity(
+                    session=session,
+                    identity=identity,
+                    loads=loads,
+                    columns=columns
+                )
+
+            if item is None:
+                if negative_key is not None and not has_pending_writes(session.sync_session):
+                    self.negative_cache.set(negative_key, True)  # type: ignore
+                if is_get_none:
+                    return None
+                raise HTTPException(
+                    status_code=404, detail=f"{self.model.__name__} not found")
+
+            return item
+
+        shape, filters, params = self._bind_filters(kwargs)
+
+        def build() -> Select[Any]:
+            query = select(
+                self.model
+            )
+
+            query = query.filter_by(
+                **filters
+            )
+
+            if read_mode == "core":
+                return query.with_only_columns(*[
+                    getattr(self.model, key)
+                    for key in (columns if columns is not None else inspect(self.model).column_attrs.keys())
+                ])
+
+            if loads is not None:
+                for key, val in loads.items():
+                    if val == "s":
+                        query = query.options(
+                            selectinload(getattr(self.model, key))
+                        )
+                    elif val == "j":
+                        query = query.options(
+                            joinedload(getattr(self.model, key))
+                        )
+
+            if columns is not None:
+                query = query.options(
+                    load_only(*[getattr(self.model, key) for key in columns])
+                )
+
+            return query
+
+        if shape is not None:
+            query = self._get_statement(
+                (
+                    "get_by", shape,
+                    tuple(sorted(loads.items())) if loads else None,
+                    tuple(columns) if columns is not None else None,
+                    read_mode
+                ),
+                build
+            )
+        else:
+            query = build()
+
+        result = await session.execute(query, params)
+
+        if read_mode == "core":
+            row = result.mappings().first()
+            item = dict(row) if row is not None else None
+        else:
+            item = result.scalars().first()
 
         if item is None:
+            if negative_key is not None and not has_pending_writes(session.sync_session):
+                self.negative_cache.set(negative_key, True)  # type: ignore
             if is_get_none:
                 return None
             raise HTTPException(
                 status_code=404, detail=f"{self.model.__name__} not found")
 
-        return item
+        return item  # type: ignore
+
+    async def exists(
+        self,
+
+        session: AsyncSession,
+
+        **kwargs: Any
+
+    ) -> bool:
+        """Проверка существования объекта по полям запросом SELECT EXISTS (... LIMIT 1), без загрузки объекта
+
+        Args:
+            session (AsyncSession): Сессия БД
+            **kwargs: Поля
+
+        Returns:
+            bool: Есть ли объект
+        """
+
+        _log.info("Exists %s", self.model.__name__)
+
+        negative_key = None
+        identity = self._get_identity(kwargs)
+        # Промах в сессии с незафиксированными изменениями (например, после удаления) может не пережить rollback
+        if identity is not None and self.negative_cache is not None and not has_pending_writes(session.sync_session):
+            negative_key = (self.model, tuple(identity.values()))
+
+            if self.negative_cache.get(negative_key) is not MISSING:
+                return False
+
+        shape, filters, params = self._bind_filters(kwargs)
+
+        def build() -> Select[Any]:
+            return select(
+                select(self.model).filter_by(**filters).limit(1).exists()
+            )
+
+        if shape is not None:
+            query = self._get_statement(("exists", shape), build)
+        else:
+            query = build()
+
+        result = await session.execute(query, params)
+        is_exists = bool(result.scalar())
+
+        if not is_exists and negative_key is not None and not has_pending_writes(session.sync_session):
+            self.negative_cache.set(negative_key, True)  # type: ignore
+
+        return is_exists
+
+    async def get_many(
+        self,
+
+        session: AsyncSession,
+
+        pks: Sequence[Any],
+
+        loads: Optional[dict[str, str]] = None,
+
+        columns: Optional[list[str]] = None,
+
+    ) -> list[Optional[M]]:
+        """Получение объектов по списку первичных ключей одним запросом IN
+
+        Args:
+            session (AsyncSession): Сессия БД
+            pks (Sequence[Any]): Первичные ключи того же типа, что и поля модели: значения, кортежи (для составного ключа в порядке колонок) или словари
+            loads (Optional[dict[str, str]], optional): Список полей для загрузки. Defaults to None.
+            columns (Optional[list[str]], optional): Загружаемые поля модели (load_only). Defaults to None (все колонки).
+
+        Returns:
+            list[Optional[M]]: Объекты в порядке pks, None для ненайденных
+        """
+
+        _log.info("Get many %s", self.model.__name__)
+
+        return await self._get_many(
+            session=session,
+            pks=pks,
+            loads=loads,
+            columns=columns
+        )
+
+    def get_loader(
+        self,
+        session: AsyncSession,
+        loads: Optional[dict[str, str]] = None,
+        columns: Optional[list[str]] = None
+    ) -> DataLoader[M]:
+        """Загрузчик сессии, объединяющий загрузки по первичному ключу в запросы get_many
+
+        Загрузчик один на сессию, менеджер, loads и columns.
+
+        Args:
+            session (AsyncSession): Сессия БД
+            loads (Optional[dict[str, str]], optional): Список полей для загрузки. Defaults to None.
+            columns (Optional[list[str]], optional): Загружаемые поля модели (load_only). Defaults to None (все колонки).
+
+        Returns:
+            DataLoader[M]: Загрузчик, ключ - значение первичного ключа или кортеж для составного
+        """
+
+        loaders = session.info.setdefault(_LOADERS_INFO_KEY, {})
+        key = (
+            self,
+            tuple(sorted(loads.items())) if loads else None,
+            tuple(columns) if columns is not None else None
+        )
+
+        loader = loaders.get(key)
+        if loader is None:
+            lock = session.info.setdefault(_LOCK_INFO_KEY, asyncio.Lock())
+
+            async def load_many(pks: list[Any]) -> list[Optional[M]]:
+                return await self._get_many(
+                    session=session,
+                    pks=pks,
+                    loads=loads,
+                    columns=columns
+                )
+
+            loader = DataLoader(load_many, lock=lock)
+            loaders[key] = loader
+
+        return loader
 
     @overload
     async def get_by_query(
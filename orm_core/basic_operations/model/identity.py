@@ -0,0 +1,166 @@
+import logging
+from typing import Any, Generic, Optional, Sequence, TypeVar
+from sqlalchemy import inspect, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, selectinload, joinedload
+
+
+_log = logging.getLogger(__name__)
+
+
+M = TypeVar('M')
+
+
+GET_MANY_CHUNK_SIZE = 500
+
+
+class BasicModelIdentityOperations(Generic[M]):
+    """Получение объекта по первичному ключу через identity map сессии"""
+
+    model: type[M]
+
+    def _get_identity(self, filters: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """Первичный ключ из фильтров, если фильтры - ровно полный первичный ключ
+
+        Args:
+            filters (dict[str, Any]): Фильтры по полям
+
+        Returns:
+            Optional[dict[str, Any]]: Первичный ключ по именам полей или None
+        """
+
+        keys = self._get_identity_keys()
+
+        if len(filters) != len(keys):
+            return None
+
+        for key in keys:
+            if filters.get(key) is None:
+                return None
+
+        return {key: filters[key] for key in keys}
+
+    def _get_identity_keys(self) -> list[str]:
+        """Поля первичного ключа в порядке колонок (включая составной ключ)"""
+
+        mapper = inspect(self.model)
+        return [
+            mapper.get_property_by_column(column).key
+            for column in mapper.primary_key
+        ]
+
+    def _get_load_options(
+        self,
+        loads: Optional[dict[str, str]] = None,
+        columns: Optional[list[str]] = None
+    ) -> list[Any]:
+        """Опции загрузки связей и колонок"""
+
+        options: list[Any] = []
+        if loads is not None:
+            for key, val in loads.items():
+                if val == "s":
+                    options.append(selectinload(getattr(self.model, key)))
+                elif val == "j":
+                    options.append(joinedload(getattr(self.model, key)))
+
+        if columns is not None:
+            options.append(
+                load_only(*[getattr(self.model, key) for key in columns]))
+
+        return options
+
+    async def _get_by_identity(
+        self,
+        session: AsyncSession,
+        identity: dict[str, Any],
+        loads: Optional[dict[str, str]] = None,
+        columns: Optional[list[str]] = None
+    ) -> Optional[M]:
+        """Получение объекта через session.get: объект из identity map не запрашивается из БД повторно
+
+        Args:
+            session (AsyncSession): Сессия
+            identity (dict[str, Any]): Первичный ключ
+            loads (Optional[dict[str, str]], optional): Поля для загрузки. Defaults to None.
+            columns (Optional[list[str]], optional): Загружаемые поля модели (load_only). Defaults to None (все колонки).
+
+        Returns:
+            Optional[M]: Объект или None
+        """
+
+        options = self._get_load_options(loads, columns)
+
+        item = await session.get(self.model, identity, options=options)
+
+        if item is None:
+            return None
+
+        # Объект из identity map мог быть загружен без нужных связей или колонок (или с истекшими значениями),
+        # ленивая загрузка в async-сессии невозможна, поэтому они догружаются сразу
+        state = inspect(item)
+        names = [
+            *(loads or {}),
+            *(columns if columns is not None else inspect(self.model).column_attrs.keys())
+        ]
+        unloaded = [name for name in names if name in state.unloaded]
+
+        if unloaded:
+            _log.debug("Load %s attributes %s",
+                       self.model.__name__, unloaded)  # type: ignore
+
+            # Запрос с теми же опциями заполняет незагруженные атрибуты объекта из identity map
+            await session.execute(
+                select(self.model).filter_by(**identity).options(*options)
+            )
+
+        return item
+
+    async def _get_many(
+        self,
+        session: AsyncSession,
+        pks: Sequence[Any],
+        loads: Optional[dict[str, str]] = None,
+        columns: Optional[list[str]] = None,
+        populate_existing: bool = False
+    ) -> list[Optional[M]]:
+        """Загрузка по списку первичных ключей, общая для get_many, загрузчика get_by и edit_many
+
+        populate_existing - перезаписать значения объектов, уже загруженных в сессию (после UPDATE мимо identity map).
+        """
+
+        keys = self._get_identity_keys()
+
+        identities: list[tuple[Any, ...]] = []
+        for pk in pks:
+            if isinstance(pk, dict):
+                identities.append(tuple(pk[key] for key in keys))
+            elif isinstance(pk, (tuple, list)):
+                identities.append(tuple(pk))
+            else:
+                identities.append((pk,))
+
+        unique = list(dict.fromkeys(identities))
+        options = self._get_load_options(loads, columns)
+
+        found: dict[tuple[Any, ...], M] = {}
+        for start in range(0, len(unique), GET_MANY_CHUNK_SIZE):
+            chunk = unique[start:start + GET_MANY_CHUNK_SIZE]
+
+            if len(keys) == 1:
+                condition = getattr(self.model, keys[0]).in_(
+                    [identity[0] for identity in chunk])
+            else:
+                condition = tuple_(
+                    *[getattr(self.model, key) for key in keys]
+                ).in_(chunk)
+
+            stmt = select(self.model).where(condition).options(*options)
+            if populate_existing:
+                stmt = stmt.execution_options(populate_existing=True)
+
+            result = await session.execute(stmt)
+            for item in result.scalars().unique():
+                found[tuple(getattr(item, key) for key in keys)] = item
+
+        return [found.get(identity) for identity in identities]
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+
+_log = logging.getLogger(__name__)
+
+
+M = TypeVar('M')
+
+
+class DataLoader(Generic[M]):
+    """Объединение загрузок по ключу, запрошенных в одном проходе цикла событий, в один запрос
+
+    Ключи, переданные в load до следующего прохода цикла событий, загружаются
+    одним вызовом load_many. Пачки выполняются по очереди под lock,
+    так как одну AsyncSession нельзя использовать из нескольких задач одновременно.
+
+    Example:
+
+        loader = db_client.user.get_loader(session)
+        users = await asyncio.gather(*(loader.load(user_id) for user_id in ids))
+    """
+
+    def __init__(
+        self,
+        load_many: Callable[[list[Any]], Awaitable[list[Optional[M]]]],
+        lock: Optional[asyncio.Lock] = None
+    ) -> None:
+        """Загрузчик с объединением запросов
+
+        Args:
+            load_many (Callable[[list[Any]], Awaitable[list[Optional[M]]]]): Загрузка списка ключей, результаты в порядке ключей
+            lock (Optional[asyncio.Lock], optional): Общий lock сессии. По умолчанию None (свой lock).
+        """
+
+        self.load_many = load_many
+        self.lock = lock if lock is not None else asyncio.Lock()
+
+        self.__pending: dict[Hashable, asyncio.Future[Optional[M]]] = {}
+        self.__tasks: set[asyncio.Task[None]] = set()
+
+        self.batches = 0
+        self.keys = 0
+
+    def load(self, key: Hashable) -> "asyncio.Future[Optional[M]]":
+        """Загрузка объекта по ключу в составе ближайшей пачки
+
+        Args:
+            key (Hashable): Ключ
+
+        Returns:
+            asyncio.Future[Optional[M]]: Объект или None, если не найден
+        """
+
+        future = self.__pending.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        if not self.__pending:
+            loop.call_soon(self.__dispatch)
+
+        future = loop.create_future()
+        self.__pending[key] = future
+        return future
+
+    def __dispatch(self) -> None:
+        pending, self.__pending = self.__pending, {}
+
+        task = asyncio.ensure_future(self.__run(pending))
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+    async def __run(self, pending: dict[Hashable, "asyncio.Future[Optional[M]]"]) -> None:
+        self.batches += 1
+        self.keys += len(pending)
+
+        try:
+            async with self.lock:
+                items = await self.load_many(list(pending))
+        except BaseException as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for future, item in zip(pending.values(), items):
+            if not future.done():
+                future.set_result(item)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Количество пачек и загруженных ключей"""
+
+        return {
+            "batches": self.batches,
+            "keys": self.keys,
+            "keys_per_batch": self.keys / self.batches if self.batches else 0.0,
+        }
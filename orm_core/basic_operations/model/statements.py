@@ -0,0 +1,90 @@
+import logging
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar
+from sqlalchemy import bindparam, inspect
+from sqlalchemy.sql import ClauseElement
+
+from ...cache import MISSING, TTLCache
+
+
+_log = logging.getLogger(__name__)
+
+
+M = TypeVar('M')
+S = TypeVar('S')
+
+
+class BasicModelStatementOperations(Generic[M]):
+    """Повторное использование построенных запросов одной формы
+
+    Запрос строится один раз для формы (поля фильтров, загрузки, сортировка и т.д.),
+    значения передаются параметрами при выполнении. SQLAlchemy запоминает ключ
+    кэша компиляции на объекте запроса, поэтому повторно не считается и он.
+
+    Используется только чтением: get_all (со счетчиком), get_by и exists.
+    Запросы add, edit и delete зависят от переданных значений и строятся заново.
+    """
+
+    model: type[M]
+
+    statement_cache: Optional[TTLCache] = None
+
+    def _get_statement(self, key: Hashable, build: Callable[[], S]) -> S:
+        """Запрос из кэша по форме или построение нового
+
+        Args:
+            key (Hashable): Форма запроса
+            build (Callable[[], S]): Построение запроса
+
+        Returns:
+            S: Запрос
+        """
+
+        if self.statement_cache is None:
+            return build()
+
+        # Модель в ключе - на случай одного кэша на несколько менеджеров
+        key = (self.model, key)
+
+        statement = self.statement_cache.get(key)
+        if statement is MISSING:
+            statement = build()
+            self.statement_cache.set(key, statement)
+
+        return statement
+
+    def _bind_filters(
+        self,
+        filters: dict[str, Any]
+    ) -> tuple[Optional[Hashable], dict[str, Any], dict[str, Any]]:
+        """Замена значений фильтров filter_by на параметры
+
+        Args:
+            filters (dict[str, Any]): Фильтры по полям
+
+        Returns:
+            tuple[Optional[Hashable], dict[str, Any], dict[str, Any]]: Форма фильтров (None - запрос не кэшируется),
+                фильтры для filter_by и значения параметров
+        """
+
+        if self.statement_cache is None:
+            return None, filters, {}
+
+        column_attrs = inspect(self.model).column_attrs
+        for key, value in filters.items():
+            if key not in column_attrs or isinstance(value, ClauseElement):
+                return None, filters, {}
+
+        # None дает IS NULL, а не параметр, поэтому входит в форму
+        shape = tuple(sorted((key, value is None)
+                      for key, value in filters.items()))
+
+        binds: dict[str, Any] = {}
+        params: dict[str, Any] = {}
+        for key, value in filters.items():
+            if value is None:
+                binds[key] = None
+            else:
+                binds[key] = bindparam(f"filter_{key}")
+                params[f"filter_{key}"] = value
+
+        return shape, binds, params
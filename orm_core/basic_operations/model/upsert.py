@@ -0,0 +1,263 @@
+import logging
+from typing import Any, Literal, Optional, Sequence, TypeVar, Generic, Union, overload
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .add import ADD_MANY_CHUNK_SIZE, BasicModelAddOperations
+
+
+_log = logging.getLogger(__name__)
+
+
+M = TypeVar('M')
+
+
+class BasicModelUpsertOperations(BasicModelAddOperations[M], Generic[M]):
+
+    model: type[M]
+    pks: list[str]
+
+    @overload
+    async def upsert(
+        self,
+        *,
+        session: AsyncSession,
+        data: Union[M, dict[str, Any]],
+        conflict_columns: Optional[list[str]] = None,
+        update_columns: Optional[list[str]] = None,
+        loads: Optional[dict[str, str]] = None
+    ) -> M:
+        ...
+
+    @overload
+    async def upsert(
+        self,
+        *,
+        session: AsyncSession,
+        data: Union[M, dict[str, Any]],
+        conflict_columns: Optional[list[str]] = None,
+        update_columns: Optional[list[str]] = None,
+        is_return: Literal[False]
+    ) -> None:
+        ...
+
+    async def upsert(
+        self,
+
+        session: AsyncSession,
+
+        data: Union[M, dict[str, Any]],
+
+        conflict_columns: Optional[list[str]] = None,
+
+        update_columns: Optional[list[str]] = None,
+
+        is_return: bool = True,
+
+        loads: Optional[dict[str, str]] = None
+
+    ) -> Optional[M]:
+        """Создание или обновление объекта одним запросом INSERT ... ON CONFLICT DO UPDATE
+
+        Args:
+            session (AsyncSession): Сессия
+            data (Union[M, dict[str, Any]]): Объект или словарь значений колонок
+            conflict_columns (Optional[list[str]], optional): Поля уникального ограничения для ON CONFLICT. По умолчанию первичные ключи.
+            update_columns (Optional[list[str]], optional): Поля, обновляемые при конфликте. По умолчанию все переданные поля, кроме conflict_columns.
+            is_return (bool, optional): Возвращать ли объект. По умолчанию возвращается.
+            loads (Optional[dict[str, str]], optional): Список полей для дополнительной загрузки. По умолчанию не загружается.
+
+        Raises:
+            NotImplementedError: Диалект БД не поддерживает ON CONFLICT (поддерживаются Postgres и SQLite)
+
+        Returns:
+            Optional[M]: Созданный или обновленный объект
+
+
+        Example:
+
+            user = await db_client.user.upsert(
+                session=session,
+                data={"email": "user@mail.ru", "name": "user"},
+                conflict_columns=["email"],
+                update_columns=["name"]
+            )
+        """
+
+        _log.debug("Upsert model %s", self.model.__name__)
+
+        models = await self.upsert_many(
+            session=session,
+            data=[data],
+            conflict_columns=conflict_columns,
+            update_columns=update_columns,
+            is_return=is_return,
+            loads=loads
+        )
+
+        if models is None:
+            return None
+
+        return models[0]
+
+    @overload
+    async def upsert_many(
+        self,
+        *,
+        session: AsyncSession,
+        data: Sequence[Union[M, dict[str, Any]]],
+        conflict_columns: Optional[list[str]] = None,
+        update_columns: Optional[list[str]] = None,
+        loads: Optional[dict[str, str]] = None,
+        chunk_size: int = ADD_MANY_CHUNK_SIZE
+    ) -> list[M]:
+        ...
+
+    @overload
+    async def upsert_many(
+        self,
+        *,
+        session: AsyncSession,
+        data: Sequence[Union[M, dict[str, Any]]],
+        conflict_columns: Optional[list[str]] = None,
+        update_columns: Optional[list[str]] = None,
+        is_return: Literal[False],
+        chunk_size: int = ADD_MANY_CHUNK_SIZE
+    ) -> None:
+        ...
+
+    async def upsert_many(
+        self,
+
+        session: AsyncSession,
+
+        data: Sequence[Union[M, dict[str, Any]]],
+
+        conflict_columns: Optional[list[str]] = None,
+
+        update_columns: Optional[list[str]] = None,
+
+        is_return: bool = True,
+
+        loads: Optional[dict[str, str]] = None,
+
+        chunk_size: int = ADD_MANY_CHUNK_SIZE
+
+    ) -> Optional[list[M]]:
+        """Создание или обновление объектов многострочным INSERT ... ON CONFLICT DO UPDATE по chunk_size строк
+
+        Объекты в сессии с теми же первичными ключами обновляются значениями из RETURNING.
+        В одном chunk не должно быть двух строк с одинаковыми значениями conflict_columns
+        (Postgres не обновляет одну строку дважды в одном запросе).
+
+        Args:
+            session (AsyncSession): Сессия
+            data (Sequence[Union[M, dict[str, Any]]]): Объекты или словари значений колонок
+            conflict_columns (Optional[list[str]], optional): Поля уникального ограничения для ON CONFLICT. По умолчанию первичные ключи.
+            update_columns (Optional[list[str]], optional): Поля, обновляемые при конфликте. По умолчанию все переданные в строке поля, кроме conflict_columns
+                (строки с разными наборами полей записываются отдельными запросами). Из явно переданных обновляются только поля, которые есть в строке.
+            is_return (bool, optional): Возвращать ли объекты. По умолчанию возвращаются.
+            loads (Optional[dict[str, str]], optional): Список полей для дополнительной загрузки (один запрос IN на chunk). По умолчанию не загружается.
+            chunk_size (int, optional): Количество строк в одном запросе. По умолчанию ADD_MANY_CHUNK_SIZE.
+
+        Raises:
+            NotImplementedError: Диалект БД не поддерживает ON CONFLICT (поддерживаются Postgres и SQLite)
+
+        Returns:
+            Optional[list[M]]: Объекты в порядке data
+
+
+        Example:
+
+            users = await db_client.user.upsert_many(
+                session=session,
+                data=[{"id": 1, "name": "user1"}, {"id": 2, "name": "user2"}],
+                update_columns=["name"]
+            )
+        """
+
+        _log.debug("Upsert many model %s", self.model.__name__)
+
+        values = [self._get_insert_values(item) for item in data]
+
+        if not values:
+            return [] if is_return else None
+
+        dialect_name = session.get_bind().dialect.name
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect_name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            raise NotImplementedError(
+                f"Upsert не поддерживается для {dialect_name}")
+
+        if conflict_columns is None:
+            conflict_columns = self.pks
+
+        columns = inspect(self.model).columns
+
+        # Строка обновляет только свои поля: строки с разными наборами полей пишутся отдельными запросами,
+        # иначе отсутствующее в строке поле перезаписывается значением по умолчанию
+        groups: dict[frozenset[str], list[int]] = {}
+        for index, item in enumerate(values):
+            groups.setdefault(frozenset(item), []).append(index)
+
+        models: list[Optional[M]] = [None] * len(values)
+        for keys, indexes in groups.items():
+            # Явные update_columns ограничиваются полями группы: поле, которого нет в строках,
+            # обновилось бы значением по умолчанию
+            if update_columns is None:
+                group_update_columns = [
+                    key for key in values[indexes[0]]
+                    if key not in conflict_columns
+                ]
+            else:
+                group_update_columns = [
+                    key for key in update_columns
+                    if key in keys
+                ]
+
+            stmt = insert(self.model)
+
+            # Без обновляемых полей выполняется обновление поля конфликта тем же значением:
+            # DO NOTHING не возвращает существующую строку в RETURNING
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[columns[key] for key in conflict_columns],
+                set_={
+                    columns[key].name: stmt.excluded[columns[key].name]
+                    for key in group_update_columns or conflict_columns
+                }
+            )
+
+            for start in range(0, len(indexes), chunk_size):
+                chunk_indexes = indexes[start:start + chunk_size]
+                chunk = [values[index] for index in chunk_indexes]
+
+                if not is_return:
+                    await session.execute(stmt, chunk)
+                    continue
+
+                r = await session.scalars(
+                    stmt.returning(
+                        self.model, sort_by_parameter_order=len(chunk) > 1
+                    ).execution_options(populate_existing=True),
+                    chunk
+                )
+                chunk_models = list(r.all())
+
+                if loads:
+                    await self._get_many(
+                        session=session,
+                        pks=[inspect(model).identity for model in chunk_models],
+                        loads=loads,
+                        populate_existing=True
+                    )
+
+                for index, model in zip(chunk_indexes, chunk_models):
+                    models[index] = model
+
+        if not is_return:
+            return None
+
+        return models  # type: ignore
@@ -2,14 +2,21 @@ import logging
 from typing import Any, Generic, Optional, TypeVar
 
 from pydantic import BaseModel
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Table
 from sqlalchemy.orm import class_mapper
 
+from ...cache import TTLCache, register_identity_cache, register_table_cache
+from ...search import SearchBackend
+from ...single_flight import SingleFlight
+
 from .add import BasicAddSchemeOperations
 from .get_by import BasicGetBySchemeOperations
 from .get_all import BasicGetAllSchemeOperations
 from .edit import BasicEditSchemeOperations
 from .delete import BasicDeleteSchemeOperations
+from .upsert import BasicUpsertSchemeOperations
+from .projection import get_unmapped_field
+from ..model.bulk import BasicModelBulkOperations
 
 
 _log = logging.getLogger(__name__)
@@ -22,11 +29,13 @@ O = TypeVar('O', bound=BaseModel, default=Any)
 
 
 class ManagerModelSchemes(
+    BasicUpsertSchemeOperations[M, A, E, O],
     BasicAddSchemeOperations[M, A, E, O],
     BasicGetBySchemeOperations[M, A, E, O],
     BasicGetAllSchemeOperations[M, A, E, O],
     BasicEditSchemeOperations[M, A, E, O],
     BasicDeleteSchemeOperations[M, A, E, O],
+    BasicModelBulkOperations[M],
     Generic[M, A, E, O],
 ):
     """Менеджер для работы со схемами и моделями
@@ -37,6 +46,8 @@ class ManagerModelSchemes(
         BasicGetAllSchemeOperations (_type_): Получение всех объектов
         BasicEditSchemeOperations (_type_): Редактирование объекта
         BasicDeleteSchemeOperations (_type_): Удаление объекта
+        BasicModelBulkOperations (_type_): Массовая загрузка строк
+        BasicUpsertSchemeOperations (_type_): Создание или обновление объекта
     """
 
     def __init__(
@@ -44,7 +55,14 @@ class ManagerModelSchemes(
         model: type[M],
         add_scheme: type[A],
         edit_scheme: type[E],
-        out_scheme: type[O]
+        out_scheme: type[O],
+        count_cache: Optional[TTLCache] = None,
+        search_backend: Optional[SearchBackend] = None,
+        statement_cache: Optional[TTLCache] = None,
+        batch_get_by: bool = False,
+        negative_cache: Optional[TTLCache] = None,
+        object_cache: Optional[TTLCache] = None,
+        single_flight: Optional[SingleFlight] = None
     ) -> None:
         """Менеджер для работы со схемами и моделями 
 
@@ -53,6 +71,13 @@ class ManagerModelSchemes(
             add_scheme (type[A]): Схема добавления
             edit_scheme (type[E]): Схема редактирования
             out_scheme (type[O]): Схема вывода
+            count_cache (Optional[TTLCache], optional): Кэш total_record для get_all, сбрасывается при записи в таблицу. По умолчанию None.
+            search_backend (Optional[SearchBackend], optional): Стратегия поиска для get_all. По умолчанию None (ILIKE по подстроке).
+            statement_cache (Optional[TTLCache], optional): Кэш построенных запросов чтения get_all, get_by и exists по форме запроса (значения передаются параметрами); add, edit и delete строят запросы заново. По умолчанию None.
+            batch_get_by (bool, optional): Объединять get_by по первичному ключу, вызванные в одной сессии в одном проходе цикла событий, в один запрос get_many. По умолчанию False.
+            negative_cache (Optional[TTLCache], optional): Кэш ненайденных по первичному ключу объектов для get_by (ответ 404 без запроса к БД), запись удаляется при добавлении объекта с этим ключом. По умолчанию None.
+            object_cache (Optional[TTLCache], optional): Кэш результатов get_by по первичному ключу (схемы вывода), сбрасывается при записи в таблицу модели и загружаемых связей. По умолчанию None.
+            single_flight (Optional[SingleFlight], optional): Объединение одинаковых одновременных чтений схем (get_by и get_all с is_model=False) в один запрос к БД. По умолчанию None.
         """
 
         self.model = model
@@ -71,6 +96,20 @@ class ManagerModelSchemes(
         mapper = class_mapper(self.model)
         self.attrs_rel: dict[str, str] = {}
 
+        self.count_cache = count_cache
+        if count_cache is not None:
+            register_table_cache(mapper.tables, count_cache)
+
+        if search_backend is not None:
+            self.search_backend = search_backend
+
+        self.statement_cache = statement_cache
+        self.batch_get_by = batch_get_by
+
+        self.negative_cache = negative_cache
+        if negative_cache is not None:
+            register_identity_cache(mapper.tables, negative_cache)
+
         self.type_cols: dict[str, Any] = {}
         for attr in mapper.columns:
             self.type_cols[attr.key] = attr.type.python_type
@@ -91,3 +130,26 @@ class ManagerModelSchemes(
                     self.loads[key] = "s"
                 elif val == "MANYTOONE" or val == "ONETOONE":
                     self.loads[key] = "j"
+
+        # Колонки, которые есть в схеме вывода: остальные (большие Text/JSON/LargeBinary) не читаются
+        attrs_visible = set(self.attrs_out_scheme) | set(self.out_scheme.model_fields)
+        self.columns_out_scheme: Optional[list[str]] = [
+            key for key in mapper.column_attrs.keys() if key in attrs_visible
+        ]
+        if len(self.columns_out_scheme) == len(mapper.column_attrs):
+            self.columns_out_scheme = None
+        # Свойство Python или hybrid_property в схеме может читать любые колонки
+        elif get_unmapped_field(mapper, self.out_scheme.model_fields) is not None:
+            self.columns_out_scheme = None
+
+        # Кэшированная схема вывода включает загруженные связи, поэтому кэш сбрасывается и при записи в их таблицы
+        self.object_cache = object_cache
+        if object_cache is not None:
+            tables = list(mapper.tables)
+            for rel in mapper.relationships:
+                tables.extend(rel.mapper.tables)
+                if isinstance(rel.secondary, Table):
+                    tables.append(rel.secondary)
+            register_table_cache(tables, object_cache)
+
+        self.single_flight = single_flight
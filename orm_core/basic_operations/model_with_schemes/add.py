@@ -1,10 +1,12 @@
 import logging
-from typing import Any, Literal, Optional, TypeVar, Generic, Union, overload
+from typing import Any, Literal, Optional, Sequence, TypeVar, Generic, Union, overload
 from pydantic import BaseModel
 from sqlalchemy import Select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from ..model.add import BasicModelAddOperations
+from ..model.add import ADD_MANY_CHUNK_SIZE, BasicModelAddOperations
+from ..model.coalescer import ADD_COALESCER_BATCH_SIZE, ADD_COALESCER_DELAY, AddCoalescer
+from .projection import get_list_adapter
 
 
 _log = logging.getLogger(__name__)
@@ -32,6 +34,7 @@ class BasicAddSchemeOperations(BasicModelAddOperations[M], Generic[M, A, E, O]):
         *,
         session: AsyncSession,
         data: Union[A, M, dict[str, Any]],
+        write_mode: Literal["orm", "returning"] = "orm"
     ) -> M: ...
 
     @overload
@@ -40,7 +43,8 @@ class BasicAddSchemeOperations(BasicModelAddOperations[M], Generic[M, A, E, O]):
         *,
         session: AsyncSession,
         data: Union[A, M, dict[str, Any]],
-        loads: dict[str, str]
+        loads: dict[str, str],
+        write_mode: Literal["orm", "returning"] = "orm"
     ) -> M:
         ...
 
@@ -50,7 +54,8 @@ class BasicAddSchemeOperations(BasicModelAddOperations[M], Generic[M, A, E, O]):
         *,
         session: AsyncSession,
         data: Union[A, M, dict[str, Any]],
-        return_query: Select[Any]
+        return_query: Select[Any],
+        write_mode: Literal["orm", "returning"] = "orm"
     ) -> M: ...
 
     @overload
@@ -59,7 +64,8 @@ class BasicAddSchemeOperations(BasicModelAddOperations[M], Generic[M, A, E, O]):
         *,
         session: AsyncSession,
         data: Union[A, M, dict[str, Any]],
-        is_return: Literal[False] = False
+        is_return: Literal[False] = False,
+        write_mode: Literal["orm", "returning"] = "orm"
     ) -> None:
         ...
 
@@ -71,7 +77,8 @@ class BasicAddSchemeOperations(BasicModelAddOperations[M], Generic[M, A, E, O]):
         data: Union[A, M, dict[str, Any]],
         is_return: bool = True,
         loads: Optional[dict[str, str]] = None,
-        return_query: Optional[Select[Any]] = None
+        return_query: Optional[Select[Any]] = None,
+        write_mode: Literal["orm", "returning"] = "orm"
     ) -> Optional[M]:
         ...
 
@@ -81,7 +88,8 @@ class BasicAddSchemeOperations(BasicModelAddOperations[M], Generic[M, A, E, O]):
         *,
         session: AsyncSession,
         data: Union[A, M, dict[str, Any]],
-        is_model: Literal[False]
+        is_model: Literal[False],
+        write_mode: Literal["orm", "returning"] = "orm"
     ) -> O: ...
 
     @overload
@@ -91,7 +99,8 @@ class BasicAddSchemeOperations(BasicModelAddOperations[M], Generic[M, A, E, O]):
         session: AsyncSession,
         data: Union[A, M, dict[str, Any]],
         loads: dict[str, str],
-        is_model: Literal[False]
+        is_model: Literal[False],
+        write_mode: Literal["orm", "returning"] = "orm"
     ) -> O:
         ...
 
@@ -102,7 +111,8 @@ class BasicAddSchemeOperations(BasicModelAddOperations[M], Generic[M, A, E, O]):
         session: AsyncSession,
         data: Union[A, M, dict[str, Any]],
         return_query: Select[Any],
-        is_model: Literal[False]
+        is_model: Literal[False],
+        write_mode: Literal["orm", "returning"] = "orm"
     ) -> O: ...
 
     @overload
@@ -112,7 +122,8 @@ class BasicAddSchemeOperations(BasicModelAddOperations[M], Generic[M, A, E, O]):
         session: AsyncSession,
         data: Union[A, M, dict[str, Any]],
         is_return: Literal[False] = False,
-        is_model: Literal[False]
+        is_model: Literal[False],
+        write_mode: Literal["orm", "returning"] = "orm"
     ) -> None:
         ...
 
@@ -125,7 +136,8 @@ class BasicAddSchemeOperations(BasicModelAddOperations[M], Generic[M, A, E, O]):
         is_return: bool = True,
         loads: Optional[dict[str, str]] = None,
         return_query: Optional[Select[Any]] = None,
-        is_model: Literal[False]
+        is_model: Literal[False],
+        write_mode: Literal["orm", "returning"] = "orm"
     ) -> Optional[O]:
         ...
 
@@ -144,7 +156,9 @@ class BasicAddSchemeOperations(BasicModelAddOperations[M], Generic[M, A, E, O]):
 
         loads: Optional[dict[str, str]] = None,
 
-        return_query: Union[Select[Any], None] = None
+        return_query: Union[Select[Any], None] = None,
+
+        write_mode: Literal["orm", "returning"] = "orm"
 
     ) -> Union[M, O, None]:
         """Создание объекта
@@ -156,6 +170,7 @@ class BasicAddSchemeOperations(BasicModelAddOperations[M], Generic[M, A, E, O]):
             is_model (bool, optional): Возвращать ли модель. Defaults to True.
             loads (Optional[dict[str, str]], optional): Список полей для загрузки связанных объектов. Defaults to None.
             return_query (Union[Select[Any], None], optional): Кастомный запрос для возврата. Defaults to None.
+            write_mode (Literal["orm", "returning"], optional): "returning" - один запрос INSERT ... RETURNING без повторного SELECT. Defaults to "orm".
 
         Returns:
             Union[M, O, None]: Добавленный объект
@@ -178,7 +193,8 @@ class BasicAddSchemeOperations(BasicModelAddOperations[M], Generic[M, A, E, O]):
             data=model,
             is_return=is_return,
             loads=loads,
-            return_query=return_query
+            return_query=return_query,
+            write_mode=write_mode
         )
 
         if not is_return:
@@ -188,3 +204,140 @@ class BasicAddSchemeOperations(BasicModelAddOperations[M], Generic[M, A, E, O]):
             return return_model
 
         return self.out_scheme.model_validate(return_model)
+
+    @overload
+    async def add_many(
+        self,
+        *,
+        session: AsyncSession,
+        data: Sequence[Union[A, M, dict[str, Any]]],
+        loads: Optional[dict[str, str]] = None,
+        chunk_size: int = ADD_MANY_CHUNK_SIZE
+    ) -> list[M]: ...
+
+    @overload
+    async def add_many(
+        self,
+        *,
+        session: AsyncSession,
+        data: Sequence[Union[A, M, dict[str, Any]]],
+        is_return: Literal[False],
+        chunk_size: int = ADD_MANY_CHUNK_SIZE
+    ) -> None: ...
+
+    @overload
+    async def add_many(
+        self,
+        *,
+        session: AsyncSession,
+        data: Sequence[Union[A, M, dict[str, Any]]],
+        loads: Optional[dict[str, str]] = None,
+        is_model: Literal[False],
+        chunk_size: int = ADD_MANY_CHUNK_SIZE
+    ) -> list[O]: ...
+
+    async def add_many(
+        self,
+
+        *,
+
+        session: AsyncSession,
+
+        data: Sequence[Union[A, M, dict[str, Any]]],
+
+        is_return: bool = True,
+
+        is_model: bool = True,
+
+        loads: Optional[dict[str, str]] = None,
+
+        chunk_size: int = ADD_MANY_CHUNK_SIZE
+
+    ) -> Union[list[M], list[O], None]:
+        """Создание объектов многострочным INSERT ... RETURNING по chunk_size строк
+
+        Args:
+            session (AsyncSession): Сессия
+            data (Sequence[Union[A, M, dict[str, Any]]]): Данные для создания
+            is_return (bool, optional): Возвращать ли объекты. Defaults to True.
+            is_model (bool, optional): Возвращать ли модели. Defaults to True.
+            loads (Optional[dict[str, str]], optional): Список полей для загрузки связанных объектов. Defaults to None.
+            chunk_size (int, optional): Количество строк в одном INSERT. Defaults to ADD_MANY_CHUNK_SIZE.
+
+        Returns:
+            Union[list[M], list[O], None]: Добавленные объекты в порядке data
+        """
+
+        _log.info("Add many %s", self.model.__name__)
+
+        values: list[Union[M, dict[str, Any]]] = []
+        for item in data:
+            if isinstance(item, (self.model, dict)):
+                values.append(item)  # type: ignore
+            else:
+                values.append(item.model_dump())  # type: ignore
+
+        if loads is None and not is_model:
+            loads = self.loads
+
+        models = await super().add_many(
+            session=session,
+            data=values,
+            is_return=is_return,
+            loads=loads,
+            chunk_size=chunk_size
+        )
+
+        if models is None:
+            return None
+
+        if is_model:
+            return models
+
+        return get_list_adapter(self.out_scheme).validate_python(models, from_attributes=True)
+
+    def get_add_coalescer(
+        self,
+
+        session_factory: async_sessionmaker[AsyncSession],
+
+        max_batch_size: int = ADD_COALESCER_BATCH_SIZE,
+
+        max_delay: float = ADD_COALESCER_DELAY,
+
+        loads: Optional[dict[str, str]] = None,
+
+    ) -> AddCoalescer[O]:  # type: ignore[override]
+        """Объединение одновременных add в многострочные INSERT, результат - схемы вывода
+
+        Args:
+            session_factory (async_sessionmaker[AsyncSession]): Фабрика сессий для записи пачек
+            max_batch_size (int, optional): Максимум строк в пачке. Defaults to ADD_COALESCER_BATCH_SIZE.
+            max_delay (float, optional): Максимальное ожидание пачки в секундах. Defaults to ADD_COALESCER_DELAY.
+            loads (Optional[dict[str, str]], optional): Список полей для загрузки связанных объектов. Defaults to None (loads менеджера).
+
+        Returns:
+            AddCoalescer[O]: Объединитель вызовов, создается один раз на приложение
+        """
+
+        if loads is None:
+            loads = self.loads
+
+        adapter = get_list_adapter(self.out_scheme)
+
+        def convert(models: list[M]) -> list[O]:
+            return adapter.validate_python(models, from_attributes=True)
+
+        async def write_many(data: list[Any]) -> list[Any]:
+            return await self._write_coalesced(
+                session_factory=session_factory,
+                data=data,
+                loads=loads,
+                convert=convert
+            )
+
+        return AddCoalescer(
+            write_many,
+            max_batch_size=max_batch_size,
+            max_delay=max_delay
+        )
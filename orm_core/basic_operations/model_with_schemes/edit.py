@@ -1,10 +1,12 @@
 import logging
-from typing import Any, Literal, Optional, TypeVar, Generic, Union, overload
+from typing import Any, Literal, Optional, Sequence, TypeVar, Generic, Union, overload
 from pydantic import BaseModel
-from sqlalchemy import Select
+from sqlalchemy import ColumnElement, Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..model.edit import BasicModelEditOperations
+from ...base_schemes import EditManyDTO
+from ..model.edit import EDIT_MANY_CHUNK_SIZE, BasicModelEditOperations
+from .projection import get_list_adapter
 
 
 _log = logging.getLogger(__name__)
@@ -47,6 +49,8 @@ class BasicEditSchemeOperations(
 
         is_model: bool = True,
 
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
         **pks: Any
 
     ) -> None: ...
@@ -69,6 +73,8 @@ class BasicEditSchemeOperations(
 
         is_model: Literal[True] = True,
 
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
         **pks: Any
 
     ) -> M: ...
@@ -91,6 +97,8 @@ class BasicEditSchemeOperations(
 
         is_model: Literal[True] = True,
 
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
         **pks: Any
 
     ) -> Optional[M]: ...
@@ -113,6 +121,8 @@ class BasicEditSchemeOperations(
 
         is_model: Literal[False] = False,
 
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
         **pks: Any
 
     ) -> O: ...
@@ -135,6 +145,8 @@ class BasicEditSchemeOperations(
 
         is_model: Literal[False] = False,
 
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
         **pks: Any
 
     ) -> Optional[O]: ...
@@ -157,6 +169,8 @@ class BasicEditSchemeOperations(
 
         is_model: Literal[True] = True,
 
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
         **pks: Any
 
     ) -> Optional[M]: ...
@@ -179,6 +193,8 @@ class BasicEditSchemeOperations(
 
         is_model: Literal[False] = False,
 
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
         **pks: Any
 
     ) -> Optional[O]: ...
@@ -201,6 +217,8 @@ class BasicEditSchemeOperations(
 
         is_model: bool,
 
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
         **pks: Any
 
     ) -> Union[M, O, None]: ...
@@ -222,6 +240,8 @@ class BasicEditSchemeOperations(
 
         is_model: bool = True,
 
+        write_mode: Literal["orm", "returning", "direct"] = "orm",
+
         **pks: Any
 
     ) -> Union[M, O, None]:
@@ -235,6 +255,7 @@ class BasicEditSchemeOperations(
             return_query (Optional[Select[Any]], optional): Запрос для возврата. По умолчанию None.
             is_get_none (bool, optional): Возвращает None, если не найден. По умолчанию True.
             is_model (bool, optional): _Возвращает ли объекта в виде модели или схемы. По умолчанию True.
+            write_mode (Literal["orm", "returning", "direct"], optional): "returning" - один запрос UPDATE ... WHERE pk RETURNING без повторного SELECT, "direct" - один UPDATE только с полями edit_item и чтение только при is_return. По умолчанию "orm".
 
 
         Returns:
@@ -251,6 +272,7 @@ class BasicEditSchemeOperations(
             is_return=is_return,
             return_query=return_query,
             is_get_none=is_get_none,
+            write_mode=write_mode,
             **pks
         )
 
@@ -261,3 +283,127 @@ class BasicEditSchemeOperations(
             return None
 
         return self.out_scheme.model_validate(return_model)
+
+    @overload
+    async def edit_many(
+        self,
+        *,
+        session: AsyncSession,
+        where: Union[dict[str, Any], ColumnElement[bool]],
+        values: dict[str, Any],
+        is_return: bool = False,
+        loads: Optional[dict[str, str]] = None
+    ) -> EditManyDTO[M]: ...
+
+    @overload
+    async def edit_many(
+        self,
+        *,
+        session: AsyncSession,
+        items: Sequence[Union[dict[str, Any], BaseModel]],
+        is_return: bool = False,
+        loads: Optional[dict[str, str]] = None,
+        chunk_size: int = EDIT_MANY_CHUNK_SIZE
+    ) -> EditManyDTO[M]: ...
+
+    @overload
+    async def edit_many(
+        self,
+        *,
+        session: AsyncSession,
+        where: Union[dict[str, Any], ColumnElement[bool]],
+        values: dict[str, Any],
+        is_return: Literal[True],
+        loads: Optional[dict[str, str]] = None,
+        is_model: Literal[False]
+    ) -> EditManyDTO[O]: ...
+
+    @overload
+    async def edit_many(
+        self,
+        *,
+        session: AsyncSession,
+        items: Sequence[Union[dict[str, Any], BaseModel]],
+        is_return: Literal[True],
+        loads: Optional[dict[str, str]] = None,
+        chunk_size: int = EDIT_MANY_CHUNK_SIZE,
+        is_model: Literal[False]
+    ) -> EditManyDTO[O]: ...
+
+    async def edit_many(
+        self,
+
+        *,
+
+        session: AsyncSession,
+
+        where: Union[dict[str, Any], ColumnElement[bool], None] = None,
+
+        values: Optional[dict[str, Any]] = None,
+
+        items: Optional[Sequence[Union[dict[str, Any], BaseModel]]] = None,
+
+        is_return: bool = False,
+
+        is_model: bool = True,
+
+        loads: Optional[dict[str, str]] = None,
+
+        chunk_size: int = EDIT_MANY_CHUNK_SIZE
+
+    ) -> Union[EditManyDTO[M], EditManyDTO[O]]:
+        """Изменение многих строк: по условию (where и values) или по первичному ключу (items)
+
+        Args:
+            session (AsyncSession): Сессия
+            where (Union[dict[str, Any], ColumnElement[bool], None], optional): Условие. По умолчанию None.
+            values (Optional[dict[str, Any]], optional): Новые значения полей. По умолчанию None.
+            items (Optional[Sequence[Union[dict[str, Any], BaseModel]]], optional): Строки {первичный ключ..., "changes": ...},
+                changes - словарь или схема редактирования (учитываются только заданные поля). По умолчанию None.
+            is_return (bool, optional): Возвращать ли объекты. По умолчанию False.
+            is_model (bool, optional): Возвращать ли объекты в виде модели или схемы. По умолчанию True.
+            loads (Optional[dict[str, str]], optional): Список полей для загрузки связанных объектов. По умолчанию None.
+            chunk_size (int, optional): Количество строк items в одной пачке. По умолчанию EDIT_MANY_CHUNK_SIZE.
+
+        Returns:
+            Union[EditManyDTO[M], EditManyDTO[O]]: Количество измененных строк и объекты
+        """
+
+        _log.info("Edit many %s", self.model.__name__)
+
+        items_dicts: Optional[list[dict[str, Any]]] = None
+        if items is not None:
+            items_dicts = []
+            for item in items:
+                if isinstance(item, BaseModel):
+                    item = item.model_dump(exclude_unset=True)
+
+                changes = item.get("changes")
+                if isinstance(changes, BaseModel):
+                    item = {**item, "changes": changes.model_dump(exclude_unset=True)}
+
+                items_dicts.append(item)
+
+        if loads is None and not is_model:
+            loads = self.loads
+
+        result = await super().edit_many(
+            session=session,
+            where=where,
+            values=values,
+            items=items_dicts,
+            is_return=is_return,
+            loads=loads,
+            chunk_size=chunk_size
+        )
+
+        if is_model or result.content is None:
+            return result
+
+        schemes = iter(get_list_adapter(self.out_scheme).validate_python(
+            [model for model in result.content if model is not None], from_attributes=True))
+
+        return EditManyDTO[O](
+            rowcount=result.rowcount,
+            content=[next(schemes) if model is not None else None for model in result.content]
+        )
@@ -1,12 +1,15 @@
 import logging
-from typing import Any, Literal, Optional, Sequence, TypeVar, Generic, Union, overload
+from typing import Any, AsyncIterator, Literal, Optional, Sequence, TypeVar, Generic, Union, overload
 from pydantic import BaseModel
 from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...base_schemes import ListDTO
+from ...base_schemes import CursorListDTO, ListDTO
+from ...cache import has_pending_writes
+from ...single_flight import SingleFlight, make_flight_key
 
 from ..model.get_all import BasicModelGetAllOperations
+from .projection import BasicProjectionSchemeOperations, get_list_adapter
 
 
 _log = logging.getLogger(__name__)
@@ -20,6 +23,7 @@ O = TypeVar('O', bound=BaseModel, default=Any)
 
 class BasicGetAllSchemeOperations(
         BasicModelGetAllOperations[M],
+        BasicProjectionSchemeOperations[M, O],
         Generic[M, A, E, O]
 ):
 
@@ -31,6 +35,8 @@ class BasicGetAllSchemeOperations(
     pks: list[str]
     loads: dict[str, str]
 
+    single_flight: Optional[SingleFlight] = None
+
     @overload
     async def get_all(
         self,
@@ -55,6 +61,12 @@ class BasicGetAllSchemeOperations(
 
         is_pagination: Literal[False] = False,
 
+        count_strategy: Literal["query", "window"] = "query",
+
+        count_mode: Literal["exact", "estimate", "capped"] = "exact",
+
+        count_cap: int = 1000,
+
         **kwargs: Any
 
     ) -> Sequence[M]:
@@ -84,6 +96,12 @@ class BasicGetAllSchemeOperations(
 
         is_pagination: Literal[True] = True,
 
+        count_strategy: Literal["query", "window"] = "query",
+
+        count_mode: Literal["exact", "estimate", "capped"] = "exact",
+
+        count_cap: int = 1000,
+
         **kwargs: Any
 
     ) -> ListDTO[M]:
@@ -113,8 +131,20 @@ class BasicGetAllSchemeOperations(
 
         is_pagination: Literal[True] = True,
 
+        count_strategy: Literal["query", "window"] = "query",
+
+        count_mode: Literal["exact", "estimate", "capped"] = "exact",
+
+        count_cap: int = 1000,
+
         is_model: Literal[False] = False,
 
+        fields: Optional[list[str]] = None,
+
+        read_mode: Literal["orm", "core"] = "orm",
+
+        is_single_flight: bool = True,
+
         **kwargs: Any
 
     ) -> ListDTO[O]:
@@ -144,8 +174,20 @@ class BasicGetAllSchemeOperations(
 
         is_pagination: Literal[False] = False,
 
+        count_strategy: Literal["query", "window"] = "query",
+
+        count_mode: Literal["exact", "estimate", "capped"] = "exact",
+
+        count_cap: int = 1000,
+
         is_model: Literal[False] = False,
 
+        fields: Optional[list[str]] = None,
+
+        read_mode: Literal["orm", "core"] = "orm",
+
+        is_single_flight: bool = True,
+
         **kwargs: Any
 
     ) -> Sequence[M]:
@@ -174,8 +216,20 @@ class BasicGetAllSchemeOperations(
 
         is_pagination: bool = True,
 
+        count_strategy: Literal["query", "window"] = "query",
+
+        count_mode: Literal["exact", "estimate", "capped"] = "exact",
+
+        count_cap: int = 1000,
+
         is_model: bool = True,
 
+        fields: Optional[list[str]] = None,
+
+        read_mode: Literal["orm", "core"] = "orm",
+
+        is_single_flight: bool = True,
+
         **kwargs: Any
 
     ) -> Union[ListDTO[M], Sequence[M], ListDTO[O], Sequence[O]]:
@@ -192,16 +246,62 @@ class BasicGetAllSchemeOperations(
             page (int, optional): Номер страницы. По умолчанию 1
             limit (int, optional): Количество элементов на странице. По умолчанию -1
             is_pagination (bool, optional): Пагинация. По умолчанию True
+            count_strategy (Literal["query", "window"], optional): Подсчет total_record отдельным запросом или через count(*) OVER (). По умолчанию "query"
+            count_mode (Literal["exact", "estimate", "capped"], optional): Точный подсчет total_record, оценка или подсчет не более count_cap строк. По умолчанию "exact"
+            count_cap (int, optional): Максимум считаемых строк для count_mode="capped". По умолчанию 1000
             is_model (bool, optional): Возвращение объекта в виде модели или схемы. По умолчанию True
+            fields (Optional[list[str]], optional): Поля схемы вывода, только они читаются из БД и попадают в ответ (при is_model=False). По умолчанию None (все поля схемы вывода)
+            read_mode (Literal["orm", "core"], optional): "core" - схемы строятся из строк без создания моделей (при is_model=False и без загрузки связей). По умолчанию "orm"
+            is_single_flight (bool, optional): Объединять ли одинаковые одновременные чтения через single_flight менеджера (при is_model=False). По умолчанию True
             **kwargs (Any): Дополнительная фильтрация по полям
 
         Returns:
             Union[ListDTO[M], Sequence[M], ListDTO[O], Sequence[O]]: Список обектов
         """
 
+        # Чтения сессии с незафиксированными изменениями видят свои данные и не объединяются с другими
+        if (
+            self.single_flight is not None
+            and is_single_flight
+            and not is_model
+            and not has_pending_writes(session.sync_session)
+        ):
+            key = make_flight_key(
+                self, "get_all", search, search_fields, loads, sort_by, query_select, desc, page, limit,
+                is_pagination, count_strategy, count_mode, count_cap, fields, read_mode, **kwargs)
+
+            if key is not None:
+                return await self.single_flight.do(key, lambda: self.get_all(  # type: ignore
+                    session=session,
+                    search=search,
+                    search_fields=search_fields,
+                    loads=loads,
+                    sort_by=sort_by,
+                    query_select=query_select,
+                    desc=desc,
+                    page=page,
+                    limit=limit,
+                    is_pagination=is_pagination,
+                    count_strategy=count_strategy,
+                    count_mode=count_mode,
+                    count_cap=count_cap,
+                    is_model=False,
+                    fields=fields,
+                    read_mode=read_mode,
+                    is_single_flight=False,
+                    **kwargs
+                ))
+
         if loads is None and not is_model:
             loads = self.loads
 
+        columns = None
+        out_scheme = self.out_scheme
+        if not is_model:
+            columns, loads, out_scheme = self._get_projection(fields, loads)
+
+        is_core = self._is_core_read(read_mode, is_model, loads, out_scheme)
+
         if is_pagination:
             list_data = await super().get_all(
                 session=session,
@@ -214,22 +314,26 @@ class BasicGetAllSchemeOperations(
                 page=page,
                 limit=limit,
                 is_pagination=True,
+                count_strategy=count_strategy,
+                count_mode=count_mode,
+                count_cap=count_cap,
+                columns=columns,
+                read_mode="core" if is_core else "orm",
                 **kwargs
             )
 
             if is_model:
                 return list_data
 
-            schema_content: list[O] = []
-
-            for c in list_data.content:
-                schema_content.append(self.out_scheme.model_validate(c))
+            schema_content: list[O] = get_list_adapter(out_scheme).validate_python(
+                list_data.content, from_attributes=not is_core)
 
             schema_list_data = ListDTO(
                 page_number=list_data.page_number,
                 page_size=list_data.page_size,
                 total_pages=list_data.total_pages,
                 total_record=list_data.total_record,
+                is_total_approximate=list_data.is_total_approximate,
                 content=schema_content
             )
 
@@ -246,15 +350,164 @@ class BasicGetAllSchemeOperations(
             page=page,
             limit=limit,
             is_pagination=False,
+            columns=columns,
+            read_mode="core" if is_core else "orm",
             **kwargs
         )
 
         if is_model:
             return seq_data
 
-        schema_seq: list[O] = []
+        return get_list_adapter(out_scheme).validate_python(
+            seq_data, from_attributes=not is_core)
+
+    async def get_all_cursor(
+        self,
+
+        session: AsyncSession,
+
+        cursor: Optional[str] = None,
 
-        for c in seq_data:
-            schema_seq.append(self.out_scheme.model_validate(c))
+        search: Optional[str] = None,
+
+        search_fields: Optional[list[str]] = None,
+
+        loads: Optional[dict[str, str]] = None,
+
+        sort_by: Optional[str] = None,
+
+        query_select: Optional[Select[Any]] = None,
+
+        desc: int = 0,
+
+        limit: int = -1,
+
+        is_model: bool = True,
+
+        fields: Optional[list[str]] = None,
+
+        **kwargs: Any
+
+    ) -> Union[CursorListDTO[M], CursorListDTO[O]]:
+        """Получение списка обектов с keyset-пагинацией (по курсору)
+
+        Args:
+            session (AsyncSession): Сессия
+            cursor (Optional[str], optional): Курсор из next_cursor или prev_cursor. По умолчанию None
+            search (Optional[str], optional): Поиск по полям. По умолчанию None
+            search_fields (Optional[list[str]], optional): Поля поиска. По умолчанию None
+            loads (Optional[dict[str, str]], optional): Поля для загрузки. По умолчанию None
+            sort_by (Optional[str], optional): Поле сортировки. По умолчанию None
+            query_select (Optional[Select[Any]], optional): Кастомный селект запрос. По умолчанию None
+            desc (int, optional): Порядок сортировки. По умолчанию 0
+            limit (int, optional): Количество элементов на странице. По умолчанию -1
+            is_model (bool, optional): Возвращение объекта в виде модели или схемы. По умолчанию True
+            fields (Optional[list[str]], optional): Поля схемы вывода, только они читаются из БД и попадают в ответ (при is_model=False). По умолчанию None (все поля схемы вывода)
+            **kwargs (Any): Дополнительная фильтрация по полям
+
+        Returns:
+            Union[CursorListDTO[M], CursorListDTO[O]]: Страница обектов с курсорами
+        """
 
-        return schema_seq
+        if loads is None and not is_model:
+            loads = self.loads
+
+        columns = None
+        out_scheme = self.out_scheme
+        if not is_model:
+            columns, loads, out_scheme = self._get_projection(fields, loads)
+
+        list_data = await super().get_all_cursor(
+            session=session,
+            cursor=cursor,
+            search=search,
+            search_fields=search_fields,
+            loads=loads,
+            sort_by=sort_by,
+            query_select=query_select,
+            desc=desc,
+            limit=limit,
+            columns=columns,
+            **kwargs
+        )
+
+        if is_model:
+            return list_data
+
+        return CursorListDTO(
+            page_size=list_data.page_size,
+            next_cursor=list_data.next_cursor,
+            prev_cursor=list_data.prev_cursor,
+            content=get_list_adapter(out_scheme).validate_python(
+                list_data.content, from_attributes=True)
+        )
+
+    async def stream_all(
+        self,
+
+        session: AsyncSession,
+
+        search: Optional[str] = None,
+
+        search_fields: Optional[list[str]] = None,
+
+        loads: Optional[dict[str, str]] = None,
+
+        sort_by: Optional[str] = None,
+
+        query_select: Optional[Select[Any]] = None,
+
+        desc: int = 0,
+
+        chunk_size: int = 1000,
+
+        is_model: bool = True,
+
+        fields: Optional[list[str]] = None,
+
+        **kwargs: Any
+
+    ) -> AsyncIterator[Union[M, O]]:
+        """Потоковое получение обектов через серверный курсор, порциями по chunk_size
+
+        Args:
+            session (AsyncSession): Сессия
+            search (Optional[str], optional): Поиск по полям. По умолчанию None
+            search_fields (Optional[list[str]], optional): Поля поиска. По умолчанию None
+            loads (Optional[dict[str, str]], optional): Поля для загрузки. По умолчанию None
+            sort_by (Optional[str], optional): Поле сортировки. По умолчанию None
+            query_select (Optional[Select[Any]], optional): Кастомный селект запрос. По умолчанию None
+            desc (int, optional): Порядок сортировки. По умолчанию 0
+            chunk_size (int, optional): Количество строк, читаемых из БД за раз. По умолчанию 1000
+            is_model (bool, optional): Возвращение объекта в виде модели или схемы. По умолчанию True
+            fields (Optional[list[str]], optional): Поля схемы вывода, только они читаются из БД и попадают в ответ (при is_model=False). По умолчанию None (все поля схемы вывода)
+            **kwargs (Any): Дополнительная фильтрация по полям
+
+        Yields:
+            Union[M, O]: Обект
+        """
+
+        if loads is None and not is_model:
+            loads = self.loads
+
+        columns = None
+        out_scheme = self.out_scheme
+        if not is_model:
+            columns, loads, out_scheme = self._get_projection(fields, loads)
+
+        async for item in super().stream_all(
+            session=session,
+            search=search,
+            search_fields=search_fields,
+            loads=loads,
+            sort_by=sort_by,
+            query_select=query_select,
+            desc=desc,
+            chunk_size=chunk_size,
+            columns=columns,
+            **kwargs
+        ):
+            if is_model:
+                yield item
+            else:
+                yield out_scheme.model_validate(item)
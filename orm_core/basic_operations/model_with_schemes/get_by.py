@@ -1,11 +1,14 @@
 import logging
-from typing import Any, Literal, Optional, TypeVar, Generic, Union, overload
+from typing import Any, Literal, Optional, Sequence, TypeVar, Generic, Union, overload
 from fastapi import HTTPException
 from pydantic import BaseModel
 from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...cache import MISSING, TTLCache, has_pending_writes
+from ...single_flight import SingleFlight, make_flight_key
 from ..model.get_by import BasicModelGetByOperations
+from .projection import BasicProjectionSchemeOperations, get_list_adapter
 
 
 _log = logging.getLogger(__name__)
@@ -19,6 +22,7 @@ O = TypeVar('O', bound=BaseModel, default=Any)
 
 class BasicGetBySchemeOperations(
         BasicModelGetByOperations[M],
+        BasicProjectionSchemeOperations[M, O],
         Generic[M, A, E, O]
 ):
 
@@ -30,6 +34,9 @@ class BasicGetBySchemeOperations(
     pks: list[str]
     loads: dict[str, str]
 
+    object_cache: Optional[TTLCache] = None
+    single_flight: Optional[SingleFlight] = None
+
     @overload
     async def get_by(
         self,
@@ -59,6 +66,9 @@ class BasicGetBySchemeOperations(
         session: AsyncSession,
         loads: Optional[dict[str, str]] = None,
         is_get_none: Literal[True],
+        fields: Optional[list[str]] = None,
+        read_mode: Literal["orm", "core"] = "orm",
+        is_single_flight: bool = True,
         **kwargs: Any
     ) -> Optional[O]: ...
 
@@ -69,6 +79,9 @@ class BasicGetBySchemeOperations(
         session: AsyncSession,
         loads: Optional[dict[str, str]] = None,
         is_get_none: Literal[False] = False,
+        fields: Optional[list[str]] = None,
+        read_mode: Literal["orm", "core"] = "orm",
+        is_single_flight: bool = True,
         **kwargs: Any
     ) -> O: ...
 
@@ -80,6 +93,9 @@ class BasicGetBySchemeOperations(
         loads: Optional[dict[str, str]] = None,
         is_model: bool = False,
         is_get_none: bool = False,
+        fields: Optional[list[str]] = None,
+        read_mode: Literal["orm", "core"] = "orm",
+        is_single_flight: bool = True,
         **kwargs: Any
     ) -> Union[M, O, None]: ...
 
@@ -90,6 +106,9 @@ class BasicGetBySchemeOperations(
         loads: Optional[dict[str, str]] = None,
         is_model: bool = False,
         is_get_none: bool = False,
+        fields: Optional[list[str]] = None,
+        read_mode: Literal["orm", "core"] = "orm",
+        is_single_flight: bool = True,
         **kwargs: Any
     ) -> Union[O, M, None]:
         ...
@@ -101,14 +120,40 @@ class BasicGetBySchemeOperations(
             loads (Optional[dict[str, str]], optional): Список полей для дополнительной загрузки. Defaults to None.
             is_model (bool, optional): Возвращать ли объект модели. Defaults to True.
             is_get_none (bool, optional): Возвращать ли None, если объект не найден. Defaults to False.
+            fields (Optional[list[str]], optional): Поля схемы вывода, только они читаются из БД и попадают в ответ (при is_model=False). Defaults to None (все поля схемы вывода).
+            read_mode (Literal["orm", "core"], optional): "core" - схема строится из строки без создания модели (при is_model=False и без загрузки связей). Defaults to "orm".
+            is_single_flight (bool, optional): Объединять ли одинаковые одновременные чтения через single_flight менеджера (при is_model=False). Defaults to True.
             **kwargs (Any): Поля
 
         Raises:
             HTTPException: 404 Нет обязательных полей
+            HTTPException: 400 Поле из fields не найдено в схеме вывода
 
         Returns:
             Optional[O, M]: Объект
         """
+        # Чтения сессии с незафиксированными изменениями видят свои данные и не объединяются с другими
+        if (
+            self.single_flight is not None
+            and is_single_flight
+            and not is_model
+            and not has_pending_writes(session.sync_session)
+        ):
+            key = make_flight_key(
+                self, "get_by", loads, is_get_none, fields, read_mode, **kwargs)
+
+            if key is not None:
+                return await self.single_flight.do(key, lambda: self.get_by(  # type: ignore
+                    session=session,
+                    loads=loads,
+                    is_model=False,
+                    is_get_none=is_get_none,
+                    fields=fields,
+                    read_mode=read_mode,
+                    is_single_flight=False,
+                    **kwargs
+                ))
+
         if not all(pk in kwargs.keys() for pk in self.pks):
             raise HTTPException(
                 status_code=404,
@@ -118,24 +163,107 @@ class BasicGetBySchemeOperations(
         if loads is None and not is_model:
             loads = self.loads
 
+        columns = None
+        out_scheme = self.out_scheme
+        if not is_model:
+            columns, loads, out_scheme = self._get_projection(fields, loads)
+
+        # Сессия с незафиксированными изменениями не читает общий кэш и не пишет в него
+        cache_key = None
+        if self.object_cache is not None and not is_model and not has_pending_writes(session.sync_session):
+            identity = self._get_identity(kwargs)
+            if identity is not None:
+                cache_key = (
+                    self.model,
+                    tuple(identity.values()),
+                    tuple(sorted(loads.items())) if loads else None,
+                    tuple(sorted(set(fields))) if fields is not None else None
+                )
+
+                cached = self.object_cache.get(cache_key)
+                if cached is not MISSING:
+                    return cached
+
+        mode: Literal["orm", "core"] = "core" if self._is_core_read(
+            read_mode, is_model, loads, out_scheme) else "orm"
+
         if is_get_none:
             model = await super().get_by(
                 session=session,
                 loads=loads,
                 is_get_none=True,
+                columns=columns,
+                read_mode=mode,
                 **kwargs
             )
         else:
             model = await super().get_by(
                 session=session,
                 loads=loads,
+                columns=columns,
+                read_mode=mode,
                 **kwargs
             )
 
-        if is_model:
+        if is_model or model is None:
             return model
 
-        return self.out_scheme.model_validate(model)
+        item = out_scheme.model_validate(model)
+
+        if cache_key is not None and not has_pending_writes(session.sync_session):
+            self.object_cache.set(cache_key, item)  # type: ignore
+
+        return item
+
+    async def get_many(
+        self,
+
+        session: AsyncSession,
+
+        pks: Sequence[Any],
+
+        loads: Optional[dict[str, str]] = None,
+
+        is_model: bool = False,
+
+        fields: Optional[list[str]] = None,
+
+    ) -> Union[list[Optional[M]], list[Optional[O]]]:
+        """Получение объектов по списку первичных ключей одним запросом IN
+
+        Args:
+            session (AsyncSession): Сессия
+            pks (Sequence[Any]): Первичные ключи: значения, кортежи (для составного ключа) или словари
+            loads (Optional[dict[str, str]], optional): Список полей для дополнительной загрузки. Defaults to None.
+            is_model (bool, optional): Возвращать ли объекты модели. Defaults to False.
+            fields (Optional[list[str]], optional): Поля схемы вывода (при is_model=False). Defaults to None (все поля схемы вывода).
+
+        Returns:
+            Union[list[Optional[M]], list[Optional[O]]]: Объекты в порядке pks, None для ненайденных
+        """
+
+        if loads is None and not is_model:
+            loads = self.loads
+
+        columns = None
+        out_scheme = self.out_scheme
+        if not is_model:
+            columns, loads, out_scheme = self._get_projection(fields, loads)
+
+        items = await super().get_many(
+            session=session,
+            pks=pks,
+            loads=loads,
+            columns=columns
+        )
+
+        if is_model:
+            return items
+
+        schemes = iter(get_list_adapter(out_scheme).validate_python(
+            [item for item in items if item is not None], from_attributes=True))
+
+        return [next(schemes) if item is not None else None for item in items]
 
     @overload
     async def get_by_query(
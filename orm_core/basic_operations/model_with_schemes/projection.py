@@ -0,0 +1,171 @@
+import logging
+from functools import lru_cache
+from typing import Any, Generic, Iterable, Literal, Optional, TypeVar
+from fastapi import HTTPException
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+from sqlalchemy import Column
+from sqlalchemy.orm import Mapper, class_mapper
+
+
+_log = logging.getLogger(__name__)
+
+
+M = TypeVar('M')
+O = TypeVar('O', bound=BaseModel, default=Any)
+
+
+@lru_cache(maxsize=256)
+def get_fields_scheme(out_scheme: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+    """Схема вывода, ограниченная полями fields (для ответа с ?fields=)
+
+    Args:
+        out_scheme (type[BaseModel]): Схема вывода
+        fields (tuple[str, ...]): Поля схемы вывода
+
+    Returns:
+        type[BaseModel]: Схема только с полями fields
+    """
+
+    return create_model(  # type: ignore
+        f"{out_scheme.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{
+            name: (field.annotation, field)
+            for name, field in out_scheme.model_fields.items()
+            if name in fields
+        }
+    )
+
+
+@lru_cache(maxsize=256)
+def get_list_adapter(scheme: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """TypeAdapter(list[scheme]) для валидации списка одним вызовом вместо model_validate на каждый объект"""
+
+    return TypeAdapter(list[scheme])  # type: ignore
+
+
+class BasicProjectionSchemeOperations(Generic[M, O]):
+    """Выбор колонок для чтения по схеме вывода или по списку полей"""
+
+    model: type[M]
+    out_scheme: type[O]
+
+    columns_out_scheme: Optional[list[str]]
+
+    def _get_projection(
+        self,
+        fields: Optional[list[str]],
+        loads: Optional[dict[str, str]]
+    ) -> tuple[Optional[list[str]], Optional[dict[str, str]], type[O]]:
+        """Колонки для load_only, загрузки связей и схема вывода
+
+        Args:
+            fields (Optional[list[str]]): Поля схемы вывода, None - все поля схемы
+            loads (Optional[dict[str, str]]): Поля для загрузки
+
+        Raises:
+            HTTPException: 400 - Поле не найдено в схеме вывода
+
+        Returns:
+            tuple[Optional[list[str]], Optional[dict[str, str]], type[O]]: Колонки (None - все),
+                поля для загрузки и схема вывода
+        """
+
+        mapper = class_mapper(self.model)
+
+        if fields is None:
+            columns = self.columns_out_scheme
+            out_scheme = self.out_scheme
+        else:
+            for field in fields:
+                if field not in self.out_scheme.model_fields:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Поле {field} не найдено"
+                    )
+
+            # Свойство Python или hybrid_property может читать любые колонки: они загружаются все
+            if get_unmapped_field(mapper, fields) is None:
+                columns = [key for key in fields if key in mapper.column_attrs]
+            else:
+                columns = None
+            if loads:
+                loads = {key: val for key, val in loads.items() if key in fields}
+            out_scheme = get_fields_scheme(  # type: ignore
+                self.out_scheme, tuple(sorted(set(fields))))
+
+        if columns is None:
+            return None, loads, out_scheme
+
+        # Первичный ключ и внешние ключи загружаемых связей нужны ORM для идентификации и загрузки связей
+        column_keys = {
+            column: prop.key
+            for prop in mapper.column_attrs
+            for column in prop.columns
+        }
+
+        keys = set(columns)
+        keys.update(column_keys[column] for column in mapper.primary_key)
+        for key in loads or {}:
+            if key in mapper.relationships:
+                keys.update(
+                    column_keys[column]
+                    for column in mapper.relationships[key].local_columns
+                    if column in column_keys
+                )
+
+        return [key for key in mapper.column_attrs.keys() if key in keys], loads, out_scheme
+
+    def _is_core_read(
+        self,
+        read_mode: Literal["orm", "core"],
+        is_model: bool,
+        loads: Optional[dict[str, str]],
+        out_scheme: type[BaseModel]
+    ) -> bool:
+        """Чтение через Core возможно только для схем без загрузки связей,
+        все поля которых (кроме связей) - колонки таблицы модели"""
+
+        if read_mode != "core" or is_model:
+            return False
+
+        if loads:
+            _log.debug(
+                "Read mode core for %s with loads %s, fallback to orm",
+                self.model.__name__, loads  # type: ignore
+            )
+            return False
+
+        field = _get_non_column_field(class_mapper(self.model), out_scheme)
+        if field is not None:
+            _log.debug(
+                "Read mode core for %s with non-column field %s, fallback to orm",
+                self.model.__name__, field  # type: ignore
+            )
+            return False
+
+        return True
+
+
+def get_unmapped_field(mapper: Mapper[Any], names: Iterable[str]) -> Optional[str]:
+    """Поле, которое не является атрибутом маппинга (свойство Python, hybrid_property)"""
+
+    for name in names:
+        if name not in mapper.attrs:
+            return name
+
+    return None
+
+
+def _get_non_column_field(mapper: Mapper[Any], out_scheme: type[BaseModel]) -> Optional[str]:
+    """Поле схемы, которое нельзя прочитать выборкой колонок (hybrid_property, column_property, свойство Python)"""
+
+    for name in out_scheme.model_fields:
+        if name in mapper.relationships:
+            continue
+
+        prop = mapper.column_attrs.get(name)
+        if prop is None or not all(isinstance(column, Column) for column in prop.columns):
+            return name
+
+    return None
@@ -0,0 +1,219 @@
+import logging
+from typing import Any, Literal, Optional, Sequence, TypeVar, Generic, Union, overload
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..model.add import ADD_MANY_CHUNK_SIZE
+from ..model.upsert import BasicModelUpsertOperations
+from .projection import get_list_adapter
+
+
+_log = logging.getLogger(__name__)
+
+
+M = TypeVar('M')
+A = TypeVar('A', bound=BaseModel, default=Any)
+E = TypeVar('E', bound=BaseModel, default=Any)
+O = TypeVar('O', bound=BaseModel, default=Any)
+
+
+class BasicUpsertSchemeOperations(BasicModelUpsertOperations[M], Generic[M, A, E, O]):
+
+    model: type[M]
+    input_scheme: type[A]
+    edit_scheme: type[E]
+    out_scheme: type[O]
+
+    pks: list[str]
+    loads: dict[str, str]
+
+    @overload
+    async def upsert(
+        self,
+        *,
+        session: AsyncSession,
+        data: Union[A, M, dict[str, Any]],
+        conflict_columns: Optional[list[str]] = None,
+        update_columns: Optional[list[str]] = None,
+        loads: Optional[dict[str, str]] = None
+    ) -> M: ...
+
+    @overload
+    async def upsert(
+        self,
+        *,
+        session: AsyncSession,
+        data: Union[A, M, dict[str, Any]],
+        conflict_columns: Optional[list[str]] = None,
+        update_columns: Optional[list[str]] = None,
+        is_return: Literal[False]
+    ) -> None: ...
+
+    @overload
+    async def upsert(
+        self,
+        *,
+        session: AsyncSession,
+        data: Union[A, M, dict[str, Any]],
+        conflict_columns: Optional[list[str]] = None,
+        update_columns: Optional[list[str]] = None,
+        loads: Optional[dict[str, str]] = None,
+        is_model: Literal[False]
+    ) -> O: ...
+
+    async def upsert(
+        self,
+
+        *,
+
+        session: AsyncSession,
+
+        data: Union[A, M, dict[str, Any]],
+
+        conflict_columns: Optional[list[str]] = None,
+
+        update_columns: Optional[list[str]] = None,
+
+        is_return: bool = True,
+
+        is_model: bool = True,
+
+        loads: Optional[dict[str, str]] = None
+
+    ) -> Union[M, O, None]:
+        """Создание или обновление объекта (INSERT ... ON CONFLICT DO UPDATE)
+
+        Args:
+            session (AsyncSession): Сессия
+            data (Union[A, M, dict[str, Any]]): Данные объекта
+            conflict_columns (Optional[list[str]], optional): Поля для ON CONFLICT. Defaults to None (первичные ключи).
+            update_columns (Optional[list[str]], optional): Поля, обновляемые при конфликте. Defaults to None (все, кроме conflict_columns).
+            is_return (bool, optional): Возвращать ли объект. Defaults to True.
+            is_model (bool, optional): Возвращать ли модель. Defaults to True.
+            loads (Optional[dict[str, str]], optional): Список полей для загрузки связанных объектов. Defaults to None.
+
+        Returns:
+            Union[M, O, None]: Созданный или обновленный объект
+        """
+
+        _log.info("Upsert %s", self.model.__name__)
+
+        items = await self.upsert_many(
+            session=session,
+            data=[data],
+            conflict_columns=conflict_columns,
+            update_columns=update_columns,
+            is_return=is_return,
+            is_model=is_model,
+            loads=loads
+        )
+
+        if items is None:
+            return None
+
+        return items[0]
+
+    @overload
+    async def upsert_many(
+        self,
+        *,
+        session: AsyncSession,
+        data: Sequence[Union[A, M, dict[str, Any]]],
+        conflict_columns: Optional[list[str]] = None,
+        update_columns: Optional[list[str]] = None,
+        loads: Optional[dict[str, str]] = None,
+        chunk_size: int = ADD_MANY_CHUNK_SIZE
+    ) -> list[M]: ...
+
+    @overload
+    async def upsert_many(
+        self,
+        *,
+        session: AsyncSession,
+        data: Sequence[Union[A, M, dict[str, Any]]],
+        conflict_columns: Optional[list[str]] = None,
+        update_columns: Optional[list[str]] = None,
+        is_return: Literal[False],
+        chunk_size: int = ADD_MANY_CHUNK_SIZE
+    ) -> None: ...
+
+    @overload
+    async def upsert_many(
+        self,
+        *,
+        session: AsyncSession,
+        data: Sequence[Union[A, M, dict[str, Any]]],
+        conflict_columns: Optional[list[str]] = None,
+        update_columns: Optional[list[str]] = None,
+        loads: Optional[dict[str, str]] = None,
+        is_model: Literal[False],
+        chunk_size: int = ADD_MANY_CHUNK_SIZE
+    ) -> list[O]: ...
+
+    async def upsert_many(
+        self,
+
+        *,
+
+        session: AsyncSession,
+
+        data: Sequence[Union[A, M, dict[str, Any]]],
+
+        conflict_columns: Optional[list[str]] = None,
+
+        update_columns: Optional[list[str]] = None,
+
+        is_return: bool = True,
+
+        is_model: bool = True,
+
+        loads: Optional[dict[str, str]] = None,
+
+        chunk_size: int = ADD_MANY_CHUNK_SIZE
+
+    ) -> Union[list[M], list[O], None]:
+        """Создание или обновление объектов многострочным INSERT ... ON CONFLICT DO UPDATE по chunk_size строк
+
+        Args:
+            session (AsyncSession): Сессия
+            data (Sequence[Union[A, M, dict[str, Any]]]): Данные объектов
+            conflict_columns (Optional[list[str]], optional): Поля для ON CONFLICT. Defaults to None (первичные ключи).
+            update_columns (Optional[list[str]], optional): Поля, обновляемые при конфликте. Defaults to None (все, кроме conflict_columns).
+            is_return (bool, optional): Возвращать ли объекты. Defaults to True.
+            is_model (bool, optional): Возвращать ли модели. Defaults to True.
+            loads (Optional[dict[str, str]], optional): Список полей для загрузки связанных объектов. Defaults to None.
+            chunk_size (int, optional): Количество строк в одном запросе. Defaults to ADD_MANY_CHUNK_SIZE.
+
+        Returns:
+            Union[list[M], list[O], None]: Объекты в порядке data
+        """
+
+        _log.info("Upsert many %s", self.model.__name__)
+
+        values: list[Union[M, dict[str, Any]]] = []
+        for item in data:
+            if isinstance(item, (self.model, dict)):
+                values.append(item)  # type: ignore
+            else:
+                values.append(item.model_dump())  # type: ignore
+
+        if loads is None and not is_model:
+            loads = self.loads
+
+        models = await super().upsert_many(
+            session=session,
+            data=values,
+            conflict_columns=conflict_columns,
+            update_columns=update_columns,
+            is_return=is_return,
+            loads=loads,
+            chunk_size=chunk_size
+        )
+
+        if models is None:
+            return None
+
+        if is_model:
+            return models
+
+        return get_list_adapter(self.out_scheme).validate_python(models, from_attributes=True)
@@ -0,0 +1,312 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Optional
+from weakref import WeakSet
+
+from sqlalchemy import Table, event
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction, object_mapper
+
+
+_log = logging.getLogger(__name__)
+
+
+MISSING: Any = object()
+
+
+class TTLCache:
+    """Кэш с ограничением по времени жизни записей (TTL) и размеру (LRU)
+
+    Записи кэша, привязанного к таблице через register_table_cache,
+    сбрасываются при любой записи в эту таблицу через ORM-сессию.
+
+    Example:
+
+        count_cache = TTLCache(maxsize=1024, ttl=30)
+        self.user = create_orm_manager(User, count_cache=count_cache)
+
+        count_cache.stats  # {"hits": ..., "misses": ..., ...}
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 60.0) -> None:
+        """Кэш с TTL и LRU-вытеснением
+
+        Args:
+            maxsize (int, optional): Максимальное количество записей. По умолчанию 1024.
+            ttl (Optional[float], optional): Время жизни записи в секундах, None - без ограничения. По умолчанию 60.
+        """
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self.__data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Получение значения по ключу, MISSING если записи нет или она устарела"""
+
+        item = self.__data.get(key, MISSING)
+
+        if item is MISSING:
+            self.misses += 1
+            return default
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self.__data[key]
+            self.misses += 1
+            return default
+
+        self.__data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Сохранение значения, при переполнении вытесняется самая старая по использованию запись"""
+
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+
+        self.__data[key] = (expires_at, value)
+        self.__data.move_to_end(key)
+
+        while len(self.__data) > self.maxsize:
+            self.__data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        """Удаление записи по ключу"""
+
+        self.__data.pop(key, None)
+
+    def clear(self) -> None:
+        """Удаление всех записей"""
+
+        if self.__data:
+            self.invalidations += 1
+        self.__data.clear()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Метрики кэша для настройки размера и TTL"""
+
+        total = self.hits + self.misses
+
+        return {
+            "size": len(self.__data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+_table_caches: dict[str, "WeakSet[TTLCache]"] = {}
+_identity_caches: dict[str, "WeakSet[TTLCache]"] = {}
+
+_SESSION_INFO_KEY = "orm_core_touched_tables"
+_SESSION_IDENTITIES_KEY = "orm_core_touched_identities"
+_SESSION_WRITES_KEY = "orm_core_has_writes"
+
+
+def register_table_cache(tables: Iterable[Table], cache: TTLCache) -> None:
+    """Привязка кэша к таблицам: кэш сбрасывается при записи в любую из них
+
+    Args:
+        tables (Iterable[Table]): Таблицы модели
+        cache (TTLCache): Кэш
+    """
+
+    for table in tables:
+        _table_caches.setdefault(table.fullname, WeakSet()).add(cache)
+
+
+def register_identity_cache(tables: Iterable[Table], cache: TTLCache) -> None:
+    """Привязка кэша по первичному ключу к таблицам: ключи кэша - (модель, кортеж первичного ключа)
+
+    При добавлении объекта через ORM-сессию удаляется только запись с его ключом,
+    при insert-запросе в таблицу кэш сбрасывается целиком.
+
+    Args:
+        tables (Iterable[Table]): Таблицы модели
+        cache (TTLCache): Кэш
+    """
+
+    for table in tables:
+        _identity_caches.setdefault(table.fullname, WeakSet()).add(cache)
+
+
+def invalidate_identities(identities: Iterable[tuple[str, Optional[Hashable]]]) -> None:
+    """Удаление записей по первичному ключу из кэшей, привязанных к таблицам
+
+    Args:
+        identities (Iterable[tuple[str, Optional[Hashable]]]): Пары (полное имя таблицы, ключ кэша), ключ None - все записи
+    """
+
+    for name, key in identities:
+        for cache in list(_identity_caches.get(name, ())):
+            if key is None:
+                cache.clear()
+            else:
+                cache.pop(key)
+
+
+def invalidate_tables(names: Iterable[str]) -> None:
+    """Сброс всех кэшей, привязанных к таблицам
+
+    Args:
+        names (Iterable[str]): Полные имена таблиц (Table.fullname)
+    """
+
+    for name in names:
+        for cache in list(_table_caches.get(name, ())):
+            cache.clear()
+
+
+def _touch(session: Session, names: set[str]) -> None:
+    names = {name for name in names if name in _table_caches}
+    if not names:
+        return
+
+    _log.debug("Invalidate caches for tables %s", names)
+
+    # Сброс сразу - чтобы чтения в этой же транзакции не видели старых значений,
+    # и повторно после commit - чтобы убрать значения, закэшированные другими сессиями до commit
+    invalidate_tables(names)
+    session.info.setdefault(_SESSION_INFO_KEY, set()).update(names)
+
+
+def _touch_identities(session: Session, identities: set[tuple[str, Optional[Hashable]]]) -> None:
+    if not identities:
+        return
+
+    _log.debug("Invalidate identities %s", identities)
+
+    # Как и для таблиц: сразу и повторно после commit, когда объект станет виден другим сессиям
+    invalidate_identities(identities)
+    session.info.setdefault(_SESSION_IDENTITIES_KEY, set()).update(identities)
+
+
+def has_pending_writes(session: Session) -> bool:
+    """Есть ли в сессии незафиксированные изменения
+
+    Изменения - объекты в new, dirty и deleted или записи, выполненные в текущей транзакции
+    через flush, ORM-запросы insert/update/delete или с вызовом touch_tables.
+    Прочитанное в такой сессии не должно попадать в общие кэши и в ответы других запросов.
+
+    Args:
+        session (Session): Сессия
+
+    Returns:
+        bool: True, если изменения есть
+    """
+
+    return bool(
+        session.info.get(_SESSION_WRITES_KEY)
+        or session.new
+        or session.deleted
+        or session.dirty
+    )
+
+
+def touch_tables(session: Session, names: Iterable[str]) -> None:
+    """Сброс кэшей таблиц после записи мимо ORM (сразу и повторно после commit сессии)
+
+    Кэши по первичному ключу этих таблиц сбрасываются целиком.
+
+    Args:
+        session (Session): Сессия, в транзакции которой выполнена запись
+        names (Iterable[str]): Полные имена таблиц (Table.fullname)
+    """
+
+    session.info[_SESSION_WRITES_KEY] = True
+
+    names = set(names)
+
+    _touch(session, names)
+    _touch_identities(session, {(name, None) for name in names if name in _identity_caches})
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session: Session, flush_context: UOWTransaction) -> None:
+    session.info[_SESSION_WRITES_KEY] = True
+
+    if not _table_caches and not _identity_caches:
+        return
+
+    names: set[str] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        names.update(table.fullname for table in object_mapper(obj).tables)
+
+    identities: set[tuple[str, Optional[Hashable]]] = set()
+    for obj in (*session.new, *session.dirty):
+        mapper = object_mapper(obj)
+        names_identity = [
+            table.fullname for table in mapper.tables
+            if table.fullname in _identity_caches
+        ]
+        if not names_identity:
+            continue
+
+        pk = tuple(mapper.primary_key_from_instance(obj))
+        for name in names_identity:
+            for cls_mapper in mapper.iterate_to_root():
+                identities.add((name, (cls_mapper.class_, pk)))
+
+    _touch(session, names)
+    _touch_identities(session, identities)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _do_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+
+    orm_execute_state.session.info[_SESSION_WRITES_KEY] = True
+
+    if not _table_caches and not _identity_caches:
+        return
+
+    table = getattr(orm_execute_state.statement, "table", None)
+    name = getattr(table, "fullname", None)
+    if name is None:
+        return
+
+    _touch(orm_execute_state.session, {name})
+
+    # Ключи вставленных строк неизвестны, поэтому кэш по первичному ключу сбрасывается целиком
+    if orm_execute_state.is_insert and name in _identity_caches:
+        _touch_identities(orm_execute_state.session, {(name, None)})
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    session.info.pop(_SESSION_WRITES_KEY, None)
+
+    names = session.info.pop(_SESSION_INFO_KEY, None)
+    if names:
+        invalidate_tables(names)
+
+    identities = session.info.pop(_SESSION_IDENTITIES_KEY, None)
+    if identities:
+        invalidate_identities(identities)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_SESSION_WRITES_KEY, None)
+
+    names = session.info.pop(_SESSION_INFO_KEY, None)
+    if names:
+        invalidate_tables(names)
+
+    session.info.pop(_SESSION_IDENTITIES_KEY, None)
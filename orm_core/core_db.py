@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa
 
 from .base import Base
+from .basic_operations.model.get_all import BasicModelGetAllOperations
 
 
 class ClientDB:
@@ -45,6 +46,10 @@ class ClientDB:
     async def init_db(self):
         """
         Инициализация БД
+
+        Создает таблицы и индексы поиска для менеджеров-атрибутов клиента.
+        Расширения БД для стратегий поиска (например, pg_trgm) не создаются,
+        если это не включено в стратегии явно.
         """
         async with self.engine.begin() as conn:
             await conn.run_sync(
@@ -52,6 +57,10 @@ class ClientDB:
                     sync_conn, checkfirst=True)
             )
 
+            for manager in vars(self).values():
+                if isinstance(manager, BasicModelGetAllOperations):
+                    await manager.create_search_index(conn)
+
     async def drop_tables(self):
         """
         Удаление всех таблиц
@@ -9,6 +9,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from .api.api_model import ManagerApiModel
 from .basic_operations.model import ManagerModel
 from .basic_operations.model_with_schemes import ManagerModelSchemes
+from .cache import TTLCache
+from .single_flight import SingleFlight
+from .search import SearchBackend
 from .api.api_schemes import ManagerApiModelWithSchemes
 
 
@@ -23,12 +26,23 @@ O = TypeVar('O', bound=BaseModel)
 
 @overload
 def create_orm_manager(
-    model: type[M]
+    model: type[M],
+    *,
+    count_cache: Optional[TTLCache] = None,
+    search_backend: Optional[SearchBackend] = None,
+    statement_cache: Optional[TTLCache] = None,
+    batch_get_by: bool = False,
+    negative_cache: Optional[TTLCache] = None,
 ) -> ManagerModel[M]:
     """Фабрика для создания менеджера для работы только с моделями
 
     Args:
         model (type[M]): Модель для работы
+        count_cache (Optional[TTLCache], optional): Кэш total_record для get_all, сбрасывается при записи в таблицу. По умолчанию None.
+        search_backend (Optional[SearchBackend], optional): Стратегия поиска для get_all. По умолчанию None (ILIKE по подстроке).
+        statement_cache (Optional[TTLCache], optional): Кэш построенных запросов чтения get_all, get_by и exists по форме запроса (значения передаются параметрами); add, edit и delete строят запросы заново. По умолчанию None.
+        batch_get_by (bool, optional): Объединять get_by по первичному ключу, вызванные в одной сессии в одном проходе цикла событий, в один запрос get_many. По умолчанию False.
+        negative_cache (Optional[TTLCache], optional): Кэш ненайденных по первичному ключу объектов для get_by (ответ 404 без запроса к БД), запись удаляется при добавлении объекта с этим ключом. По умолчанию None.
 
     Returns:
         ManagerModel[M]: Менеджер для работы с моделями
@@ -65,6 +79,14 @@ def create_orm_manager(
     add_scheme: type[A],
     edit_scheme: type[E],
     out_scheme: type[O],
+    *,
+    count_cache: Optional[TTLCache] = None,
+    search_backend: Optional[SearchBackend] = None,
+    statement_cache: Optional[TTLCache] = None,
+    batch_get_by: bool = False,
+    negative_cache: Optional[TTLCache] = None,
+    object_cache: Optional[TTLCache] = None,
+    single_flight: Optional[SingleFlight] = None,
 ) -> ManagerModelSchemes[M, A, E, O]:
     """Фабрика для создания менеджера для работы с моделями и преобразование в pydantic-схемы
 
@@ -73,6 +95,13 @@ def create_orm_manager(
         add_scheme (type[A]): Pydantic-схема для добавления
         edit_scheme (type[E]): Pydantic-схема для редактирования
         out_scheme (type[O]): Pydantic-схема для вывода
+        count_cache (Optional[TTLCache], optional): Кэш total_record для get_all, сбрасывается при записи в таблицу. По умолчанию None.
+        search_backend (Optional[SearchBackend], optional): Стратегия поиска для get_all. По умолчанию None (ILIKE по подстроке).
+        statement_cache (Optional[TTLCache], optional): Кэш построенных запросов чтения get_all, get_by и exists по форме запроса (значения передаются параметрами); add, edit и delete строят запросы заново. По умолчанию None.
+        batch_get_by (bool, optional): Объединять get_by по первичному ключу, вызванные в одной сессии в одном проходе цикла событий, в один запрос get_many. По умолчанию False.
+        negative_cache (Optional[TTLCache], optional): Кэш ненайденных по первичному ключу объектов для get_by (ответ 404 без запроса к БД), запись удаляется при добавлении объекта с этим ключом. По умолчанию None.
+        object_cache (Optional[TTLCache], optional): Кэш результатов get_by по первичному ключу (схемы вывода), сбрасывается при записи в таблицу модели и загружаемых связей. По умолчанию None.
+        single_flight (Optional[SingleFlight], optional): Объединение одинаковых одновременных чтений схем (get_by и get_all с is_model=False) в один запрос к БД. По умолчанию None.
 
     Returns:
         ManagerModelSchemes[M, A, E, O]: Менеджер для работы с моделями и преобразование в pydantic-схемы
@@ -126,7 +155,19 @@ def create_orm_manager(
 
     search_fields: Optional[list[str]] = None,
 
-    return_get_all: Literal["pagination", "list"] = "pagination",
+    return_get_all: Literal["pagination", "list", "cursor"] = "pagination",
+
+    count_strategy: Literal["query", "window"] = "query",
+
+    count_mode: Literal["exact", "estimate", "capped"] = "exact",
+
+    count_cap: int = 1000,
+
+    read_mode: Literal["orm", "core"] = "orm",
+
+    write_mode: Literal["orm", "returning", "direct"] = "orm",
+
+    bulk_routes: bool = False,
 
     prefix: Optional[str] = None,
 
@@ -134,6 +175,22 @@ def create_orm_manager(
 
     dependencies: Optional[Sequence[params.Depends]] = None,
 
+    count_cache: Optional[TTLCache] = None,
+
+    search_backend: Optional[SearchBackend] = None,
+
+    statement_cache: Optional[TTLCache] = None,
+
+    batch_get_by: bool = False,
+
+    negative_cache: Optional[TTLCache] = None,
+
+    object_cache: Optional[TTLCache] = None,
+
+    single_flight: Optional[SingleFlight] = None,
+
+    single_flight_routes: Optional[list[Literal["get_all", "get_by"]]] = None,
+
 ) -> ManagerApiModelWithSchemes[M, A, E, O]:
     """Фабрика для создания менеджера для работы с моделями, схемами и автогенерация CRUD API для работы с таблицами  
 
@@ -145,10 +202,24 @@ def create_orm_manager(
         session_factory (async_sessionmaker[AsyncSession]): Фабрика сессий для работы с БД
         api (Literal[True]): Флаг для автогенерации API
         search_fields (Optional[list[str]], optional): Поля по которым будет проводиться поиск при получении списка. По умолчанию None.
-        return_get_all (Literal[&quot;pagination&quot;, &quot;list&quot;], optional): При получении списка будет получаться с пагинацией или список. По умолчани. с пагинацией (to "pagination").
+        return_get_all (Literal[&quot;pagination&quot;, &quot;list&quot;, &quot;cursor&quot;], optional): При получении списка будет получаться с пагинацией, списком или с пагинацией по курсору ("cursor"). По умолчани. с пагинацией (to "pagination").
+        count_strategy (Literal["query", "window"], optional): Подсчет total_record при получении списка отдельным запросом ("query") или в том же запросе через count(*) OVER () ("window"). По умолчанию "query".
+        count_mode (Literal["exact", "estimate", "capped"], optional): Режим подсчета total_record при получении списка: точный ("exact"), оценка по статистике планировщика без фильтров ("estimate") или не более count_cap строк ("capped"). По умолчанию "exact".
+        count_cap (int, optional): Максимум считаемых строк для count_mode="capped". По умолчанию 1000.
+        read_mode (Literal["orm", "core"], optional): Чтение в GET-маршрутах через ORM ("orm") или напрямую из строк через Core без создания экземпляров моделей ("core"), связи в режиме "core" не загружаются. По умолчанию "orm".
+        write_mode (Literal["orm", "returning", "direct"], optional): Запись в POST и PATCH через ORM ("orm": flush и повторный SELECT) или одним запросом INSERT/UPDATE ... RETURNING ("returning", Postgres и SQLite >= 3.35), связи загружаются только из схемы вывода. "direct" - PATCH одним UPDATE только с переданными полями и чтением по первичному ключу, POST как "orm". По умолчанию "orm".
+        bulk_routes (bool, optional): Регистрировать маршруты POST, PATCH и DELETE /bulk: списки объектов записываются в одной транзакции многострочными запросами, ответ содержит результат или ошибку по каждому элементу. По умолчанию False.
         prefix (Optional[str], optional): Кастомный путь для router. По умелчанию создается автоматически по названию модели.
         tags (Optional[list[Union[str, Enum]]], optional): Название router в Swager. По умелчанию название модели.
         dependencies (Optional[Sequence[params.Depends]], optional): Зависимости. По умелчанию их нет.
+        count_cache (Optional[TTLCache], optional): Кэш total_record для get_all, сбрасывается при записи в таблицу. По умолчанию None.
+        search_backend (Optional[SearchBackend], optional): Стратегия поиска для get_all. По умолчанию None (ILIKE по подстроке).
+        statement_cache (Optional[TTLCache], optional): Кэш построенных запросов чтения get_all, get_by и exists по форме запроса (значения передаются параметрами); add, edit и delete строят запросы заново. По умолчанию None.
+        batch_get_by (bool, optional): Объединять get_by по первичному ключу, вызванные в одной сессии в одном проходе цикла событий, в один запрос get_many. По умолчанию False.
+        negative_cache (Optional[TTLCache], optional): Кэш ненайденных по первичному ключу объектов для get_by (ответ 404 без запроса к БД), запись удаляется при добавлении объекта с этим ключом. По умолчанию None.
+        object_cache (Optional[TTLCache], optional): Кэш результатов get_by по первичному ключу (схемы вывода), сбрасывается при записи в таблицу модели и загружаемых связей. По умолчанию None.
+        single_flight (Optional[SingleFlight], optional): Объединение одинаковых одновременных чтений схем (get_by и get_all с is_model=False) в один запрос к БД. По умолчанию None.
+        single_flight_routes (Optional[list[Literal["get_all", "get_by"]]], optional): GET-маршруты, в которых чтения объединяются через single_flight. По умолчанию None (все).
 
     Returns:
         ManagerModelWithApi[M, A, E, O]: Менеджер для работы с моделями, схемами и генериацией CRUD API
@@ -198,10 +269,24 @@ def create_orm_manager(
     session_factory: async_sessionmaker[AsyncSession],
     api: Literal[True],
     search_fields: Optional[list[str]] = None,
-    return_get_all: Literal["pagination", "list"] = "pagination",
+    return_get_all: Literal["pagination", "list", "cursor"] = "pagination",
+    count_strategy: Literal["query", "window"] = "query",
+    count_mode: Literal["exact", "estimate", "capped"] = "exact",
+    count_cap: int = 1000,
+    read_mode: Literal["orm", "core"] = "orm",
+    write_mode: Literal["orm", "returning", "direct"] = "orm",
+    bulk_routes: bool = False,
     prefix: Optional[str] = None,
     tags: Optional[list[Union[str, Enum]]] = None,
     dependencies: Optional[Sequence[params.Depends]] = None,
+    count_cache: Optional[TTLCache] = None,
+    search_backend: Optional[SearchBackend] = None,
+    statement_cache: Optional[TTLCache] = None,
+    batch_get_by: bool = False,
+    negative_cache: Optional[TTLCache] = None,
+    object_cache: Optional[TTLCache] = None,
+    single_flight: Optional[SingleFlight] = None,
+    single_flight_routes: Optional[list[Literal["get_all", "get_by"]]] = None,
 ) -> ManagerApiModel[M]:
     """Фабрика для создания менеджера для работы с моделями и автогенерация CRUD API для работы с таблицами
 
@@ -210,10 +295,24 @@ def create_orm_manager(
         session_factory (async_sessionmaker[AsyncSession]): Фабрика сессий для работы с БД
         api (Literal[True]): Флаг для автогенерации API
         search_fields (Optional[list[str]], optional): Поля по которым будет проводиться поиск при получении списка. По умолчанию None.
-        return_get_all (Literal[&quot;pagination&quot;, &quot;list&quot;], optional): При получении списка будет получаться с пагинацией или список. По умолчанию с пагинацией (to "pagination").
+        return_get_all (Literal[&quot;pagination&quot;, &quot;list&quot;, &quot;cursor&quot;], optional): При получении списка будет получаться с пагинацией, списком или с пагинацией по курсору ("cursor"). По умолчанию с пагинацией (to "pagination").
+        count_strategy (Literal["query", "window"], optional): Подсчет total_record при получении списка отдельным запросом ("query") или в том же запросе через count(*) OVER () ("window"). По умолчанию "query".
+        count_mode (Literal["exact", "estimate", "capped"], optional): Режим подсчета total_record при получении списка: точный ("exact"), оценка по статистике планировщика без фильтров ("estimate") или не более count_cap строк ("capped"). По умолчанию "exact".
+        count_cap (int, optional): Максимум считаемых строк для count_mode="capped". По умолчанию 1000.
+        read_mode (Literal["orm", "core"], optional): Чтение в GET-маршрутах через ORM ("orm") или напрямую из строк через Core без создания экземпляров моделей ("core"), связи в режиме "core" не загружаются. По умолчанию "orm".
+        write_mode (Literal["orm", "returning", "direct"], optional): Запись в POST и PATCH через ORM ("orm": flush и повторный SELECT) или одним запросом INSERT/UPDATE ... RETURNING ("returning", Postgres и SQLite >= 3.35), связи загружаются только из схемы вывода. "direct" - PATCH одним UPDATE только с переданными полями и чтением по первичному ключу, POST как "orm". По умолчанию "orm".
+        bulk_routes (bool, optional): Регистрировать маршруты POST, PATCH и DELETE /bulk: списки объектов записываются в одной транзакции многострочными запросами, ответ содержит результат или ошибку по каждому элементу. По умолчанию False.
         prefix (Optional[str], optional): Кастомный путь для router. По умолчанию создается автоматически по названию модели.
         tags (Optional[list[Union[str, Enum]]], optional): Название router в Swagger. По умолчанию название модели.
         dependencies (Optional[Sequence[params.Depends]], optional): Зависимости. По умелчанию их нет.
+        count_cache (Optional[TTLCache], optional): Кэш total_record для get_all, сбрасывается при записи в таблицу. По умолчанию None.
+        search_backend (Optional[SearchBackend], optional): Стратегия поиска для get_all. По умолчанию None (ILIKE по подстроке).
+        statement_cache (Optional[TTLCache], optional): Кэш построенных запросов чтения get_all, get_by и exists по форме запроса (значения передаются параметрами); add, edit и delete строят запросы заново. По умолчанию None.
+        batch_get_by (bool, optional): Объединять get_by по первичному ключу, вызванные в одной сессии в одном проходе цикла событий, в один запрос get_many. По умолчанию False.
+        negative_cache (Optional[TTLCache], optional): Кэш ненайденных по первичному ключу объектов для get_by (ответ 404 без запроса к БД), запись удаляется при добавлении объекта с этим ключом. По умолчанию None.
+        object_cache (Optional[TTLCache], optional): Кэш ответов GET /{pk} (схемы вывода), сбрасывается при записи в таблицу модели и загружаемых связей. По умолчанию None.
+        single_flight (Optional[SingleFlight], optional): Объединение одинаковых одновременных чтений в GET-маршрутах в один запрос к БД. По умолчанию None.
+        single_flight_routes (Optional[list[Literal["get_all", "get_by"]]], optional): GET-маршруты, в которых чтения объединяются через single_flight. По умолчанию None (все).
 
     Returns:
         ManagerApiModel[M]: Менеджер для работы с моделями и автогенерацией CRUD API
@@ -270,7 +369,19 @@ def create_orm_manager(
 
     search_fields: Optional[list[str]] = None,
 
-    return_get_all: Optional[Literal["pagination", "list"]] = None,
+    return_get_all: Optional[Literal["pagination", "list", "cursor"]] = None,
+
+    count_strategy: Literal["query", "window"] = "query",
+
+    count_mode: Literal["exact", "estimate", "capped"] = "exact",
+
+    count_cap: int = 1000,
+
+    read_mode: Literal["orm", "core"] = "orm",
+
+    write_mode: Literal["orm", "returning", "direct"] = "orm",
+
+    bulk_routes: bool = False,
 
     prefix: Optional[str] = None,
 
@@ -278,6 +389,22 @@ def create_orm_manager(
 
     dependencies: Optional[Sequence[params.Depends]] = None,
 
+    count_cache: Optional[TTLCache] = None,
+
+    search_backend: Optional[SearchBackend] = None,
+
+    statement_cache: Optional[TTLCache] = None,
+
+    batch_get_by: bool = False,
+
+    negative_cache: Optional[TTLCache] = None,
+
+    object_cache: Optional[TTLCache] = None,
+
+    single_flight: Optional[SingleFlight] = None,
+
+    single_flight_routes: Optional[list[Literal["get_all", "get_by"]]] = None,
+
 ) -> Union[ManagerModel[M], ManagerModelSchemes[M, A, E, O], ManagerApiModelWithSchemes[M, A, E, O], ManagerApiModel[M]]:
 
     if api:
@@ -292,9 +419,23 @@ def create_orm_manager(
                 session_factory=session_factory,
                 search_fields=search_fields,
                 return_get_all=return_get_all,
+                count_strategy=count_strategy,
+                count_mode=count_mode,
+                count_cap=count_cap,
+                read_mode=read_mode,
+                write_mode=write_mode,
+                bulk_routes=bulk_routes,
                 prefix=prefix,
                 tags=tags,
-                dependencies=dependencies
+                dependencies=dependencies,
+                count_cache=count_cache,
+                search_backend=search_backend,
+                statement_cache=statement_cache,
+                batch_get_by=batch_get_by,
+                negative_cache=negative_cache,
+                object_cache=object_cache,
+                single_flight=single_flight,
+                single_flight_routes=single_flight_routes
             )
         elif model is not None and session_factory is not None:
             if return_get_all is None:
@@ -304,18 +445,32 @@ def create_orm_manager(
                 session_factory=session_factory,
                 search_fields=search_fields,
                 return_get_all=return_get_all,
+                count_strategy=count_strategy,
+                count_mode=count_mode,
+                count_cap=count_cap,
+                read_mode=read_mode,
+                write_mode=write_mode,
+                bulk_routes=bulk_routes,
                 prefix=prefix,
                 tags=tags,
-                dependencies=dependencies
+                dependencies=dependencies,
+                count_cache=count_cache,
+                search_backend=search_backend,
+                statement_cache=statement_cache,
+                batch_get_by=batch_get_by,
+                negative_cache=negative_cache,
+                object_cache=object_cache,
+                single_flight=single_flight,
+                single_flight_routes=single_flight_routes
             )
         else:
             raise TypeError("Not all arguments are provided")
 
     elif add_scheme is not None and edit_scheme is not None and out_scheme is not None:
-        return ManagerModelSchemes(model, add_scheme, edit_scheme, out_scheme)
+        return ManagerModelSchemes(model, add_scheme, edit_scheme, out_scheme, count_cache=count_cache, search_backend=search_backend, statement_cache=statement_cache, batch_get_by=batch_get_by, negative_cache=negative_cache, object_cache=object_cache, single_flight=single_flight)
 
     elif add_scheme is None and edit_scheme is None and out_scheme is None:
-        return ManagerModel(model)
+        return ManagerModel(model, count_cache=count_cache, search_backend=search_backend, statement_cache=statement_cache, batch_get_by=batch_get_by, negative_cache=negative_cache)
 
     else:
         raise TypeError("Either all schemes must be provided or none")
@@ -0,0 +1,252 @@
+from abc import ABC, abstractmethod
+import logging
+import re
+from typing import Any, Sequence
+
+from sqlalchemy import ColumnElement, Table, cast, func, inspect, literal_column, or_, select, table, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.types import String
+
+
+_log = logging.getLogger(__name__)
+
+
+class SearchBackend(ABC):
+    """Стратегия поиска по строке search в get_all
+
+    Стратегия строит условие WHERE по полям поиска и, при необходимости,
+    создает индекс, который это условие обслуживает (create_index вызывается из ClientDB.init_db).
+    """
+
+    def prepare(self, search: str) -> Any:
+        """Преобразование строки поиска в значение параметра запроса"""
+
+        return search
+
+    @abstractmethod
+    def condition(self, model: Any, fields: Sequence[str], value: Any) -> ColumnElement[bool]:
+        """Условие поиска
+
+        Args:
+            model (Any): Модель
+            fields (Sequence[str]): Поля поиска
+            value (Any): Значение из prepare (или bindparam)
+
+        Returns:
+            ColumnElement[bool]: Условие для WHERE
+        """
+
+    def get_ddl(self, model_table: Table, fields: Sequence[str], dialect_name: str) -> list[str]:
+        """DDL индекса или вспомогательной таблицы для поиска, пустой список если не нужен"""
+
+        return []
+
+    async def create_index(self, conn: AsyncConnection, model_table: Table, fields: Sequence[str]) -> None:
+        """Создание индекса для поиска, если его еще нет
+
+        Args:
+            conn (AsyncConnection): Соединение
+            model_table (Table): Таблица модели
+            fields (Sequence[str]): Имена колонок поиска в таблице (Column.name)
+        """
+
+        for ddl in self.get_ddl(model_table, fields, conn.dialect.name):
+            _log.debug(ddl)
+            await conn.execute(text(ddl))
+
+
+def _text_column(column: Any) -> Any:
+    if isinstance(column.type, String):
+        return column
+    return cast(column, String)
+
+
+def _compile_index_expression(expression: Any, dialect: Any) -> str:
+    return str(expression.compile(
+        dialect=dialect,
+        compile_kwargs={"literal_binds": True, "include_table": False}
+    ))
+
+
+class IlikeSearch(SearchBackend):
+    """Поиск подстроки через cast(column, String) ILIKE '%search%'
+
+    Работает на любой СУБД, но не использует индексы (полный просмотр таблицы).
+    """
+
+    def prepare(self, search: str) -> Any:
+        return f"%{search}%"
+
+    def condition(self, model: Any, fields: Sequence[str], value: Any) -> ColumnElement[bool]:
+        return or_(*[
+            cast(getattr(model, field), String).ilike(value)
+            for field in fields
+        ])
+
+
+class PgTrigramSearch(SearchBackend):
+    """Поиск подстроки через ILIKE, обслуживаемый GIN-индексами pg_trgm (Postgres)
+
+    Для строковых полей условие строится без cast, чтобы совпадать с выражением индекса.
+    Расширение pg_trgm должно быть установлено в БД заранее (CREATE EXTENSION требует прав владельца БД),
+    либо create_extension=True, если роль приложения может его создать.
+
+    Args:
+        create_extension (bool, optional): Выполнять CREATE EXTENSION IF NOT EXISTS pg_trgm перед созданием индексов. По умолчанию False.
+    """
+
+    def __init__(self, create_extension: bool = False) -> None:
+        self.create_extension = create_extension
+
+    def prepare(self, search: str) -> Any:
+        return f"%{search}%"
+
+    def condition(self, model: Any, fields: Sequence[str], value: Any) -> ColumnElement[bool]:
+        return or_(*[
+            _text_column(getattr(model, field)).ilike(value)
+            for field in fields
+        ])
+
+    def get_ddl(self, model_table: Table, fields: Sequence[str], dialect_name: str) -> list[str]:
+        if dialect_name != "postgresql":
+            return []
+
+        from sqlalchemy.dialects import postgresql
+
+        dialect = postgresql.dialect()  # type: ignore
+        preparer = dialect.identifier_preparer
+
+        ddl = ["CREATE EXTENSION IF NOT EXISTS pg_trgm"] if self.create_extension else []
+        for field in fields:
+            expression = _compile_index_expression(
+                _text_column(model_table.c[field]), dialect)
+            ddl.append(
+                f"CREATE INDEX IF NOT EXISTS {preparer.quote(f'ix_{model_table.name}_{field}_trgm')} "
+                f"ON {preparer.format_table(model_table)} USING gin (({expression}) gin_trgm_ops)"
+            )
+
+        return ddl
+
+
+class PgFullTextSearch(SearchBackend):
+    """Полнотекстовый поиск Postgres: to_tsvector(...) @@ plainto_tsquery(...) с GIN-индексом
+
+    Args:
+        config (str, optional): Конфигурация текстового поиска (regconfig). По умолчанию "simple".
+    """
+
+    def __init__(self, config: str = "simple") -> None:
+        if not re.fullmatch(r"\w+", config):
+            raise ValueError(f"Некорректная конфигурация поиска {config}")
+
+        self.config = config
+
+    def _vector(self, columns: Sequence[Any]) -> Any:
+        # Конфигурация и разделители - литералы, а не параметры, иначе выражение не совпадет с индексом
+        document: Any = None
+        for column in columns:
+            part = func.coalesce(_text_column(column), literal_column("''"))
+            document = part if document is None else document.op(
+                "||")(literal_column("' '")).op("||")(part)
+
+        return func.to_tsvector(literal_column(f"'{self.config}'::regconfig"), document)
+
+    def condition(self, model: Any, fields: Sequence[str], value: Any) -> ColumnElement[bool]:
+        vector = self._vector([getattr(model, field) for field in fields])
+        query = func.plainto_tsquery(
+            literal_column(f"'{self.config}'::regconfig"), value)
+        return vector.op("@@")(query)
+
+    def get_ddl(self, model_table: Table, fields: Sequence[str], dialect_name: str) -> list[str]:
+        if dialect_name != "postgresql":
+            return []
+
+        from sqlalchemy.dialects import postgresql
+
+        dialect = postgresql.dialect()  # type: ignore
+        preparer = dialect.identifier_preparer
+
+        expression = _compile_index_expression(
+            self._vector([model_table.c[field] for field in fields]), dialect)
+
+        return [
+            f"CREATE INDEX IF NOT EXISTS {preparer.quote(f'ix_{model_table.name}_fts')} "
+            f"ON {preparer.format_table(model_table)} USING gin ({expression})"
+        ]
+
+
+class SqliteFtsSearch(SearchBackend):
+    """Полнотекстовый поиск SQLite через виртуальную таблицу FTS5 {table}_fts
+
+    Таблица FTS5 хранит только индекс (content=таблица модели) и синхронизируется триггерами.
+    Индексируются поля, переданные в create_index; поиск идет только по полям запроса
+    (фильтр колонок FTS5), каждое слово строки поиска ищется как префикс.
+    """
+
+    def prepare(self, search: str) -> Any:
+        tokens = search.split()
+        return " ".join('"' + token.replace('"', '""') + '"*' for token in tokens) or '""'
+
+    def condition(self, model: Any, fields: Sequence[str], value: Any) -> ColumnElement[bool]:
+        model_table: Table = model.__table__
+        fts_name = f"{model_table.name}_fts"
+
+        mapper_columns = inspect(model).columns
+        columns = " ".join(
+            '"' + mapper_columns[field].name.replace('"', '""') + '"'
+            for field in fields
+        )
+
+        # {колонки} : (запрос) - совпадения только в полях поиска, а не во всех колонках FTS5
+        query = literal_column(
+            "'{" + columns.replace("'", "''") + "} : ('"
+        ).op("||")(value).op("||")(literal_column("')'"))
+
+        matched = select(
+            literal_column("rowid")
+        ).select_from(
+            table(fts_name)
+        ).where(
+            literal_column(f'"{fts_name}"').op("MATCH")(query)
+        )
+
+        return literal_column(f'"{model_table.name}".rowid').in_(matched)
+
+    def get_ddl(self, model_table: Table, fields: Sequence[str], dialect_name: str) -> list[str]:
+        if dialect_name != "sqlite":
+            return []
+
+        name = model_table.name
+        fts = f"{name}_fts"
+        names = [model_table.c[field].name for field in fields]
+        columns = ", ".join(f'"{column}"' for column in names)
+        new_values = ", ".join(f'new."{column}"' for column in names)
+        old_values = ", ".join(f'old."{column}"' for column in names)
+
+        return [
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS "{fts}" USING fts5({columns}, content=\'{name}\', content_rowid=\'rowid\')',
+            f'CREATE TRIGGER IF NOT EXISTS "{fts}_ai" AFTER INSERT ON "{name}" BEGIN '
+            f'INSERT INTO "{fts}"(rowid, {columns}) VALUES (new.rowid, {new_values}); END',
+            f'CREATE TRIGGER IF NOT EXISTS "{fts}_ad" AFTER DELETE ON "{name}" BEGIN '
+            f'INSERT INTO "{fts}"("{fts}", rowid, {columns}) VALUES (\'delete\', old.rowid, {old_values}); END',
+            f'CREATE TRIGGER IF NOT EXISTS "{fts}_au" AFTER UPDATE ON "{name}" BEGIN '
+            f'INSERT INTO "{fts}"("{fts}", rowid, {columns}) VALUES (\'delete\', old.rowid, {old_values}); '
+            f'INSERT INTO "{fts}"(rowid, {columns}) VALUES (new.rowid, {new_values}); END',
+        ]
+
+    async def create_index(self, conn: AsyncConnection, model_table: Table, fields: Sequence[str]) -> None:
+        if conn.dialect.name != "sqlite":
+            return
+
+        fts = f"{model_table.name}_fts"
+        r = await conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": fts}
+        )
+        is_created = r.scalar_one_or_none() is not None
+
+        await super().create_index(conn, model_table, fields)
+
+        # Уже существующие строки попадают в индекс только при первом создании таблицы FTS5
+        if not is_created:
+            await conn.execute(text(f'INSERT INTO "{fts}"("{fts}") VALUES (\'rebuild\')'))
@@ -0,0 +1,130 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+
+
+_log = logging.getLogger(__name__)
+
+
+T = TypeVar('T')
+
+
+def make_flight_key(*args: Any, **kwargs: Any) -> Optional[Hashable]:
+    """Ключ вызова из аргументов: словари и списки приводятся к кортежам
+
+    Returns:
+        Optional[Hashable]: Ключ или None, если аргументы нельзя хэшировать (вызов не объединяется)
+    """
+
+    key = (_freeze(args), _freeze(kwargs))
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(val)) for key, val in value.items()))  # type: ignore
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_freeze(item) for item in value]  # type: ignore
+        return tuple(sorted(items, key=repr) if isinstance(value, (set, frozenset)) else items)
+    return value
+
+
+class SingleFlight:
+    """Объединение одинаковых одновременных чтений в один запрос к БД
+
+    Пока выполняется вызов с ключом key, остальные вызовы с тем же ключом
+    не идут в БД, а ждут его результат (или исключение, например HTTPException 404).
+    Результат не сохраняется после завершения вызова - это не кэш.
+
+    Объединяются только чтения схем (is_model=False): объекты моделей
+    привязаны к сессии вызвавшего запроса и не могут передаваться в другие сессии.
+    Чтения сессий с незафиксированными изменениями (flush, insert/update/delete в открытой транзакции)
+    не объединяются: их результат не должен попадать в ответы других запросов.
+    Записи мимо ORM (session.execute(text(...)), соединение сессии) не отслеживаются -
+    после них нужно вызвать touch_tables или читать с is_single_flight=False.
+
+    Example:
+
+        single_flight = SingleFlight()
+        self.user = create_orm_manager(User, UserAdd, UserEdit, UserOut, single_flight=single_flight)
+
+        single_flight.stats  # {"calls": ..., "shared": ..., ...}
+    """
+
+    def __init__(self) -> None:
+        """Объединение одинаковых одновременных вызовов"""
+
+        self.__calls: dict[Hashable, asyncio.Future[Any]] = {}
+
+        self.calls = 0
+        self.shared = 0
+
+    def __len__(self) -> int:
+        return len(self.__calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Выполнение func или ожидание результата уже выполняющегося вызова с тем же ключом
+
+        Args:
+            key (Hashable): Ключ вызова
+            func (Callable[[], Awaitable[T]]): Вызов
+
+        Returns:
+            T: Результат вызова
+        """
+
+        future = self.__calls.get(key)
+
+        if future is not None:
+            self.shared += 1
+
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Отменен первый вызов (например, клиент отключился), а не текущий - выполняется заново
+                if not future.cancelled():
+                    raise
+
+                _log.debug("Single flight %s cancelled, retry", key)
+                return await func()
+
+        self.calls += 1
+
+        future = asyncio.get_running_loop().create_future()
+        self.__calls[key] = future
+
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Исключение получают ожидающие вызовы, без них оно не считается потерянным
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self.__calls.get(key) is future:
+                del self.__calls[key]
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Количество выполненных и объединенных вызовов"""
+
+        total = self.calls + self.shared
+
+        return {
+            "in_flight": len(self.__calls),
+            "calls": self.calls,
+            "shared": self.shared,
+            "shared_rate": self.shared / total if total else 0.0,
+        }
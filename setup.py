@@ -12,13 +12,21 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/ErJokeCode/orm_core",
-    packages=find_packages(),
+    packages=find_packages(exclude=["tests", "tests.*"]),
     install_requires=[
         'pydantic>=2.11.4',
         'fastapi>=0.115.12',
         'SQLAlchemy>=2.0.41',
         'asyncpg==0.30.0'
     ],
+    extras_require={
+        'test': [
+            'pytest>=8.0',
+            'pytest-asyncio>=0.24',
+            'aiosqlite>=0.20',
+            'httpx>=0.27',
+        ],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
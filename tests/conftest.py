@@ -0,0 +1,75 @@
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+import pytest
+from sqlalchemy import event
+
+from orm_core import ClientDB, create_orm_manager
+
+from .models import Group, Tag, User
+
+
+class DB(ClientDB):
+
+    def __init__(self, async_url: str, **kwargs: Any):
+        super().__init__(async_url)
+
+        self.group = create_orm_manager(Group)
+        self.user = create_orm_manager(
+            User,
+            session_factory=self.session_factory,
+            api=True,
+            search_fields=["name"],
+            **kwargs
+        )
+        self.tag = create_orm_manager(Tag, session_factory=self.session_factory, api=True)
+
+    async def seed(self, n: int = 25) -> None:
+        """Группа g1, n пользователей user000... с age = i % 5 и score = i и два тега"""
+
+        await self.init_db()
+
+        async with self.session_factory() as session:
+            group = Group(name="g1")
+            session.add(group)
+            await session.flush()
+
+            for i in range(n):
+                session.add(User(name=f"user{i:03d}", age=i % 5, score=i, group_id=group.id, bio="x" * 10))
+
+            session.add(Tag(code="a", lang="en", title="A"))
+            session.add(Tag(code="a", lang="ru", title="А"))
+            await session.commit()
+
+
+@pytest.fixture
+async def make_db(tmp_path) -> AsyncIterator[Callable[..., Awaitable[DB]]]:
+    dbs: list[DB] = []
+
+    async def make(n: int = 25, **kwargs: Any) -> DB:
+        db = DB(f"sqlite+aiosqlite:///{tmp_path}/{len(dbs)}.db", **kwargs)
+        dbs.append(db)
+        await db.seed(n)
+        return db
+
+    yield make
+
+    for db in dbs:
+        await db.engine.dispose()
+
+
+@pytest.fixture
+async def db(make_db) -> DB:
+    return await make_db()
+
+
+@pytest.fixture
+def statements(db) -> list[str]:
+    """SQL, отправленные в БД фикстуры db"""
+
+    result: list[str] = []
+    event.listen(
+        db.engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: result.append(statement)
+    )
+    return result
@@ -0,0 +1,84 @@
+from typing import Optional
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import ForeignKey, String, Text, func
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
+
+from orm_core import Base
+
+
+class Group(Base):
+    __tablename__ = "groups"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+
+    users: Mapped[list["User"]] = relationship(back_populates="group")
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+    age: Mapped[int] = mapped_column(default=0)
+    score: Mapped[Optional[int]] = mapped_column(nullable=True)
+    bio: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    group_id: Mapped[Optional[int]] = mapped_column(ForeignKey("groups.id"), nullable=True)
+
+    group: Mapped[Optional[Group]] = relationship(back_populates="users")
+
+    @hybrid_property
+    def label(self) -> str:
+        return f"{self.name}:{self.age}"
+
+
+class Tag(Base):
+    __tablename__ = "tags"
+
+    code: Mapped[str] = mapped_column(String(20), primary_key=True)
+    lang: Mapped[str] = mapped_column(String(5), primary_key=True)
+    title: Mapped[str] = mapped_column(String(50))
+
+
+class GroupOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+
+
+class UserAdd(BaseModel):
+    name: str
+
+
+class UserOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    age: int
+    group: Optional[GroupOut] = None
+
+
+class Article(Base):
+    __tablename__ = "articles"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column("article_title", String(100))
+    body: Mapped[str] = mapped_column(Text)
+    title_length: Mapped[int] = column_property(func.length(title))
+
+
+class ArticleLengthOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title_length: int
+
+
+class UserLabelOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    label: str
@@ -0,0 +1,64 @@
+from sqlalchemy import select
+
+from orm_core import create_orm_manager
+from orm_core.basic_operations.model.identity import GET_MANY_CHUNK_SIZE
+
+from .models import User, UserAdd, UserOut
+
+
+async def test_add_many_loads(db, statements):
+    manager = create_orm_manager(User, UserAdd, UserAdd, UserOut)
+    count = GET_MANY_CHUNK_SIZE + 10
+
+    async with db.session_factory() as session:
+        statements.clear()
+        items = await manager.add_many(
+            session=session,
+            data=[{"name": f"new{i}", "group_id": 1} for i in range(count)],
+            is_model=False,
+            chunk_size=count
+        )
+        await session.commit()
+
+    assert [item.name for item in items] == [f"new{i}" for i in range(count)]
+    assert all(item.group is not None and item.group.name == "g1" for item in items)
+
+    # Связи загружаются запросами IN по GET_MANY_CHUNK_SIZE ключей
+    loads = [statement for statement in statements if statement.lstrip().startswith("SELECT users")]
+    assert len(loads) == 2
+
+
+async def test_add_returning(db):
+    async with db.session_factory() as session:
+        user = await db.user.add(
+            session=session,
+            data={"name": "returned", "group_id": 1},
+            write_mode="returning",
+            loads={"group": "j"}
+        )
+        assert user.group is not None and user.group.name == "g1"
+        user_id = user.id
+        await session.commit()
+
+        assert (await session.scalar(select(User.name).where(User.id == user_id))) == "returned"
+
+
+async def test_add_many_order_across_chunks(db):
+    async with db.session_factory() as session:
+        users = await db.user.add_many(
+            session=session,
+            data=[{"name": f"chunk{i:02d}", "age": i % 3} for i in range(11)],
+            chunk_size=4
+        )
+        assert [user.name for user in users] == [f"chunk{i:02d}" for i in range(11)]
+        assert [user.age for user in users] == [i % 3 for i in range(11)]
+        ids = [user.id for user in users]
+        assert ids == sorted(ids) and len(set(ids)) == 11
+
+        assert await db.user.add_many(session=session, data=[{"name": "silent"}] * 3, is_return=False, chunk_size=2) is None
+        await session.commit()
+
+    async with db.session_factory() as session:
+        assert await db.user.count(session=session) == 25 + 11 + 3
+        rows = (await session.execute(select(User.id, User.name).where(User.id.in_(ids)))).all()
+        assert dict(rows) == {pk: f"chunk{i:02d}" for i, pk in enumerate(ids)}
@@ -0,0 +1,59 @@
+import asyncio
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from orm_core import SingleFlight, TTLCache
+
+
+async def test_api_model_count_cache(make_db):
+    count_cache = TTLCache()
+    db = await make_db(count_cache=count_cache)
+
+    assert db.user.count_cache is count_cache
+    assert db.user.manager_api.count_cache is count_cache
+
+    app = FastAPI()
+    app.include_router(db.user.router)
+
+    async with AsyncClient(transport=ASGITransport(app), base_url="http://test") as client:
+        for _ in range(2):
+            response = await client.get("/user/all", params={"limit": 5})
+            assert response.json()["total_record"] == 25
+
+    assert count_cache.stats["hits"] == 1
+
+
+async def test_api_model_object_cache(make_db):
+    object_cache = TTLCache()
+    db = await make_db(object_cache=object_cache)
+
+    assert db.user.manager_api.object_cache is object_cache
+
+    app = FastAPI()
+    app.include_router(db.user.router)
+
+    async with AsyncClient(transport=ASGITransport(app), base_url="http://test") as client:
+        for _ in range(2):
+            assert (await client.get("/user/3")).json()["name"] == "user002"
+
+    assert object_cache.stats["hits"] == 1
+
+
+async def test_api_model_single_flight(make_db):
+    single_flight = SingleFlight()
+    db = await make_db(single_flight=single_flight, single_flight_routes=["get_by"])
+
+    assert db.user.manager_api.single_flight is single_flight
+    assert db.user.single_flight_routes == ["get_by"]
+
+    app = FastAPI()
+    app.include_router(db.user.router)
+
+    async with AsyncClient(transport=ASGITransport(app), base_url="http://test") as client:
+        responses = await asyncio.gather(*(client.get("/user/3") for _ in range(3)))
+        assert all(response.json()["name"] == "user002" for response in responses)
+
+        await client.get("/user/all")
+
+    assert single_flight.stats["calls"] + single_flight.stats["shared"] == 3
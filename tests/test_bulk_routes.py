@@ -0,0 +1,44 @@
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from .models import User
+
+
+async def test_bulk_routes(make_db):
+    db = await make_db(n=5, bulk_routes=True)
+
+    app = FastAPI()
+    app.include_router(db.user.router)
+
+    async with AsyncClient(transport=ASGITransport(app), base_url="http://test") as client:
+        # Повтор первичного ключа: ошибка пачки, элементы повторяются по одному
+        response = await client.post("/user/bulk", json=[
+            {"id": 100, "name": "b1"},
+            {"id": 1, "name": "duplicate"},
+            {"id": 101, "name": "b2"},
+        ])
+        data = response.json()
+        assert data["succeeded"] == 2 and data["failed"] == 1
+        assert [item["status_code"] for item in data["items"]] == [200, 400, 200]
+        assert data["items"][2]["item"]["name"] == "b2"
+
+        response = await client.patch("/user/bulk", json=[
+            {"id": 1, "changes": {"name": "p1"}},
+            {"id": 3, "changes": {"name": "p3"}},
+        ])
+        data = response.json()
+        assert data["succeeded"] == 2
+        assert [item["item"]["name"] for item in data["items"]] == ["p1", "p3"]
+
+        response = await client.request("DELETE", "/user/bulk", json=[4, 5])
+        assert response.json()["succeeded"] == 2
+
+    async with db.session_factory() as session:
+        names = {
+            pk: user.name if user is not None else None
+            for pk in (1, 2, 3, 4, 5, 100, 101)
+            for user in [await session.get(User, pk)]
+        }
+
+    # Откатывается только ошибочный элемент
+    assert names == {1: "p1", 2: "user001", 3: "p3", 4: None, 5: None, 100: "b1", 101: "b2"}
@@ -0,0 +1,151 @@
+from orm_core import TTLCache, create_orm_manager
+
+from .models import Group, User, UserAdd, UserOut
+
+
+async def test_object_cache_invalidation(db, statements):
+    cache = TTLCache(maxsize=2)
+    manager = create_orm_manager(User, UserAdd, UserAdd, UserOut, object_cache=cache)
+
+    async with db.session_factory() as session:
+        first = await manager.get_by(session=session, id=1)
+
+    statements.clear()
+    async with db.session_factory() as session:
+        assert await manager.get_by(session=session, id=1) is first
+        assert not statements
+
+    async with db.session_factory() as session:
+        user = await session.get(User, 1)
+        assert user is not None
+        user.name = "renamed"
+        await session.commit()
+
+    async with db.session_factory() as session:
+        assert (await manager.get_by(session=session, id=1)).name == "renamed"
+
+        # Запись в таблицу связи тоже сбрасывает кэш
+        group = await session.get(Group, 1)
+        assert group is not None
+        group.name = "g2"
+        await session.commit()
+
+        assert (await manager.get_by(session=session, id=1)).group.name == "g2"
+
+        await manager.get_by(session=session, id=2)
+        await manager.get_by(session=session, id=3)
+
+    assert cache.stats["evictions"] == 1
+
+
+async def test_object_cache_skips_uncommitted(db):
+    cache = TTLCache()
+    manager = create_orm_manager(User, UserAdd, UserAdd, UserOut, object_cache=cache)
+
+    async with db.session_factory() as session:
+        await manager.get_by(session=session, id=1)
+
+    async with db.session_factory() as session:
+        user = await session.get(User, 1)
+        assert user is not None
+        user.name = "uncommitted"
+        await session.flush()
+
+        # Незафиксированное значение видно своей сессии, но не попадает в кэш
+        assert (await manager.get_by(session=session, id=1)).name == "uncommitted"
+        assert (await manager.get_by(session=session, id=2)).name == "user001"
+        assert len(cache) == 0
+
+        await session.rollback()
+
+    async with db.session_factory() as session:
+        assert (await manager.get_by(session=session, id=1)).name == "user000"
+        assert len(cache) == 1
+
+
+async def test_negative_cache(make_db):
+    cache = TTLCache()
+    db = await make_db(n=3, negative_cache=cache)
+
+    async with db.session_factory() as session:
+        assert await db.user.get_by(session=session, id=10, is_get_none=True) is None
+        assert not await db.user.exists(session=session, id=10)
+        assert cache.stats["hits"] == 1
+
+        # Добавление объекта с ключом удаляет запись о промахе
+        session.add(User(id=10, name="ten"))
+        await session.commit()
+
+        assert (await db.user.get_by(session=session, id=10)).name == "ten"
+
+
+async def test_negative_cache_skips_uncommitted(make_db):
+    cache = TTLCache()
+    db = await make_db(n=3, negative_cache=cache)
+
+    async with db.session_factory() as session:
+        user = await session.get(User, 2)
+        await session.delete(user)
+        await session.flush()
+
+        assert await db.user.get_by(session=session, id=2, is_get_none=True) is None
+        assert not await db.user.exists(session=session, id=2)
+        assert len(cache) == 0
+
+        await session.rollback()
+
+    async with db.session_factory() as session:
+        assert (await db.user.get_by(session=session, id=2)).name == "user001"
+
+
+async def test_count_cache_invalidation(make_db):
+    cache = TTLCache()
+    db = await make_db(n=3, count_cache=cache)
+
+    async def total() -> int:
+        async with db.session_factory() as session:
+            return (await db.user.get_all(session, limit=1)).total_record
+
+    assert await total() == 3
+    assert await total() == 3
+    assert cache.stats["hits"] == 1
+
+    # Запись через ORM-сессию
+    async with db.session_factory() as session:
+        session.add(User(name="orm"))
+        await session.commit()
+    assert await total() == 4
+
+    # Откат незафиксированной записи сбрасывает значение, закэшированное до rollback
+    async with db.session_factory() as session:
+        session.add(User(name="rolled back"))
+        await session.flush()
+        assert (await db.user.get_all(session, limit=1)).total_record == 5
+        await session.rollback()
+    assert await total() == 4
+
+    # Загрузка мимо ORM через движок
+    await db.user.bulk_load(db.engine, [{"name": "bulk"}])
+    assert await total() == 5
+
+
+async def test_count_cache_skips_uncommitted(make_db):
+    cache = TTLCache()
+    db = await make_db(n=3, count_cache=cache)
+
+    async with db.session_factory() as writer:
+        writer.add(User(name="uncommitted"))
+        await writer.flush()
+
+        # Своя сессия видит незафиксированную строку, но не публикует количество
+        assert (await db.user.get_all(writer, limit=1)).total_record == 4
+        assert len(cache) == 0
+
+        async with db.session_factory() as reader:
+            assert (await db.user.get_all(reader, limit=1)).total_record == 3
+            assert (await db.user.get_all(reader, limit=1)).total_record == 3
+
+        # Кэшированное другой сессией значение не читается сессией с изменениями
+        assert (await db.user.get_all(writer, limit=1)).total_record == 4
+
+        await writer.rollback()
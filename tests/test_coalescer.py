@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+from sqlalchemy import exc
+
+from orm_core import AddCoalescer, create_orm_manager
+
+from .models import User, UserAdd, UserOut
+
+
+async def test_add_coalescer_row_errors(make_db):
+    db = await make_db(n=2)
+    manager = create_orm_manager(User, UserAdd, UserAdd, UserOut)
+    coalescer = manager.get_add_coalescer(db.session_factory, max_batch_size=4, max_delay=0.01, loads={"group": "s"})
+
+    data: list[object] = [{"id": 100 + i, "name": f"c{i}", "group_id": 1} for i in range(10)]
+    data[5] = {"id": 1, "name": "duplicate"}
+    data[7] = UserAdd(name="c7")
+
+    results = await asyncio.gather(*(coalescer.add(item) for item in data), return_exceptions=True)
+
+    # Ошибка строки достается только ее вызывающему, остальные строки пачки записаны
+    assert isinstance(results[5], exc.IntegrityError)
+    assert [item.name for i, item in enumerate(results) if i != 5] == [f"c{i}" for i in range(10) if i != 5]
+    assert results[0].group.name == "g1" and results[7].group is None
+
+    stats = coalescer.stats
+    assert stats["batches"] == 3 and stats["rows"] == 10 and stats["errors"] == 1 and stats["max_batch_rows"] == 4
+
+    async with db.session_factory() as session:
+        assert (await session.get(User, 109)).name == "c9"
+        assert (await session.get(User, 1)).name == "user000"
+
+
+async def test_add_coalescer_batch_error():
+    calls: list[list[int]] = []
+
+    async def write_many(data: list[int]) -> list[object]:
+        calls.append(data)
+        if len(calls) == 1:
+            raise RuntimeError("batch failed")
+        return [item * 10 if item else ValueError("row failed") for item in data]
+
+    coalescer: AddCoalescer[int] = AddCoalescer(write_many, max_batch_size=3, max_delay=0.01)
+
+    results = await asyncio.gather(*(coalescer.add(i) for i in (1, 2, 3)), return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    # После ошибки пачки объединитель продолжает работать
+    results = await asyncio.gather(coalescer.add(0), coalescer.add(4), return_exceptions=True)
+    assert isinstance(results[0], ValueError) and results[1] == 40
+
+    assert calls == [[1, 2, 3], [0, 4]]
+    assert coalescer.stats["errors"] == 4
+
+
+async def test_add_coalescer_cancel_and_flush():
+    release = asyncio.Event()
+
+    async def write_many(data: list[int]) -> list[int]:
+        await release.wait()
+        return data
+
+    coalescer: AddCoalescer[int] = AddCoalescer(write_many, max_batch_size=10, max_delay=10)
+
+    first = asyncio.ensure_future(coalescer.add(1))
+    second = asyncio.ensure_future(coalescer.add(2))
+    await asyncio.sleep(0)
+    assert len(coalescer) == 2
+
+    flush = asyncio.ensure_future(coalescer.flush())
+    await asyncio.sleep(0)
+
+    # Отмена одного вызывающего не отменяет запись пачки для остальных
+    first.cancel()
+    release.set()
+    await flush
+
+    assert await second == 2
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert coalescer.stats["batches"] == 1 and coalescer.stats["pending"] == 0
+
+
+def test_add_coalescer_batch_size():
+    async def write_many(data: list[int]) -> list[int]:
+        return data
+
+    with pytest.raises(ValueError):
+        AddCoalescer(write_many, max_batch_size=0)
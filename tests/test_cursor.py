@@ -0,0 +1,79 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import update
+
+from orm_core.basic_operations.model.cursor import decode_cursor, encode_cursor
+
+from .models import User
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor([3, "user002"], sort_by="name", desc=1, is_backward=True)
+
+    assert decode_cursor(cursor, [int, str], sort_by="name", desc=1) == ([3, "user002"], True)
+    assert decode_cursor(encode_cursor([None, 1], "score", 0), [int, int], "score", 0) == ([None, 1], False)
+
+
+@pytest.mark.parametrize("cursor, sort_by, desc", [
+    ("garbage", None, 0),
+    (encode_cursor([1], None, 0), None, 1),
+    (encode_cursor([1], None, 0), "name", 0),
+    (encode_cursor([1, 2], None, 0), None, 0),
+    (encode_cursor(["x"], None, 0), None, 0),
+])
+def test_cursor_invalid(cursor, sort_by, desc):
+    with pytest.raises(HTTPException) as e:
+        decode_cursor(cursor, [int], sort_by=sort_by, desc=desc)
+
+    assert e.value.status_code == 400
+
+
+async def walk(db, session, **kwargs):
+    pages = []
+
+    page = await db.user.get_all_cursor(session, limit=4, **kwargs)
+    assert page.prev_cursor is None
+    pages.append([item.id for item in page.content])
+
+    while page.next_cursor:
+        page = await db.user.get_all_cursor(session, cursor=page.next_cursor, limit=4, **kwargs)
+        pages.append([item.id for item in page.content])
+
+    # Обратный проход возвращает те же страницы
+    back = [pages[-1]]
+    while page.prev_cursor:
+        page = await db.user.get_all_cursor(session, cursor=page.prev_cursor, limit=4, **kwargs)
+        back.append([item.id for item in page.content])
+
+    assert back[::-1] == pages
+    return [pk for ids in pages for pk in ids]
+
+
+@pytest.mark.parametrize("desc", [0, 1])
+async def test_cursor_walk(db, desc):
+    async with db.session_factory() as session:
+        ids = await walk(db, session, sort_by="age", desc=desc)
+
+    expected = sorted(range(1, 26), key=lambda pk: ((pk - 1) % 5, pk), reverse=bool(desc))
+    assert ids == expected
+
+
+@pytest.mark.parametrize("desc", [0, 1])
+async def test_cursor_walk_nullable(make_db, desc):
+    db = await make_db(n=12)
+
+    async with db.session_factory() as session:
+        await session.execute(update(User).where(User.id.in_([3, 7, 8])).values(score=None))
+        await session.execute(update(User).where(User.id.in_([4, 5])).values(score=1))
+        await session.commit()
+
+        ids = await walk(db, session, sort_by="score", desc=desc)
+
+    scores = {pk: pk - 1 for pk in range(1, 13)} | {3: None, 7: None, 8: None, 4: 1, 5: 1}
+    # NULL больше любого значения
+    expected = sorted(
+        scores,
+        key=lambda pk: (scores[pk] is None, scores[pk] or 0, pk),
+        reverse=bool(desc)
+    )
+    assert ids == expected
@@ -0,0 +1,48 @@
+import pytest
+from fastapi import FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+
+from .models import User
+
+
+async def test_patch_exclude_unset(make_db):
+    db = await make_db(n=3)
+
+    app = FastAPI()
+    app.include_router(db.user.router)
+
+    async with AsyncClient(transport=ASGITransport(app), base_url="http://test") as client:
+        response = await client.patch("/user/2", json={"name": "patched"})
+        assert response.status_code == 200 and response.json()["name"] == "patched"
+
+    async with db.session_factory() as session:
+        user = await session.get(User, 2)
+        # Поля, не переданные в PATCH, не меняются
+        assert (user.name, user.age, user.score, user.bio, user.group_id) == ("patched", 1, 1, "x" * 10, 1)
+
+
+async def test_patch_direct(make_db):
+    db = await make_db(n=3, write_mode="direct")
+
+    app = FastAPI()
+    app.include_router(db.user.router)
+
+    async with AsyncClient(transport=ASGITransport(app), base_url="http://test") as client:
+        # В режиме direct явный null записывается
+        response = await client.patch("/user/2", json={"score": None})
+        assert response.status_code == 200
+        assert (await client.patch("/user/99", json={"score": 1})).status_code == 404
+
+    async with db.session_factory() as session:
+        user = await session.get(User, 2)
+        assert (user.name, user.age, user.score, user.bio) == ("user001", 1, None, "x" * 10)
+
+        with pytest.raises(HTTPException) as error:
+            await db.user.edit(session=session, edit_item={"age": 4}, write_mode="direct", id=99)
+        assert error.value.status_code == 404
+
+        await db.user.edit(session=session, edit_item={"age": 4}, write_mode="direct", is_return=False, id=3)
+        await session.commit()
+
+    async with db.session_factory() as session:
+        assert (await session.get(User, 3)).age == 4
@@ -0,0 +1,113 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from orm_core import TTLCache, create_orm_manager
+
+from .models import User, UserAdd, UserOut
+
+
+async def test_edit_many_where(make_db):
+    count_cache = TTLCache()
+    db = await make_db(n=6, count_cache=count_cache)
+    manager = create_orm_manager(User, UserAdd, UserAdd, UserOut)
+
+    async with db.session_factory() as session:
+        await db.user.get_all(session)
+        assert len(count_cache) == 1
+
+        loaded = await session.get(User, 1)
+        assert loaded is not None
+
+        result = await manager.edit_many(session=session, where={"age": 0}, values={"bio": "zero"})
+        assert result.rowcount == 2 and result.content is None
+        # Запись мимо ORM сбрасывает кэши таблицы
+        assert len(count_cache) == 0
+
+        result = await manager.edit_many(
+            session=session,
+            where=User.id <= 2,
+            values={"age": User.age + 10},
+            is_return=True,
+            is_model=False
+        )
+        assert result.rowcount == 2
+        assert sorted(item.age for item in result.content) == [10, 11]
+        assert result.content[0].group.name == "g1"
+        # Объект в identity map обновлен значениями из RETURNING
+        assert loaded.age == 10 and loaded.bio == "zero"
+
+        with pytest.raises(ValueError):
+            await manager.edit_many(session=session, where={"id": 1})
+
+        with pytest.raises(ValueError):
+            await manager.edit_many(session=session, where={"id": 1}, values={"name": "x"}, items=[])
+
+
+async def test_edit_many_items(make_db):
+    db = await make_db(n=6)
+    manager = create_orm_manager(User, UserAdd, UserAdd, UserOut)
+
+    statements: list[str] = []
+    event.listen(
+        db.engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement)
+    )
+
+    async with db.session_factory() as session:
+        loaded = await session.get(User, 1)
+        assert loaded is not None
+
+        result = await manager.edit_many(session=session, items=[
+            {"id": 1, "changes": {"name": "a"}},
+            {"id": 2, "changes": {"name": "b", "age": 5}},
+            {"id": 99, "changes": {"name": "z"}},
+            {"id": 3, "changes": {"name": "c"}},
+            {"id": 4, "changes": {}},
+        ], chunk_size=3)
+        assert result.rowcount == 3 and result.content is None
+        # Одна команда на набор полей в пачке: {name} x 2 пачки и {name, age}
+        assert len([statement for statement in statements if statement.startswith("UPDATE")]) == 3
+        assert loaded.name == "a" and loaded not in session.dirty
+
+        result = await manager.edit_many(session=session, items=[
+            {"id": 5, "changes": UserAdd(name="e")},
+            {"id": 98, "changes": {"name": "y"}},
+            {"id": 6, "changes": {"group_id": None}},
+        ], is_return=True, is_model=False)
+        assert result.rowcount == 2
+        assert result.content[0].name == "e" and result.content[1] is None and result.content[2].group is None
+
+        result = await db.tag.edit_many(session=session, items=[
+            {"code": "a", "lang": "ru", "changes": {"title": "Б"}},
+        ], is_return=True)
+        assert result.rowcount == 1 and result.content[0].title == "Б"
+
+        await session.commit()
+
+    async with db.session_factory() as session:
+        assert (await session.get(User, 2)).age == 5
+        assert (await session.get(User, 6)).group_id is None
+
+
+async def test_edit_many_items_invalid(make_db):
+    db = await make_db(n=3)
+
+    async with db.session_factory() as session:
+        with pytest.raises(HTTPException) as error:
+            await db.user.edit_many(session=session, items=[
+                {"id": 1, "changes": {"name": "a"}},
+                {"changes": {"name": "b"}},
+            ])
+        assert error.value.status_code == 400 and "Строка 1" in error.value.detail and "id" in error.value.detail
+
+        with pytest.raises(HTTPException) as error:
+            await db.user.edit_many(session=session, items=[
+                {"id": 1, "changes": {"name": "a", "unknown": 1}},
+            ])
+        assert error.value.status_code == 400 and "unknown" in error.value.detail
+
+    async with db.session_factory() as session:
+        # Ни одна строка не записана
+        assert (await session.get(User, 1)).name == "user000"
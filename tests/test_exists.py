@@ -0,0 +1,27 @@
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+
+async def test_exists_and_count(db):
+    async with db.session_factory() as session:
+        assert await db.user.exists(session=session, id=1)
+        assert not await db.user.exists(session=session, id=999)
+        assert await db.user.exists(session=session, age=4)
+        assert not await db.user.exists(session=session, age=7)
+
+        assert await db.user.count(session=session) == 25
+        assert await db.user.count(session=session, age=1) == 5
+        assert await db.user.count(session=session, search="user01", search_fields=["name"]) == 10
+
+
+async def test_exists_and_count_routes(db):
+    app = FastAPI()
+    app.include_router(db.user.router)
+
+    async with AsyncClient(transport=ASGITransport(app), base_url="http://test") as client:
+        response = await client.head("/user/1")
+        assert response.status_code == 200 and response.content == b""
+        assert (await client.head("/user/999")).status_code == 404
+
+        assert (await client.get("/user/count")).json()["count"] == 25
+        assert (await client.get("/user/count", params={"search": "user02"})).json()["count"] == 5
@@ -0,0 +1,38 @@
+async def test_window_count(db, statements):
+    async with db.session_factory() as session:
+        for filters in ({}, {"age": 2}):
+            query = await db.user.get_all(session, page=2, limit=3, sort_by="id", **filters)
+
+            statements.clear()
+            window = await db.user.get_all(session, page=2, limit=3, sort_by="id", count_strategy="window", **filters)
+            # Страница и total_record одним запросом
+            assert len(statements) == 1
+
+            assert window.total_record == query.total_record
+            assert window.total_pages == query.total_pages
+            assert [user.id for user in window.content] == [user.id for user in query.content]
+
+        # Страница за пределами: количество отдельным запросом
+        window = await db.user.get_all(session, page=20, limit=3, count_strategy="window")
+        assert window.content == [] and window.total_record == 25
+
+
+async def test_count_modes(db):
+    async with db.session_factory() as session:
+        capped = await db.user.get_all(session, limit=5, count_mode="capped", count_cap=10)
+        assert capped.total_record == 10 and capped.is_total_approximate
+        assert capped.total_pages == 2
+
+        capped = await db.user.get_all(session, limit=5, count_mode="capped", count_cap=10, age=1)
+        assert capped.total_record == 5 and not capped.is_total_approximate
+
+        # SQLite: оценка по max(rowid) без фильтров
+        estimate = await db.user.get_all(session, limit=5, count_mode="estimate")
+        assert estimate.total_record == 25 and estimate.is_total_approximate
+
+        # С фильтром оценка невозможна: точный подсчет
+        estimate = await db.user.get_all(session, limit=5, count_mode="estimate", age=1)
+        assert estimate.total_record == 5 and not estimate.is_total_approximate
+
+        exact = await db.user.get_all(session, limit=5)
+        assert exact.total_record == 25 and not exact.is_total_approximate
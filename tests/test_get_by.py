@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from orm_core import create_orm_manager
+
+from .models import User, UserAdd, UserOut
+
+
+async def test_get_by_identity_map(db, statements):
+    async with db.session_factory() as session:
+        user = await db.user.get_by(session=session, id=1)
+
+        # Объект в identity map: без запроса к БД
+        statements.clear()
+        assert await db.user.get_by(session=session, id=1) is user
+        assert statements == []
+
+        # Незагруженная связь догружается одним запросом, дальше берется из identity map
+        assert (await db.user.get_by(session=session, id=1, loads={"group": "j"})).group.name == "g1"
+        assert len(statements) == 1
+        assert (await db.user.get_by(session=session, id=1, loads={"group": "j"})) is user
+        assert len(statements) == 1
+
+        # Фильтр не по первичному ключу - запрос
+        assert (await db.user.get_by(session=session, name="user000")) is user
+        assert len(statements) == 2
+
+        assert await db.user.get_by(session=session, id=999, is_get_none=True) is None
+        with pytest.raises(HTTPException) as error:
+            await db.user.get_by(session=session, id=999)
+        assert error.value.status_code == 404
+
+
+async def test_get_many(db, statements):
+    manager = create_orm_manager(User, UserAdd, UserAdd, UserOut)
+
+    async with db.session_factory() as session:
+        users = await db.user.get_many(session=session, pks=[3, 99, 1, 3])
+        assert [user.id if user is not None else None for user in users] == [3, None, 1, 3]
+        assert len(statements) == 1
+
+        tags = await db.tag.get_many(session=session, pks=[("a", "ru"), ("b", "ru"), ("a", "en")])
+        assert [tag.title if tag is not None else None for tag in tags] == ["А", None, "A"]
+
+        items = await manager.get_many(session=session, pks=[2, 98], is_model=False)
+        assert items[0].name == "user001" and items[0].group.name == "g1" and items[1] is None
+
+
+async def test_get_by_batching(make_db):
+    db = await make_db(batch_get_by=True)
+
+    statements: list[str] = []
+    event.listen(
+        db.engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement)
+    )
+
+    async with db.session_factory() as session:
+        users = await asyncio.gather(
+            *(db.user.get_by(session=session, id=pk, is_get_none=True) for pk in (5, 6, 7, 99))
+        )
+        assert [user.id if user is not None else None for user in users] == [5, 6, 7, None]
+        # Ключи одного тика загружаются одним запросом
+        assert len(statements) == 1
+        assert db.user.get_loader(session).stats["batches"] == 1
@@ -0,0 +1,87 @@
+from httpx import ASGITransport, AsyncClient
+from fastapi import FastAPI
+
+from orm_core import create_orm_manager
+
+from .models import Article, ArticleLengthOut, User, UserAdd, UserLabelOut, UserOut
+
+
+async def test_cursor_walk_with_fields(db):
+    manager = create_orm_manager(User, UserAdd, UserAdd, UserOut)
+
+    async with db.session_factory() as session:
+        names: list[str] = []
+        cursor = None
+        while True:
+            page = await manager.get_all_cursor(
+                session=session,
+                cursor=cursor,
+                limit=4,
+                sort_by="score",
+                desc=1,
+                is_model=False,
+                fields=["name"]
+            )
+            assert all(item.model_dump().keys() == {"name"} for item in page.content)
+            names.extend(item.name for item in page.content)
+
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+    assert names == [f"user{i:03d}" for i in range(24, -1, -1)]
+
+
+async def test_cursor_route_with_fields(make_db):
+    db = await make_db(return_get_all="cursor")
+
+    app = FastAPI()
+    app.include_router(db.user.router)
+
+    async with AsyncClient(transport=ASGITransport(app), base_url="http://test") as client:
+        ids: list[int] = []
+        params = {"limit": 3, "sort_by": "age", "fields": "id"}
+        while True:
+            response = await client.get("/user/all", params=params)
+            assert response.status_code == 200
+            data = response.json()
+            ids.extend(item["id"] for item in data["content"])
+
+            if data["next_cursor"] is None:
+                break
+            params["cursor"] = data["next_cursor"]
+
+    assert ids == sorted(range(1, 26), key=lambda pk: ((pk - 1) % 5, pk))
+
+
+async def test_core_read(db):
+    manager = create_orm_manager(User, UserAdd, UserAdd, UserOut)
+
+    async with db.session_factory() as session:
+        items = await manager.get_all(session, sort_by="id", limit=3, is_pagination=False, is_model=False, read_mode="core", loads={})
+        assert [(item.id, item.name, item.age) for item in items] == [(1, "user000", 0), (2, "user001", 1), (3, "user002", 2)]
+        # Core не создает объекты модели
+        assert not list(session.identity_map.values())
+
+        item = await manager.get_by(session=session, id=2, is_model=False, read_mode="core", loads={}, fields=["name"])
+        assert item.model_dump() == {"name": "user001"}
+
+
+async def test_core_read_fallback_for_non_column_fields(db):
+    users = create_orm_manager(User, UserAdd, UserAdd, UserLabelOut)
+    articles = create_orm_manager(Article, UserAdd, UserAdd, ArticleLengthOut)
+
+    async with db.session_factory() as session:
+        # hybrid_property не колонка: чтение через ORM
+        items = await users.get_all(session, sort_by="id", limit=2, is_pagination=False, is_model=False, read_mode="core")
+        assert [item.label for item in items] == ["user000:0", "user001:1"]
+
+        item = await users.get_by(session=session, id=3, is_model=False, read_mode="core")
+        assert item.label == "user002:2"
+
+        session.add(Article(id=1, title="hello", body="world"))
+        await session.flush()
+
+        # column_property - выражение, а не колонка таблицы
+        items = await articles.get_all(session, is_pagination=False, is_model=False, read_mode="core")
+        assert [item.title_length for item in items] == [5]
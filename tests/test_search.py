@@ -0,0 +1,65 @@
+import pytest
+
+from orm_core import IlikeSearch, PgTrigramSearch, SearchBackend, SqliteFtsSearch, create_orm_manager
+
+from .models import Article
+
+
+def test_search_backend_abstract():
+    class NoCondition(SearchBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        NoCondition()  # type: ignore
+
+    assert isinstance(IlikeSearch(), SearchBackend)
+
+
+async def test_ilike_search(db):
+    async with db.session_factory() as session:
+        result = await db.user.get_all(session, search="ser00", search_fields=["name"], limit=-1)
+
+    assert [item.id for item in result.content] == list(range(1, 11))
+
+
+def test_pg_trigram_ddl(db):
+    table = db.user.model.__table__
+
+    ddl = PgTrigramSearch().get_ddl(table, ["name", "age"], "postgresql")
+    assert len(ddl) == 2 and all(item.startswith("CREATE INDEX IF NOT EXISTS") for item in ddl)
+    assert "CAST(age AS VARCHAR)" in ddl[1]
+
+    ddl = PgTrigramSearch(create_extension=True).get_ddl(table, ["name"], "postgresql")
+    assert ddl[0] == "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+
+    assert PgTrigramSearch().get_ddl(table, ["name"], "sqlite") == []
+
+
+async def test_sqlite_fts_search(db):
+    manager = create_orm_manager(Article, search_backend=SqliteFtsSearch())
+
+    async with db.engine.begin() as conn:
+        await manager.create_search_index(conn, ["title", "body"])
+
+    async with db.session_factory() as session:
+        session.add_all([
+            Article(id=1, title="hello there", body="world"),
+            Article(id=2, title="world", body="hello"),
+        ])
+        await session.commit()
+
+        async def search(text: str, fields: list[str]) -> list[int]:
+            result = await manager.get_all(session, search=text, search_fields=fields, limit=-1, sort_by="id")
+            return [item.id for item in result.content]
+
+        assert await search("hel", ["title"]) == [1]
+        assert await search("hel", ["body"]) == [2]
+        assert await search("hel", ["title", "body"]) == [1, 2]
+        assert await search("hel wor", ["title"]) == []
+
+        article = await session.get(Article, 2)
+        assert article is not None
+        article.title = "hello again"
+        await session.commit()
+
+        assert await search("again", ["title"]) == [2]
@@ -0,0 +1,70 @@
+import asyncio
+
+from fastapi import HTTPException
+
+from orm_core import SingleFlight, create_orm_manager
+
+from .models import User, UserAdd, UserOut
+
+
+async def test_single_flight(db, statements):
+    single_flight = SingleFlight()
+    manager = create_orm_manager(User, UserAdd, UserAdd, UserOut, single_flight=single_flight)
+
+    async def get_by(**kwargs):
+        async with db.session_factory() as session:
+            return await manager.get_by(session=session, **kwargs)
+
+    async def get_all(**kwargs):
+        async with db.session_factory() as session:
+            return await manager.get_all(session=session, is_model=False, limit=5, **kwargs)
+
+    items = await asyncio.gather(*(get_by(id=1) for _ in range(5)))
+    assert all(item is items[0] for item in items)
+    assert len([statement for statement in statements if "FROM users" in statement]) == 1
+
+    errors = await asyncio.gather(*(get_by(id=999) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(error, HTTPException) and error.status_code == 404 for error in errors)
+
+    pages = await asyncio.gather(*(get_all() for _ in range(3)), get_all(page=2))
+    assert pages[0] is pages[2] and pages[3] is not pages[0]
+    assert pages[3].content[0].id == 6
+
+    items = await asyncio.gather(*(get_by(id=2, is_single_flight=False) for _ in range(2)))
+    assert items[0] is not items[1]
+
+    assert single_flight.stats["in_flight"] == 0
+    assert single_flight.stats["shared"] == 4 + 2 + 2
+
+
+async def test_single_flight_skips_uncommitted(db):
+    single_flight = SingleFlight()
+    manager = create_orm_manager(User, UserAdd, UserAdd, UserOut, single_flight=single_flight)
+
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def clean_read():
+        async with db.session_factory() as session:
+            started.set()
+            await release.wait()
+            return await manager.get_by(session=session, id=1)
+
+    async def uncommitted_read():
+        async with db.session_factory() as session:
+            user = await session.get(User, 1)
+            assert user is not None
+            user.name = "uncommitted"
+            await session.flush()
+
+            await started.wait()
+            release.set()
+            item = await manager.get_by(session=session, id=1)
+            await session.rollback()
+            return item
+
+    clean, uncommitted = await asyncio.gather(clean_read(), uncommitted_read())
+
+    assert uncommitted.name == "uncommitted"
+    assert clean.name == "user000"
+    assert single_flight.stats["shared"] == 0
@@ -0,0 +1,103 @@
+import asyncio
+import json
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from starlette.requests import ClientDisconnect
+
+from orm_core import create_orm_manager
+
+from .models import User, UserAdd, UserOut
+
+
+def _app(db) -> FastAPI:
+    app = FastAPI()
+    app.include_router(db.user.router)
+    return app
+
+
+async def test_stream_route_formats(db):
+    async with AsyncClient(transport=ASGITransport(_app(db)), base_url="http://test") as client:
+        response = await client.get("/user/all/stream", params={"sort_by": "id"})
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["name"] for row in rows] == [f"user{i:03d}" for i in range(25)]
+
+        response = await client.get("/user/all/stream", params={"format": "json", "fields": "id,name"})
+        rows = response.json()
+        assert len(rows) == 25
+        assert set(rows[0]) == {"id", "name"}
+
+        response = await client.get("/user/all/stream", params={"format": "json", "search": "nobody"})
+        assert response.json() == []
+
+
+async def _call_stream(db, receive, send, spec_version: str = "2.0") -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": spec_version},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/user/all/stream",
+        "raw_path": b"/user/all/stream",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "server": ("test", 80),
+        "client": ("test", 1),
+    }
+
+    try:
+        await _app(db)(scope, receive, send)
+    except ClientDisconnect:
+        pass
+
+
+async def test_stream_releases_session_on_early_disconnect(db):
+    disconnected = asyncio.Event()
+
+    async def receive():
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        # Клиент отключается, не дочитав тело: отправка тела больше не завершается
+        if message["type"] == "http.response.body":
+            disconnected.set()
+            await asyncio.Event().wait()
+
+    await _call_stream(db, receive, send)
+
+    assert db.engine.pool.checkedout() == 0
+
+
+async def test_stream_releases_session_on_send_error(db):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        raise OSError("connection reset")
+
+    await _call_stream(db, receive, send, spec_version="2.4")
+
+    assert db.engine.pool.checkedout() == 0
+
+
+async def test_stream_all(db):
+    manager = create_orm_manager(User, UserAdd, UserAdd, UserOut)
+
+    async with db.session_factory() as session:
+        # Чтение пачками меньше размера таблицы
+        users = [user async for user in db.user.stream_all(session=session, sort_by="id", chunk_size=4)]
+        assert [user.id for user in users] == list(range(1, 26))
+
+        ages = [user.age async for user in db.user.stream_all(session=session, chunk_size=4, age=3)]
+        assert ages == [3] * 5
+
+        items = [
+            item async for item in manager.stream_all(
+                session=session, sort_by="id", desc=1, chunk_size=7, is_model=False)
+        ]
+        assert len(items) == 25
+        assert isinstance(items[0], UserOut) and items[0].name == "user024" and items[0].group.name == "g1"
@@ -0,0 +1,102 @@
+from orm_core import create_orm_manager
+
+from .models import Tag, User, UserAdd, UserOut
+
+
+async def test_upsert_conflict(db):
+    manager = create_orm_manager(User, UserAdd, UserAdd, UserOut)
+
+    async with db.session_factory() as session:
+        loaded = await db.user.get_by(session=session, id=1)
+
+        user = await db.user.upsert(session=session, data={"id": 1, "name": "new", "age": 4})
+        assert user is loaded and user.name == "new" and user.age == 4
+
+        items = await manager.upsert_many(
+            session=session,
+            data=[
+                {"id": 2, "name": "two", "age": 3, "group_id": 1},
+                {"id": 50, "name": "fifty", "age": 2, "group_id": 1},
+                {"id": 3, "name": "three", "age": 4, "group_id": None},
+            ],
+            update_columns=["name"],
+            is_model=False,
+            chunk_size=2
+        )
+        assert [item.name for item in items] == ["two", "fifty", "three"]
+        # Поля вне update_columns у существующих строк не меняются
+        assert [item.age for item in items] == [1, 2, 2]
+        assert items[2].group is not None and items[2].group.name == "g1"
+
+        tags = await db.tag.upsert_many(session=session, data=[
+            {"code": "a", "lang": "en", "title": "Z"},
+            {"code": "b", "lang": "en", "title": "B"},
+        ])
+        assert [tag.title for tag in tags] == ["Z", "B"]
+
+        # Без обновляемых полей возвращается существующая строка
+        tag = await db.tag.upsert(session=session, data={"code": "a", "lang": "en", "title": "ignored"}, update_columns=[])
+        assert tag.title == "Z"
+
+        assert await db.tag.upsert(session=session, data={"code": "c", "lang": "en", "title": "C"}, is_return=False) is None
+        await session.commit()
+
+    async with db.session_factory() as session:
+        assert (await db.user.get_by(session=session, id=50)).name == "fifty"
+        assert (await session.get(Tag, ("c", "en"))).title == "C"
+
+
+async def test_upsert_many_mixed_keys(db):
+    async with db.session_factory() as session:
+        user = await session.get(User, 2)
+        assert user is not None
+        user.age = 9
+        await session.commit()
+
+    async with db.session_factory() as session:
+        users = await db.user.upsert_many(session=session, data=[
+            {"id": 2, "name": "n2"},
+            {"id": 3, "name": "n3", "age": 4},
+            {"id": 60, "name": "n60"},
+        ])
+        assert [user.id for user in users] == [2, 3, 60]
+        await session.commit()
+
+    async with db.session_factory() as session:
+        rows = {
+            user.id: (user.name, user.age)
+            for user in [await session.get(User, pk) for pk in (2, 3, 60)]
+            if user is not None
+        }
+
+    # Поле, которого нет в строке, не перезаписывается значением по умолчанию
+    assert rows == {2: ("n2", 9), 3: ("n3", 4), 60: ("n60", 0)}
+
+
+
+async def test_upsert_many_update_columns_per_shape(db):
+    async with db.session_factory() as session:
+        users = await db.user.upsert_many(
+            session=session,
+            data=[
+                {"id": 2, "name": "n2", "age": 4},
+                {"id": 3, "name": "n3", "score": 70},
+            ],
+            update_columns=["name", "score"]
+        )
+        assert [user.id for user in users] == [2, 3]
+
+        # Без общих с update_columns полей строка не меняется и возвращается как есть
+        user = await db.user.upsert(session=session, data={"id": 4, "name": "ignored"}, update_columns=["score"])
+        assert user.name == "user003"
+        await session.commit()
+
+    async with db.session_factory() as session:
+        rows = {
+            user.id: (user.name, user.age, user.score)
+            for user in [await session.get(User, pk) for pk in (2, 3, 4)]
+            if user is not None
+        }
+
+    # Каждая строка обновляет только свои поля из update_columns
+    assert rows == {2: ("n2", 1, 1), 3: ("n3", 2, 70), 4: ("user003", 3, 3)}
@@ -0,0 +1,38 @@
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from orm_core import create_orm_manager
+from orm_core.basic_operations.model_with_schemes.projection import get_list_adapter
+
+from .models import User, UserAdd, UserOut
+
+
+async def test_list_validation(db):
+    manager = create_orm_manager(User, UserAdd, UserAdd, UserOut)
+
+    async with db.session_factory() as session:
+        page = await manager.get_all(session, sort_by="id", limit=5, is_model=False)
+        assert [item.name for item in page.content] == [f"user{i:03d}" for i in range(5)]
+        assert all(isinstance(item, UserOut) and item.group.name == "g1" for item in page.content)
+
+        hits = get_list_adapter.cache_info().hits
+        items = await manager.get_all(session, sort_by="id", is_pagination=False, is_model=False)
+        assert len(items) == 25
+        # Адаптер списка строится один раз на схему
+        assert get_list_adapter.cache_info().hits == hits + 1
+
+
+async def test_list_routes_json(db):
+    app = FastAPI()
+    app.include_router(db.user.router)
+
+    async with AsyncClient(transport=ASGITransport(app), base_url="http://test") as client:
+        data = (await client.get("/user/all", params={"limit": 2, "sort_by": "id"})).json()
+        assert data["total_record"] == 25
+        assert [item["name"] for item in data["content"]] == ["user000", "user001"]
+        assert data["content"][0]["group"] == {"id": 1, "name": "g1"}
+
+        data = (await client.get("/user/all", params={"limit": 2, "sort_by": "id", "fields": "id"})).json()
+        assert data["content"] == [{"id": 1}, {"id": 2}]
+
+        assert (await client.get("/user/2")).json()["name"] == "user001"